@@ -19,15 +19,83 @@ class Settings:
     
     # Application settings
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", "10485760"))  # 10MB
+    MAX_REQUEST_SIZE: int = int(os.getenv("MAX_REQUEST_SIZE", "104857600"))  # 100MB per request body, 0 = unlimited
+    UPLOAD_SPOOL_THRESHOLD: int = int(os.getenv("UPLOAD_SPOOL_THRESHOLD", "1048576"))  # larger uploads stay in a spooled file
     ALLOWED_EXTENSIONS: set = {'.pdf', '.docx', '.txt'}
     
+    # Embedding cache settings
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_MAX_ITEMS: int = int(os.getenv("EMBEDDING_CACHE_MAX_ITEMS", "50000"))
+    EMBEDDING_CACHE_DIR: str = os.getenv("EMBEDDING_CACHE_DIR", "")  # empty = memory only
+    
     # Vector store settings
     VECTOR_DIMENSION: int = int(os.getenv("VECTOR_DIMENSION", "384"))
     SIMILARITY_THRESHOLD: float = float(os.getenv("SIMILARITY_THRESHOLD", "0.3"))
+    VECTOR_INDEX_TYPE: str = os.getenv("VECTOR_INDEX_TYPE", "auto")  # auto | flat | ivf_flat | hnsw | ivf_pq (persisted stores only)
+    VECTOR_INDEX_FLAT_MAX_ROWS: int = int(os.getenv("VECTOR_INDEX_FLAT_MAX_ROWS", "50000"))  # auto keeps exact search up to this many rows
+    VECTOR_INDEX_MEMORY_BUDGET_MB: int = int(os.getenv("VECTOR_INDEX_MEMORY_BUDGET_MB", "0"))  # auto picks an index that fits, 0 = unlimited
+    IVF_NPROBE: int = int(os.getenv("IVF_NPROBE", "16"))  # inverted lists scanned per query
+    IVF_PQ_M: int = int(os.getenv("IVF_PQ_M", "0"))  # bytes per PQ code, 0 = dimension / 8
+    HNSW_M: int = int(os.getenv("HNSW_M", "32"))  # graph neighbours per node
+    HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", "64"))  # candidate list size per query
+    VECTOR_FILTER_EXACT_MAX_ROWS: int = int(os.getenv("VECTOR_FILTER_EXACT_MAX_ROWS", "10000"))  # filtered searches matching fewer rows skip the approximate index
+    
+    # Talent pool settings (persistent index of resume chunks)
+    TALENT_POOL_DIR: str = os.getenv("TALENT_POOL_DIR", "")  # empty = disabled; set e.g. .cache/talent_pool to enable
+    TALENT_POOL_MMAP: bool = os.getenv("TALENT_POOL_MMAP", "true").lower() == "true"
+    TALENT_POOL_FLUSH_ROWS: int = int(os.getenv("TALENT_POOL_FLUSH_ROWS", "10000"))  # unflushed rows that trigger a new segment, 0 = manual
+    TALENT_POOL_CHUNKS_PER_REQUIREMENT: int = int(os.getenv("TALENT_POOL_CHUNKS_PER_REQUIREMENT", "200"))  # hits retrieved per requirement in reverse search
     
     # Text processing settings
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "500"))
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "50"))
+    CHUNKING_MODE: str = os.getenv("CHUNKING_MODE", "characters")  # characters | tokens (sized to the embedding model input)
+    CHUNK_TOKEN_OVERLAP: int = int(os.getenv("CHUNK_TOKEN_OVERLAP", "16"))
+    SKILL_TAXONOMY_PATH: str = os.getenv("SKILL_TAXONOMY_PATH", "")  # empty = bundled bestpractice/data/skills.txt
+    REGEX_ENGINE: str = os.getenv("REGEX_ENGINE", "re")  # re | re2 (linear time, needs the google-re2 package)
+    REGEX_TIME_BUDGET_SECONDS: float = float(os.getenv("REGEX_TIME_BUDGET_SECONDS", "2"))  # per document, 0 = unlimited
+    
+    # Batch evaluation settings
+    MAX_BATCH_SIZE: int = int(os.getenv("MAX_BATCH_SIZE", "200"))
+    BATCH_MAX_CONCURRENCY: int = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+    BULK_WORKERS: int = int(os.getenv("BULK_WORKERS", "0"))  # processes for bulk profile extraction, 0 = one per CPU
+    BULK_BATCH_SIZE: int = int(os.getenv("BULK_BATCH_SIZE", "64"))  # resumes per task sent to a bulk worker
+    
+    # HTTP client settings (shared by LlamaParse and Mistral calls)
+    HTTP_POOL_LIMIT: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "120"))
+    
+    # Parse routing: local_first extracts locally and only sends documents that fail the quality gate to LlamaParse
+    PARSE_MODE: str = os.getenv("PARSE_MODE", "remote_first")  # remote_first | local_first
+    LOCAL_PARSE_MIN_CHARS_PER_PAGE: int = int(os.getenv("LOCAL_PARSE_MIN_CHARS_PER_PAGE", "200"))
+    LOCAL_PARSE_MIN_PRINTABLE_RATIO: float = float(os.getenv("LOCAL_PARSE_MIN_PRINTABLE_RATIO", "0.95"))
+    LOCAL_PARSE_MIN_SECTION_HEADERS: int = int(os.getenv("LOCAL_PARSE_MIN_SECTION_HEADERS", "2"))
+    
+    # LlamaParse polling settings
+    PARSE_DEADLINE_SECONDS: float = float(os.getenv("PARSE_DEADLINE_SECONDS", "120"))  # per request: every document parsed for one request or batch shares this deadline
+    PARSE_POLL_INITIAL_DELAY: float = float(os.getenv("PARSE_POLL_INITIAL_DELAY", "0.25"))
+    PARSE_POLL_MAX_DELAY: float = float(os.getenv("PARSE_POLL_MAX_DELAY", "5"))
+    PARSE_POLL_MULTIPLIER: float = float(os.getenv("PARSE_POLL_MULTIPLIER", "2"))
+    PARSE_POLL_JITTER: float = float(os.getenv("PARSE_POLL_JITTER", "0.5"))
+    
+    # Parse cache settings
+    PARSE_CACHE_ENABLED: bool = os.getenv("PARSE_CACHE_ENABLED", "true").lower() == "true"
+    PARSE_CACHE_MEMORY_ITEMS: int = int(os.getenv("PARSE_CACHE_MEMORY_ITEMS", "256"))
+    PARSE_CACHE_DIR: str = os.getenv("PARSE_CACHE_DIR", ".cache/parsed_documents")  # empty = memory only
+    PARSE_CACHE_MAX_BYTES: int = int(os.getenv("PARSE_CACHE_MAX_BYTES", "536870912"))  # 512MB
+    PARSE_CACHE_TTL_SECONDS: float = float(os.getenv("PARSE_CACHE_TTL_SECONDS", "604800"))  # 7 days, 0 = no expiry
+    
+    # Executor settings (thread pool for blocking I/O and inference, process pool for CPU-bound text processing)
+    THREAD_POOL_WORKERS: int = int(os.getenv("THREAD_POOL_WORKERS", str(min(32, (os.cpu_count() or 1) + 4))))
+    PROCESS_POOL_WORKERS: int = int(os.getenv("PROCESS_POOL_WORKERS", "0"))  # 0 = run text processing in threads
+    
+    # Startup settings
+    WARM_UP_ON_STARTUP: bool = os.getenv("WARM_UP_ON_STARTUP", "true").lower() == "true"
+    PRELOAD_MODEL_ON_IMPORT: bool = os.getenv("PRELOAD_MODEL_ON_IMPORT", "false").lower() == "true"
     
     # Server settings
     HOST: str = os.getenv("HOST", "0.0.0.0")
@@ -47,6 +115,9 @@ def print_config():
     print(f"Embedding Model: {settings.EMBEDDING_MODEL}")
     print(f"Mistral Model: {settings.MISTRAL_MODEL}")
     print(f"Max File Size: {settings.MAX_FILE_SIZE} bytes")
+    print(f"Thread Pool Workers: {settings.THREAD_POOL_WORKERS}")
+    print(f"Process Pool Workers: {settings.PROCESS_POOL_WORKERS}")
+    print(f"Parse Mode: {settings.PARSE_MODE}")
     print(f"LlamaParser API Key: {'✓' if settings.LLAMA_PARSE_API_KEY else '✗'}")
     print(f"Mistral API Key: {'✓' if settings.MISTRAL_API_KEY else '✗'}")
     print("=" * 35)
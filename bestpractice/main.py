@@ -1,25 +1,64 @@
 
 import os
-import tempfile
+import time
+import uuid
+import asyncio
 import traceback
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import List, Optional
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-from bestpractice.models.schemas import CandidateEvaluationResponse
+from bestpractice.models.schemas import (
+    CandidateEvaluationResponse, BatchEvaluationResponse, BatchCandidateResult,
+    TalentPoolIndexResponse, TalentPoolIndexResult, TalentPoolSearchResponse, TalentPoolCandidate
+)
 from bestpractice.services.candidate_evaluator import CandidateEvaluator
 from bestpractice.config import settings
+from bestpractice.utils.execution import execution_pool
+from bestpractice.utils.regex_registry import regex_registry
+from bestpractice.services.parse_cache import parse_cache
+from bestpractice.services.http_client import http_client
+from bestpractice.services.talent_pool import talent_pool
+from bestpractice.utils.uploads import RequestSizeLimitMiddleware, UploadTooLarge, read_upload
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown"""
+    await http_client.start()
+    
+    # Segments are memory-mapped, so opening even a large pool is quick
+    await execution_pool.run_in_thread("talent_pool_open", talent_pool.open)
+    
+    # Warm up in the background so liveness checks answer while the model loads
+    warm_up_task = None
+    if settings.WARM_UP_ON_STARTUP:
+        warm_up_task = asyncio.create_task(candidate_evaluator.warm_up())
+    else:
+        candidate_evaluator.ready = True
+    
+    yield
+    
+    if warm_up_task is not None and not warm_up_task.done():
+        warm_up_task.cancel()
+    await http_client.close()
+    await execution_pool.run_in_thread("talent_pool_flush", talent_pool.flush)
+    execution_pool.shutdown()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Candidate Fit Evaluator",
     description="Evaluate how well a candidate's resume matches a job description using AI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Reject oversized request bodies while they stream in (added first so CORS headers still apply)
+app.add_middleware(RequestSizeLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +74,12 @@ app.mount("/static", StaticFiles(directory="bestpractice/static"), name="static"
 # Initialize the candidate evaluator
 candidate_evaluator = CandidateEvaluator()
 
+# Load model weights at import time so a pre-forking server (e.g. gunicorn --preload)
+# shares them copy-on-write across workers
+if settings.PRELOAD_MODEL_ON_IMPORT:
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    candidate_evaluator.embedding_service.preload_model()
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main HTML page"""
@@ -80,29 +125,23 @@ async def evaluate_candidate(
             detail="Job description file must be PDF, DOCX, or TXT format"
         )
     
-    # Create temporary files
-    resume_temp = None
-    job_temp = None
+    # One parse deadline for everything this request parses
+    deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+    
+    # Read uploads in chunks; they go to the parser without a temporary file
+    try:
+        resume_upload = await read_upload(resume_file)
+        job_upload = await read_upload(job_description_file)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     
     try:
-        # Save uploaded files temporarily
-        resume_temp = tempfile.NamedTemporaryFile(delete=False, suffix=resume_ext)
-        job_temp = tempfile.NamedTemporaryFile(delete=False, suffix=job_ext)
-        
-        # Write file contents
-        resume_content = await resume_file.read()
-        job_content = await job_description_file.read()
-        
-        resume_temp.write(resume_content)
-        job_temp.write(job_content)
-        resume_temp.close()
-        job_temp.close()
-        
         # Evaluate candidate
         evaluation = await candidate_evaluator.evaluate_candidate(
-            resume_path=resume_temp.name,
-            job_description_path=job_temp.name,
-            candidate_name=candidate_name
+            resume_path=resume_upload,
+            job_description_path=job_upload,
+            candidate_name=candidate_name,
+            deadline=deadline
         )
         
         return evaluation
@@ -114,18 +153,268 @@ async def evaluate_candidate(
             status_code=500,
             detail=f"Error processing files: {str(e)}"
         )
+
+@app.post("/evaluate-candidates", response_model=BatchEvaluationResponse)
+async def evaluate_candidates(
+    resume_files: List[UploadFile] = File(..., description="Resume files (PDF or DOCX)"),
+    job_description_file: UploadFile = File(..., description="Job description file (PDF, DOCX, or TXT)"),
+    candidate_names: Optional[List[str]] = Form(None, description="Candidate names (optional, same order as resume_files)")
+):
+    """
+    Evaluate many resumes against a single job description
+    
+    The job description is parsed and analysed once and shared across all resumes,
+    which are evaluated concurrently.
+    
+    Args:
+        resume_files: PDF or DOCX files containing the candidates' resumes
+        job_description_file: PDF, DOCX, or TXT file containing the job description
+        candidate_names: Optional candidate names aligned with resume_files
+        
+    Returns:
+        BatchEvaluationResponse: Evaluations ranked by fit percentage
+    """
+    
+    def get_file_extension(filename: str) -> str:
+        return os.path.splitext(filename.lower())[1]
+    
+    if len(resume_files) > settings.MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.MAX_BATCH_SIZE} resumes can be evaluated per batch"
+        )
+    
+    for resume_file in resume_files:
+        if get_file_extension(resume_file.filename) not in {'.pdf', '.docx'}:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Resume file {resume_file.filename} must be PDF or DOCX format"
+            )
+    
+    job_ext = get_file_extension(job_description_file.filename)
+    if job_ext not in settings.ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="Job description file must be PDF, DOCX, or TXT format"
+        )
+    
+    # One parse deadline for the whole batch, so it can't take a deadline per resume
+    deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+    
+    # Read uploads in chunks; they go to the parser without temporary files
+    try:
+        job_upload = await read_upload(job_description_file)
+        resume_uploads = [await read_upload(resume_file) for resume_file in resume_files]
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    try:
+        # Evaluate candidates
+        batch = await candidate_evaluator.evaluate_candidates_batch(
+            resume_paths=resume_uploads,
+            job_description_path=job_upload,
+            candidate_names=candidate_names,
+            deadline=deadline
+        )
+        
+        results = []
+        rank = 0
+        for result in batch['results']:
+            index = result['index']
+            evaluation = result['evaluation']
+            if evaluation is not None:
+                rank += 1
+            results.append(BatchCandidateResult(
+                rank=rank if evaluation is not None else None,
+                filename=resume_files[index].filename,
+                candidate_name=candidate_names[index] if candidate_names and index < len(candidate_names) else None,
+                fit_percentage=evaluation.fit_percentage if evaluation is not None else None,
+                evaluation=evaluation,
+                error=result['error']
+            ))
+        
+        return BatchEvaluationResponse(
+            total_candidates=len(resume_files),
+            successful_evaluations=rank,
+            job_requirements=batch['job_requirements'],
+            job_stage_timings=batch['job_stage_timings'],
+            results=results
+        )
+        
+    except Exception as e:
+        print(f"Error during batch evaluation: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing files: {str(e)}"
+        )
+
+@app.post("/talent-pool/resumes", response_model=TalentPoolIndexResponse)
+async def index_resumes(
+    resume_files: List[UploadFile] = File(..., description="Resume files (PDF or DOCX)"),
+    candidate_ids: Optional[List[str]] = Form(None, description="Candidate ids (optional, same order as resume_files; generated if missing)")
+):
+    """
+    Add resumes to the persistent talent pool for reverse search
+    
+    Args:
+        resume_files: PDF or DOCX files containing the candidates' resumes
+        candidate_ids: Optional ids aligned with resume_files
+        
+    Returns:
+        TalentPoolIndexResponse: Per-resume chunk counts and pool statistics
+    """
+    
+    def get_file_extension(filename: str) -> str:
+        return os.path.splitext(filename.lower())[1]
+    
+    if not talent_pool.enabled:
+        raise HTTPException(status_code=503, detail="Talent pool is disabled (TALENT_POOL_DIR is empty)")
+    
+    if len(resume_files) > settings.MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.MAX_BATCH_SIZE} resumes can be indexed per request"
+        )
+    
+    for resume_file in resume_files:
+        if get_file_extension(resume_file.filename) not in {'.pdf', '.docx'}:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Resume file {resume_file.filename} must be PDF or DOCX format"
+            )
+    
+    # One parse deadline for the whole batch, so it can't take a deadline per resume
+    deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+    
+    try:
+        resume_uploads = [await read_upload(resume_file) for resume_file in resume_files]
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    candidate_ids = list(candidate_ids or [])
+    candidate_ids += [uuid.uuid4().hex for _ in range(len(resume_files) - len(candidate_ids))]
+    
+    try:
+        results = await candidate_evaluator.index_resumes(
+            resume_paths=resume_uploads,
+            candidate_ids=candidate_ids,
+            filenames=[resume_file.filename for resume_file in resume_files],
+            deadline=deadline
+        )
+        
+        return TalentPoolIndexResponse(
+            indexed=sum(1 for result in results if result['error'] is None),
+            results=[
+                TalentPoolIndexResult(filename=resume_file.filename, **result)
+                for resume_file, result in zip(resume_files, results)
+            ],
+            pool=talent_pool.get_stats()
+        )
+        
+    except Exception as e:
+        print(f"Error during talent pool indexing: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing files: {str(e)}"
+        )
+
+@app.post("/talent-pool/search", response_model=TalentPoolSearchResponse)
+async def search_talent_pool(
+    job_description_file: UploadFile = File(..., description="Job description file (PDF, DOCX, or TXT)"),
+    top_k: int = Form(10, ge=1, le=1000, description="Number of candidates to return"),
+    aggregation: str = Form('max', description="Per-requirement chunk aggregation: 'max' or 'mean_top_k'")
+):
+    """
+    Rank previously indexed resumes against a job description
+    
+    Only embeddings are compared, so thousands of applicants can be pre-screened
+    before any per-candidate LLM evaluation.
+    
+    Args:
+        job_description_file: PDF, DOCX, or TXT file containing the job description
+        top_k: Number of candidates to return
+        aggregation: 'max' (best chunk per requirement) or 'mean_top_k'
+        
+    Returns:
+        TalentPoolSearchResponse: Top candidates with per-requirement scores
+    """
+    
+    def get_file_extension(filename: str) -> str:
+        return os.path.splitext(filename.lower())[1]
+    
+    if not talent_pool.enabled:
+        raise HTTPException(status_code=503, detail="Talent pool is disabled (TALENT_POOL_DIR is empty)")
+    
+    if get_file_extension(job_description_file.filename) not in settings.ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="Job description file must be PDF, DOCX, or TXT format"
+        )
+    
+    if aggregation not in {'max', 'mean_top_k'}:
+        raise HTTPException(status_code=400, detail="aggregation must be 'max' or 'mean_top_k'")
+    
+    deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
     
-    finally:
-        # Clean up temporary files
-        if resume_temp and os.path.exists(resume_temp.name):
-            os.unlink(resume_temp.name)
-        if job_temp and os.path.exists(job_temp.name):
-            os.unlink(job_temp.name)
+    try:
+        job_upload = await read_upload(job_description_file)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    try:
+        search = await candidate_evaluator.search_talent_pool(job_upload, top_k=top_k, aggregation=aggregation, deadline=deadline)
+        
+        return TalentPoolSearchResponse(
+            job_requirements=search['job_requirements'],
+            job_stage_timings=search['job_stage_timings'],
+            search_seconds=search['search_seconds'],
+            candidates=[
+                TalentPoolCandidate(rank=rank, **candidate)
+                for rank, candidate in enumerate(search['candidates'], start=1)
+            ]
+        )
+        
+    except Exception as e:
+        print(f"Error during talent pool search: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing files: {str(e)}"
+        )
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "message": "AI Candidate Fit Evaluator is running"}
+    """Liveness check; also reports whether warm-up has finished"""
+    return {
+        "status": "healthy",
+        "message": "AI Candidate Fit Evaluator is running",
+        "ready": candidate_evaluator.ready
+    }
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness check: 503 until the model is loaded and warmed up"""
+    if not candidate_evaluator.ready:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "starting", "ready": False}
+        )
+    return {"status": "ready", "ready": True}
+
+@app.get("/metrics")
+async def metrics():
+    """Pipeline execution metrics"""
+    return {
+        "executor": execution_pool.get_stats(),
+        "parse_cache": parse_cache.get_stats(),
+        "http_client": http_client.get_stats(),
+        "document_parser": candidate_evaluator.document_parser.get_stats(),
+        "embedding_service": candidate_evaluator.embedding_service.get_stats(),
+        "talent_pool": talent_pool.get_stats(),
+        "regex": regex_registry.get_stats(limit=20)
+    }
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -0,0 +1,133 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from bestpractice.utils.regex_registry import regex_registry
+from bestpractice.utils.segmentation import clean_text, lower_text_with_offsets, segment_sections, RESUME_SECTION_HEADERS, JOB_SECTION_HEADERS
+
+_WORD = regex_registry.compile('document.word', r'\S+')
+
+# Memoized views, in the order they are derived
+_VIEWS = ('_cleaned_text', '_lower_text', '_section_spans', '_word_offsets')
+
+SECTION_HEADERS = {
+    'resume': RESUME_SECTION_HEADERS,
+    'job_description': JOB_SECTION_HEADERS
+}
+
+
+class ParsedDocument:
+    """
+    Text extracted from one document, with derived views computed lazily
+
+    Cleaned text, its lowercase form, section spans and word offsets are each
+    computed at most once, on first use, and shared by every pipeline stage
+    that receives the document. Access is thread-safe so concurrent stages
+    can use the same instance.
+    """
+
+    def __init__(self, text: str, kind: str = 'resume', metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            text: Raw extracted text
+            kind: 'resume' or 'job_description'; selects the section headers
+            metadata: Parser metadata (source, pages, cache tier, ...)
+        """
+        if kind not in SECTION_HEADERS:
+            raise ValueError(f"Unknown document kind: {kind}")
+        self.text = text
+        self.kind = kind
+        self.metadata = metadata or {}
+        self._lock = threading.Lock()
+        self._cleaned_text: Optional[str] = None
+        self._lower_text: Optional[str] = None
+        self._section_spans: Optional[List[Tuple[str, int, int]]] = None
+        self._word_offsets: Optional[List[Tuple[int, int]]] = None
+
+    @classmethod
+    def from_parse_result(cls, result: Dict[str, Any], kind: str = 'resume') -> "ParsedDocument":
+        """Wrap a DocumentParser.parse_document result"""
+        return cls(result.get('text', ''), kind, result.get('metadata', {}))
+
+    def __getstate__(self):
+        # Locks can't be pickled (process pool); anything already computed travels along
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def computed_views(self) -> Dict[str, Any]:
+        """Views computed so far, keyed by attribute, for handing back from a worker process"""
+        return {name: getattr(self, name) for name in _VIEWS if getattr(self, name) is not None}
+
+    def adopt_views(self, views: Dict[str, Any]):
+        """Take views computed on a copy of this document (e.g. in a worker process), keeping any already set"""
+        with self._lock:
+            for name, value in views.items():
+                if name in _VIEWS and getattr(self, name) is None:
+                    setattr(self, name, value)
+
+    @property
+    def cleaned_text(self) -> str:
+        """Whitespace-collapsed text without disallowed characters; all offsets refer to this"""
+        if self._cleaned_text is None:
+            with self._lock:
+                if self._cleaned_text is None:
+                    self._cleaned_text = clean_text(self.text)
+        return self._cleaned_text
+
+    @property
+    def lower_text(self) -> str:
+        """cleaned_text lowercased character by character, so offsets into cleaned_text apply to it"""
+        if self._lower_text is None:
+            cleaned_text = self.cleaned_text
+            with self._lock:
+                if self._lower_text is None:
+                    self._lower_text = lower_text_with_offsets(cleaned_text)
+        return self._lower_text
+
+    @property
+    def section_spans(self) -> List[Tuple[str, int, int]]:
+        """Ordered (section, start, end) spans of cleaned_text"""
+        if self._section_spans is None:
+            cleaned_text, lower_text = self.cleaned_text, self.lower_text
+            with self._lock:
+                if self._section_spans is None:
+                    self._section_spans = segment_sections(cleaned_text, SECTION_HEADERS[self.kind], lower_text=lower_text)
+        return self._section_spans
+
+    @property
+    def word_offsets(self) -> List[Tuple[int, int]]:
+        """(start, end) of every whitespace-separated word in cleaned_text"""
+        if self._word_offsets is None:
+            cleaned_text = self.cleaned_text
+            with self._lock:
+                if self._word_offsets is None:
+                    self._word_offsets = [match.span() for match in _WORD.finditer(cleaned_text)]
+        return self._word_offsets
+
+    @property
+    def word_count(self) -> int:
+        return len(self.word_offsets)
+
+    def section_text(self, section_name: str, lower: bool = False) -> str:
+        """
+        Text of a section
+
+        Args:
+            section_name: Section key, e.g. 'skills'
+            lower: Slice the lowercase view instead of cleaned_text
+
+        Returns:
+            Section text, empty if the document has no such section
+        """
+        for section, start, end in self.section_spans:
+            if section == section_name:
+                return (self.lower_text if lower else self.cleaned_text)[start:end]
+        return ""
+
+    def sections(self) -> Dict[str, str]:
+        """Section texts, stripped, in document order"""
+        cleaned_text = self.cleaned_text
+        return {section: cleaned_text[start:end].strip() for section, start, end in self.section_spans}
@@ -28,6 +28,53 @@ class CandidateEvaluationResponse(BaseModel):
     strengths: List[str] = Field(default_factory=list, description="Candidate's key strengths")
     areas_for_improvement: List[str] = Field(default_factory=list, description="Areas where candidate could improve")
     recommendations: List[str] = Field(default_factory=list, description="Recommendations for hiring decision")
+    stage_timings: Dict[str, float] = Field(default_factory=dict, description="Wall-clock seconds per pipeline stage")
+    chunking_stats: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="Chunk count, padding ratio and truncation rate per document")
+
+class BatchCandidateResult(BaseModel):
+    """Evaluation result for one resume within a batch"""
+    rank: Optional[int] = Field(None, description="Rank by fit percentage (1 = best), None if evaluation failed")
+    filename: str = Field(..., description="Uploaded resume filename")
+    candidate_name: Optional[str] = Field(None, description="Candidate name if provided")
+    fit_percentage: Optional[float] = Field(None, description="Numerical fit score (0-100)")
+    evaluation: Optional[CandidateEvaluationResponse] = Field(None, description="Full evaluation if successful")
+    error: Optional[str] = Field(None, description="Error message if evaluation failed")
+
+class BatchEvaluationResponse(BaseModel):
+    """Ranked evaluation of many resumes against one job description"""
+    total_candidates: int = Field(..., description="Number of resumes submitted")
+    successful_evaluations: int = Field(..., description="Number of resumes evaluated successfully")
+    job_requirements: List[str] = Field(default_factory=list, description="Requirements extracted from the job description")
+    job_stage_timings: Dict[str, float] = Field(default_factory=dict, description="Wall-clock seconds per job description stage")
+    results: List[BatchCandidateResult] = Field(default_factory=list, description="Per-resume results ranked by fit")
+
+class TalentPoolIndexResult(BaseModel):
+    """Indexing result for one resume"""
+    candidate_id: str = Field(..., description="Identifier returned by talent pool searches")
+    filename: str = Field(..., description="Uploaded resume filename")
+    chunks: int = Field(0, description="Number of chunks added to the pool")
+    error: Optional[str] = Field(None, description="Error message if indexing failed")
+
+class TalentPoolIndexResponse(BaseModel):
+    """Resumes added to the talent pool"""
+    indexed: int = Field(..., description="Number of resumes indexed successfully")
+    results: List[TalentPoolIndexResult] = Field(default_factory=list, description="Per-resume results in upload order")
+    pool: Dict[str, Any] = Field(default_factory=dict, description="Talent pool statistics after indexing")
+
+class TalentPoolCandidate(BaseModel):
+    """One candidate retrieved from the talent pool"""
+    rank: int = Field(..., description="Rank by score (1 = best)")
+    candidate_id: str = Field(..., description="Identifier given when the resume was indexed")
+    score: float = Field(..., description="Mean per-requirement similarity (0-1)")
+    coverage: float = Field(..., description="Share of requirements matched above the similarity threshold")
+    requirement_scores: List[float] = Field(default_factory=list, description="Similarity per job requirement, aligned with job_requirements")
+
+class TalentPoolSearchResponse(BaseModel):
+    """Candidates from the talent pool ranked against a job description"""
+    job_requirements: List[str] = Field(default_factory=list, description="Requirements extracted from the job description")
+    job_stage_timings: Dict[str, float] = Field(default_factory=dict, description="Wall-clock seconds per job description stage")
+    search_seconds: float = Field(0.0, description="Wall-clock seconds spent searching and ranking the pool")
+    candidates: List[TalentPoolCandidate] = Field(default_factory=list, description="Top candidates ranked by score")
 
 class ErrorResponse(BaseModel):
     """Error response model"""
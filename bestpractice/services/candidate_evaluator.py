@@ -1,12 +1,22 @@
 
 import asyncio
+import time
 from typing import Dict, Any, List, Optional
+import numpy as np
+from bestpractice.config import settings
+from bestpractice.models.document import ParsedDocument
 from bestpractice.models.schemas import CandidateEvaluationResponse, CandidateProfile, ComparisonItem
-from bestpractice.services.document_parser import DocumentParser
+from bestpractice.services.document_parser import DocumentParser, DocumentSource
 from bestpractice.services.embedding_service import EmbeddingService
 from bestpractice.services.vector_store import VectorStore
 from bestpractice.services.llm_evaluator import LLMEvaluator
+from bestpractice.services.talent_pool import talent_pool
 from bestpractice.utils.text_processing import TextProcessor
+from bestpractice.utils.chunking import ChunkTokenizer
+from bestpractice.utils.pipeline import StageGraph
+from bestpractice.utils.skill_taxonomy import skill_taxonomy
+from bestpractice.utils.execution import execution_pool
+from bestpractice.utils.uploads import UploadedDocument
 
 class CandidateEvaluator:
     """Main service for evaluating candidate-job fit"""
@@ -16,157 +26,509 @@ class CandidateEvaluator:
         self.embedding_service = EmbeddingService()
         self.llm_evaluator = LLMEvaluator()
         self.text_processor = TextProcessor()
+        self.ready = False
+    
+    async def warm_up(self):
+        """Import heavy dependencies and load the embedding model ahead of the first request"""
         
-        # Initialize vector store
-        self.vector_store = VectorStore(
-            dimension=self.embedding_service.get_embedding_dimension()
-        )
+        print("Warming up candidate evaluator...")
+        try:
+            await execution_pool.run_in_thread("preload_extractors", self.document_parser.preload_extractors)
+            await execution_pool.run_in_thread("compile_skill_taxonomy", skill_taxonomy.compile)
+            await self.embedding_service.warm_up()
+        except Exception as e:
+            print(f"Warm-up failed: {str(e)}")
+            return
+        
+        self.ready = True
+        print("Candidate evaluator is ready")
     
     async def evaluate_candidate(
         self,
-        resume_path: str,
-        job_description_path: str,
-        candidate_name: Optional[str] = None
+        resume_path: DocumentSource,
+        job_description_path: DocumentSource,
+        candidate_name: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> CandidateEvaluationResponse:
         """
         Evaluate candidate fit for job position
         
+        The resume branch (parse -> chunk/profile -> embed) and the job
+        description branch (parse -> requirements/chunks -> embed) run
+        concurrently; matching and LLM evaluation start once both are ready.
+        
         Args:
-            resume_path: Path to resume file
-            job_description_path: Path to job description file
+            resume_path: Path to resume file, or the uploaded file
+            job_description_path: Path to job description file, or the uploaded file
             candidate_name: Optional candidate name
+            deadline: Absolute time.monotonic() by which both documents must be parsed;
+                defaults to now + PARSE_DEADLINE_SECONDS
             
         Returns:
             Complete candidate evaluation response
         """
         
+        if deadline is None:
+            deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+        
         try:
-            # Step 1: Parse documents
-            print("Parsing documents...")
-            resume_data = await self.document_parser.parse_document(
-                resume_path, 
-                "resume.pdf"
-            )
-            job_data = await self.document_parser.parse_document(
-                job_description_path, 
-                "job_description.pdf"
-            )
+            graph = StageGraph()
+            self._add_job_stages(graph, job_description_path, deadline)
+            self._add_resume_stages(graph, resume_path, candidate_name, deadline)
+            results = await graph.run()
             
-            resume_text = resume_data.get('text', '')
-            job_description_text = job_data.get('text', '')
+            response = results['response']
+            response.stage_timings = dict(graph.timings)
+            response.chunking_stats = self._chunking_stats(results)
             
-            if not resume_text or not job_description_text:
-                print(f"Resume text length: {len(resume_text) if resume_text else 0}")
-                print(f"Job description text length: {len(job_description_text) if job_description_text else 0}")
-                print(f"Resume data: {resume_data}")
-                print(f"Job data: {job_data}")
-                raise ValueError("Failed to extract text from documents")
+            print(f"Evaluation completed successfully in {graph.timings['total']:.2f}s")
+            return response
             
-            # Step 2: Process and chunk documents
-            print("Processing and chunking documents...")
-            resume_chunks = await self.text_processor.chunk_resume(resume_text)
-            job_chunks = await self.text_processor.chunk_job_description(job_description_text)
+        except Exception as e:
+            print(f"Error in candidate evaluation: {str(e)}")
+            raise
+    
+    async def evaluate_candidates_batch(
+        self,
+        resume_paths: List[DocumentSource],
+        job_description_path: DocumentSource,
+        candidate_names: Optional[List[Optional[str]]] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate many resumes against a single job description
+        
+        The job description is parsed, its requirements extracted and its
+        chunks and requirements embedded once; resumes are then evaluated
+        concurrently against that shared context.
+        
+        Args:
+            resume_paths: Paths to resume files, or the uploaded files
+            job_description_path: Path to job description file, or the uploaded file
+            candidate_names: Optional candidate names, aligned with resume_paths
+            max_concurrency: Maximum number of resumes evaluated at once
+            deadline: Absolute time.monotonic() by which every document in the batch must be
+                parsed; defaults to now + PARSE_DEADLINE_SECONDS
             
-            # Step 3: Extract candidate profile
-            print("Extracting candidate profile...")
-            candidate_profile = await self.text_processor.extract_candidate_profile(resume_text)
+        Returns:
+            Dict with the job requirements, job stage timings and per-resume results ranked by fit
+        """
+        
+        candidate_names = candidate_names or []
+        max_concurrency = max_concurrency or settings.BATCH_MAX_CONCURRENCY
+        if deadline is None:
+            deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+        
+        job_context = await self.prepare_job_description(job_description_path, deadline)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def evaluate_one(index: int, resume_path: DocumentSource) -> Dict[str, Any]:
+            candidate_name = candidate_names[index] if index < len(candidate_names) else None
+            async with semaphore:
+                try:
+                    evaluation = await self._evaluate_against_job(resume_path, job_context, candidate_name, deadline)
+                    return {'index': index, 'evaluation': evaluation, 'error': None}
+                except Exception as e:
+                    print(f"Error evaluating resume {index}: {str(e)}")
+                    return {'index': index, 'evaluation': None, 'error': str(e)}
+        
+        results = await asyncio.gather(*[
+            evaluate_one(index, resume_path)
+            for index, resume_path in enumerate(resume_paths)
+        ])
+        
+        # Rank successful evaluations by fit, failures last in submission order
+        results.sort(key=lambda r: (
+            r['evaluation'] is None,
+            -(r['evaluation'].fit_percentage if r['evaluation'] is not None else 0.0),
+            r['index']
+        ))
+        
+        return {
+            'job_requirements': job_context['requirements'],
+            'job_stage_timings': job_context['stage_timings'],
+            'results': results
+        }
+    
+    async def prepare_job_description(self, job_description_path: DocumentSource, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Parse a job description and precompute everything resumes are compared against
+        
+        Args:
+            job_description_path: Path to job description file, or the uploaded file
+            deadline: See DocumentParser.parse_document
             
-            # Step 4: Extract job requirements
-            print("Extracting job requirements...")
-            job_requirements = await self.llm_evaluator.extract_job_requirements(job_description_text)
+        Returns:
+            Dict with the job text and ParsedDocument, chunks, chunk embeddings, requirements,
+            requirement embeddings and stage timings
+        """
+        
+        graph = StageGraph()
+        self._add_job_stages(graph, job_description_path, deadline)
+        results = await graph.run()
+        
+        job_context = results['job_context']
+        job_context['stage_timings'] = dict(graph.timings)
+        return job_context
+    
+    async def index_resume(
+        self,
+        resume_path: DocumentSource,
+        candidate_id: str,
+        filename: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse, chunk and embed a resume and append it to the talent pool
+        
+        Args:
+            resume_path: Path to resume file, or the uploaded file
+            candidate_id: Identifier returned by talent pool searches
+            filename: Original filename, stored with the chunks
+            deadline: See DocumentParser.parse_document
             
-            # Step 5: Generate embeddings and build vector store
-            print("Generating embeddings...")
-            await self._build_vector_store(resume_chunks, job_chunks)
+        Returns:
+            Dict with the candidate id and number of indexed chunks
+        """
+        
+        document = await self._parse_document(resume_path, filename or "resume.pdf", 'resume', "resume", deadline)
+        chunks = await self.text_processor.chunk_resume(document, await self._get_chunk_tokenizer())
+        embeddings = await self._embed_texts(chunks)
+        if embeddings is not None:
+            await execution_pool.run_in_thread(
+                "talent_pool_add",
+                talent_pool.add_resume,
+                candidate_id,
+                chunks,
+                embeddings,
+                {'filename': filename} if filename else None
+            )
+        return {'candidate_id': candidate_id, 'chunks': len(chunks)}
+    
+    async def index_resumes(
+        self,
+        resume_paths: List[DocumentSource],
+        candidate_ids: List[str],
+        filenames: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Index many resumes concurrently, then persist them as one talent pool segment
+        
+        Args:
+            resume_paths: Paths to resume files, or the uploaded files
+            candidate_ids: Candidate ids aligned with resume_paths
+            filenames: Original filenames aligned with resume_paths
+            max_concurrency: Maximum number of resumes processed at once
+            deadline: Absolute time.monotonic() by which every resume must be parsed;
+                defaults to now + PARSE_DEADLINE_SECONDS
             
-            # Step 6: Find relevant resume chunks for each requirement
-            print("Finding relevant resume sections...")
-            relevant_chunks = await self._find_relevant_chunks(job_requirements)
+        Returns:
+            Per-resume dicts with candidate_id, chunks and error, in input order
+        """
+        
+        filenames = filenames or []
+        if deadline is None:
+            deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.BATCH_MAX_CONCURRENCY))
+        
+        async def index_one(index: int, resume_path: DocumentSource) -> Dict[str, Any]:
+            filename = filenames[index] if index < len(filenames) else None
+            async with semaphore:
+                try:
+                    result = await self.index_resume(resume_path, candidate_ids[index], filename, deadline)
+                    return {**result, 'error': None}
+                except Exception as e:
+                    print(f"Error indexing resume {index}: {str(e)}")
+                    return {'candidate_id': candidate_ids[index], 'chunks': 0, 'error': str(e)}
+        
+        results = await asyncio.gather(*[
+            index_one(index, resume_path)
+            for index, resume_path in enumerate(resume_paths)
+        ])
+        await execution_pool.run_in_thread("talent_pool_flush", talent_pool.flush)
+        return results
+    
+    async def search_talent_pool(
+        self,
+        job_description_path: DocumentSource,
+        top_k: int = 10,
+        aggregation: str = 'max',
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Rank indexed candidates against a job description without any per-candidate LLM calls
+        
+        Args:
+            job_description_path: Path to job description file, or the uploaded file
+            top_k: Candidates to return
+            aggregation: How chunk hits are reduced per requirement ('max' or 'mean_top_k')
+            deadline: See DocumentParser.parse_document
             
-            # Step 7: Evaluate candidate using LLM
-            print("Evaluating candidate fit...")
-            evaluation = await self.llm_evaluator.evaluate_candidate_fit(
-                candidate_profile,
-                job_requirements,
-                relevant_chunks,
-                job_description_text
+        Returns:
+            Dict with the job requirements, job stage timings, search time and ranked candidates
+        """
+        
+        job_context = await self.prepare_job_description(job_description_path, deadline)
+        candidates = []
+        search_seconds = 0.0
+        
+        requirement_embeddings = job_context['requirement_embeddings']
+        if requirement_embeddings is not None and len(requirement_embeddings) > 0:
+            started = time.perf_counter()
+            candidates = await execution_pool.run_in_thread(
+                "talent_pool_search",
+                talent_pool.search_candidates,
+                requirement_embeddings,
+                top_k,
+                aggregation=aggregation
             )
-            
-            # Step 8: Build response
-            response = await self._build_response(
-                evaluation,
+            search_seconds = time.perf_counter() - started
+        
+        return {
+            'job_requirements': job_context['requirements'],
+            'job_stage_timings': job_context['stage_timings'],
+            'search_seconds': search_seconds,
+            'candidates': candidates
+        }
+    
+    async def _evaluate_against_job(
+        self,
+        resume_path: DocumentSource,
+        job_context: Dict[str, Any],
+        candidate_name: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> CandidateEvaluationResponse:
+        """Evaluate a single resume against a prepared job description context"""
+        
+        graph = StageGraph()
+        graph.add_stage('job_context', self._constant(job_context))
+        self._add_resume_stages(graph, resume_path, candidate_name, deadline)
+        results = await graph.run()
+        
+        response = results['response']
+        response.stage_timings = dict(graph.timings)
+        response.chunking_stats = self._chunking_stats(results)
+        
+        print(f"Evaluation completed successfully in {graph.timings['total']:.2f}s")
+        return response
+    
+    def _add_job_stages(self, graph: StageGraph, job_description_path: DocumentSource, deadline: Optional[float] = None):
+        """Job description branch: parse -> (requirements, chunk -> embed) -> job_context"""
+        
+        async def parse_job() -> ParsedDocument:
+            return await self._parse_document(job_description_path, "job_description.pdf", 'job_description', "job description", deadline)
+        
+        async def chunk_job(job_document):
+            return await self.text_processor.chunk_job_description(job_document, await self._get_chunk_tokenizer())
+        
+        async def extract_requirements(job_document):
+            return await self.llm_evaluator.extract_job_requirements(job_document.text)
+        
+        async def build_job_context(job_document, job_chunks, job_chunk_embeddings, job_chunking_stats, job_requirements, requirement_embeddings):
+            return {
+                'text': job_document.text,
+                'document': job_document,
+                'chunks': job_chunks,
+                'chunk_embeddings': job_chunk_embeddings,
+                'chunking_stats': job_chunking_stats,
+                'requirements': job_requirements,
+                'requirement_embeddings': requirement_embeddings
+            }
+        
+        graph.add_stage('parse_job', parse_job)
+        graph.add_stage('chunk_job', chunk_job, ['parse_job'])
+        graph.add_stage('extract_requirements', extract_requirements, ['parse_job'])
+        graph.add_stage('embed_job', self._embed_texts, ['chunk_job'])
+        graph.add_stage('measure_job_chunks', self._measure_chunks, ['chunk_job'])
+        graph.add_stage('embed_requirements', self._embed_texts, ['extract_requirements'])
+        graph.add_stage(
+            'job_context',
+            build_job_context,
+            ['parse_job', 'chunk_job', 'embed_job', 'measure_job_chunks', 'extract_requirements', 'embed_requirements']
+        )
+    
+    def _add_resume_stages(
+        self,
+        graph: StageGraph,
+        resume_path: DocumentSource,
+        candidate_name: Optional[str],
+        deadline: Optional[float] = None
+    ):
+        """Resume branch: parse -> (profile, chunk -> embed), then matching against 'job_context'"""
+        
+        async def parse_resume() -> ParsedDocument:
+            return await self._parse_document(resume_path, "resume.pdf", 'resume', "resume", deadline)
+        
+        async def chunk_resume(resume_document):
+            return await self.text_processor.chunk_resume(resume_document, await self._get_chunk_tokenizer())
+        
+        async def find_relevant(resume_chunks, resume_embeddings, job_context):
+            vector_store = self._build_vector_store(
+                resume_chunks,
+                resume_embeddings,
+                job_context['chunks'],
+                job_context['chunk_embeddings']
+            )
+            return await self._find_relevant_chunks(
+                job_context['requirements'],
+                vector_store,
+                job_context['requirement_embeddings']
+            )
+        
+        async def evaluate_fit(candidate_profile, relevant_chunks, job_context):
+            return await self.llm_evaluator.evaluate_candidate_fit(
                 candidate_profile,
-                candidate_name
+                job_context['requirements'],
+                relevant_chunks,
+                job_context['text']
             )
-            
-            print("Evaluation completed successfully")
-            return response
-            
+        
+        async def build_response(evaluation, candidate_profile):
+            return await self._build_response(evaluation, candidate_profile, candidate_name)
+        
+        graph.add_stage('parse_resume', parse_resume)
+        graph.add_stage('chunk_resume', chunk_resume, ['parse_resume'])
+        graph.add_stage('extract_profile', self.text_processor.extract_candidate_profile, ['parse_resume'])
+        graph.add_stage('embed_resume', self._embed_texts, ['chunk_resume'])
+        graph.add_stage('measure_resume_chunks', self._measure_chunks, ['chunk_resume'])
+        graph.add_stage('find_relevant_chunks', find_relevant, ['chunk_resume', 'embed_resume', 'job_context'])
+        graph.add_stage('evaluate_fit', evaluate_fit, ['extract_profile', 'find_relevant_chunks', 'job_context'])
+        graph.add_stage('response', build_response, ['evaluate_fit', 'extract_profile'])
+    
+    @staticmethod
+    def _constant(value: Any):
+        """Wrap a precomputed value as a stage"""
+        
+        async def stage():
+            return value
+        return stage
+    
+    async def _parse_document(
+        self,
+        source: DocumentSource,
+        filename: str,
+        kind: str,
+        label: str,
+        deadline: Optional[float] = None
+    ) -> ParsedDocument:
+        """Parse a document, failing if no text was extracted; uploads keep their own filename"""
+        
+        print(f"Parsing {label}...")
+        if isinstance(source, UploadedDocument):
+            filename = source.filename
+        document = await self.document_parser.parse(source, filename, kind, deadline)
+        
+        if not document.text:
+            print(f"{label.capitalize()} metadata: {document.metadata}")
+            raise ValueError(f"Failed to extract text from {label}")
+        
+        return document
+    
+    async def _get_chunk_tokenizer(self) -> Optional[ChunkTokenizer]:
+        """Model tokenizer when CHUNKING_MODE is 'tokens', None to chunk by characters"""
+        
+        if settings.CHUNKING_MODE == 'tokens':
+            return await self.embedding_service.get_chunk_tokenizer()
+        return None
+    
+    async def _measure_chunks(self, chunks: List[str]) -> Dict[str, Any]:
+        """Chunking statistics for one document; never fails the evaluation"""
+        
+        try:
+            stats = await self.embedding_service.measure_chunks(chunks)
+            stats['mode'] = settings.CHUNKING_MODE
+            return stats
         except Exception as e:
-            print(f"Error in candidate evaluation: {str(e)}")
-            raise
+            print(f"Error measuring chunks: {str(e)}")
+            return {}
     
-    async def _build_vector_store(self, resume_chunks: List[str], job_chunks: List[str]):
-        """Build vector store with document chunks"""
-        
-        # Clear existing data
-        self.vector_store.clear()
-        
-        # Combine all chunks
-        all_chunks = resume_chunks + job_chunks
-        
-        # Create metadata
-        metadata = []
-        for i, chunk in enumerate(resume_chunks):
-            metadata.append({
-                'type': 'resume',
-                'chunk_index': i,
-                'source': 'resume'
-            })
-        
-        for i, chunk in enumerate(job_chunks):
-            metadata.append({
-                'type': 'job_description',
-                'chunk_index': i,
-                'source': 'job_description'
-            })
-        
-        # Generate embeddings
-        if all_chunks:
-            embeddings = await self.embedding_service.generate_embeddings(all_chunks)
-            
-            # Add to vector store
-            self.vector_store.add_documents(all_chunks, embeddings, metadata)
+    @staticmethod
+    def _chunking_stats(results: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Per-document chunking statistics from a finished stage graph"""
+        
+        return {
+            'resume': results['measure_resume_chunks'],
+            'job_description': results['job_context'].get('chunking_stats', {})
+        }
     
-    async def _find_relevant_chunks(self, job_requirements: List[str]) -> List[str]:
-        """Find relevant resume chunks for job requirements"""
+    async def _embed_texts(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Embed a list of texts, None if there is nothing to embed"""
         
-        relevant_chunks = []
+        if not texts:
+            return None
+        return await self.embedding_service.generate_embeddings(texts)
+    
+    def _build_vector_store(
+        self,
+        resume_chunks: List[str],
+        resume_embeddings: Optional[np.ndarray],
+        job_chunks: List[str],
+        job_chunk_embeddings: Optional[np.ndarray]
+    ) -> VectorStore:
+        """
+        Build a vector store with document chunks
         
-        for requirement in job_requirements:
-            # Generate embedding for requirement
-            requirement_embedding = await self.embedding_service.generate_single_embedding(requirement)
-            
-            # Search for relevant chunks
-            results = self.vector_store.search(requirement_embedding, k=3)
-            
-            # Filter for resume chunks only
-            resume_results = [
-                text for text, score, metadata in results
-                if metadata.get('type') == 'resume' and score > 0.3
-            ]
-            
-            relevant_chunks.extend(resume_results)
+        Each evaluation gets its own store so concurrent requests never see
+        or clear each other's chunks.
+        """
+        
+        vector_store = VectorStore(
+            dimension=self.embedding_service.get_embedding_dimension()
+        )
+        
+        if resume_chunks:
+            vector_store.add_documents(resume_chunks, resume_embeddings, [
+                {'type': 'resume', 'chunk_index': i, 'source': 'resume'}
+                for i in range(len(resume_chunks))
+            ])
+        
+        if job_chunks:
+            vector_store.add_documents(job_chunks, job_chunk_embeddings, [
+                {'type': 'job_description', 'chunk_index': i, 'source': 'job_description'}
+                for i in range(len(job_chunks))
+            ])
+        
+        return vector_store
+    
+    async def _find_relevant_chunks(
+        self,
+        job_requirements: List[str],
+        vector_store: VectorStore,
+        requirement_embeddings: Optional[np.ndarray] = None,
+        k: int = 3,
+        max_chunks: int = 5
+    ) -> List[str]:
+        """
+        Find relevant resume chunks for job requirements
+        
+        All requirements are searched in one batched query restricted to resume
+        chunks; hits are ranked by requirement order then score and de-duplicated.
+        """
+        
+        if not job_requirements:
+            return []
+        
+        # Embed all requirements in one forward pass unless precomputed
+        if requirement_embeddings is None or len(requirement_embeddings) != len(job_requirements):
+            requirement_embeddings = await self.embedding_service.generate_embeddings(job_requirements)
+            if len(requirement_embeddings) == 0:
+                return []
+        
+        scores, ids = vector_store.search_batch(requirement_embeddings, k=k, filters={'type': 'resume'})
+        
+        # Row-major flattening keeps requirement order, then rank within requirement
+        hit_ids = ids[(ids >= 0) & (scores > settings.SIMILARITY_THRESHOLD)]
+        if hit_ids.size == 0:
+            return []
         
-        # Remove duplicates while preserving order
-        unique_chunks = []
-        seen = set()
-        for chunk in relevant_chunks:
-            if chunk not in seen:
-                unique_chunks.append(chunk)
-                seen.add(chunk)
+        # Remove duplicates while preserving first-occurrence order
+        unique_ids, first_positions = np.unique(hit_ids, return_index=True)
+        ordered_ids = unique_ids[np.argsort(first_positions)][:max_chunks]
         
-        return unique_chunks[:5]  # Limit to top 5 chunks
+        return [vector_store.get_text(i) for i in ordered_ids]
     
     async def _build_response(
         self,
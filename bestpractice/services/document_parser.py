@@ -1,10 +1,22 @@
 
 import os
+import time
 import aiohttp
 import asyncio
 import json
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Any, Iterator, Optional, List, Tuple, Union
 from bestpractice.config import settings
+from bestpractice.models.document import ParsedDocument, SECTION_HEADERS
+from bestpractice.services.http_client import http_client
+from bestpractice.utils.execution import execution_pool
+from bestpractice.services.parse_cache import parse_cache
+from bestpractice.utils.polling import PollSchedule
+from bestpractice.utils.text_quality import assess_extraction
+from bestpractice.utils.uploads import UploadedDocument
+
+# A file on disk, or an upload that was never written to disk
+DocumentSource = Union[str, UploadedDocument]
 
 class DocumentParser:
  
@@ -12,28 +24,191 @@ class DocumentParser:
     def __init__(self):
         self.api_key = settings.LLAMA_PARSE_API_KEY
         self.base_url = "https://api.cloud.llamaindex.ai/api/parsing"
+        self.language = 'en'
+        self.parsing_instruction = 'Extract all text content while preserving structure and formatting.'
+        self.parse_cache = parse_cache
+        self.poll_stats = {
+            'jobs': 0,
+            'completed': 0,
+            'deadline_exceeded': 0,
+            'deadline_skipped': 0,
+            'deadline_timeouts': 0,
+            'attempts_total': 0,
+            'wait_seconds_total': 0.0
+        }
+        self.routing_stats = {
+            'local': 0,
+            'remote': 0,
+            'gate_failed': 0
+        }
         
-    async def parse_document(self, file_path: str, filename: str) -> Dict[str, Any]:
-
+    async def parse_document(
+        self,
+        source: DocumentSource,
+        filename: str,
+        deadline: Optional[float] = None,
+        kind: str = 'resume'
+    ) -> Dict[str, Any]:
+        """
+        Parse a document with LlamaParse, falling back to local extraction
+        
+        With PARSE_MODE=local_first the document is extracted locally first and
+        only sent to LlamaParse if the text fails the quality gate.
+        
+        Args:
+            source: Path to the file, or an upload held in memory
+            filename: Original filename
+            deadline: Absolute time.monotonic() by which remote parsing must finish;
+                defaults to now + PARSE_DEADLINE_SECONDS. Batches pass one deadline for
+                all their documents; once it has passed documents go straight to local extraction
+            kind: 'resume' or 'job_description'; selects the section headers the gate looks for
+            
+        Returns:
+            Dict containing extracted text and metadata
+        """
+        
+        local_result = None
+        if settings.PARSE_MODE == 'local_first':
+            local_result = await self._extract_locally_cached(source, filename, kind)
+            quality = local_result['metadata']['quality']
+            if quality['passed'] or not self.api_key:
+                self.routing_stats['local'] += 1
+                return local_result
+            self.routing_stats['gate_failed'] += 1
+            print(f"Local extraction of {filename} failed the quality gate ({quality}), using LlamaParse")
+            if 'error' in local_result['metadata']:
+                # Nothing usable to fall back on; let the remote fallback path extract again
+                local_result = None
         
         if not self.api_key:
             raise ValueError("LLAMA_PARSE_API_KEY not found in environment variables")
         
         try:
-            # Read file content
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
+            if deadline is None:
+                deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
             
-            # Step 1: Upload file and start parsing
-            job_id = await self._upload_file(file_content, filename)
+            # Read and hash the file off the event loop, then return a previous parse of identical bytes if we have one
+            file_content, cache_key = await execution_pool.run_in_thread(
+                "parse_cache_key",
+                self._read_and_key,
+                source,
+                self._parse_options(filename)
+            )
+            cached = await self.parse_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            if time.monotonic() >= deadline:
+                self.poll_stats['deadline_skipped'] += 1
+                print(f"Parse deadline already passed, extracting {filename} locally")
+                return await self._fallback_text_extraction(source, filename, local_result)
+            
+            # Step 1: Upload file and start parsing, within what is left of the deadline
+            self.routing_stats['remote'] += 1
+            async with asyncio.timeout(max(0.0, deadline - time.monotonic())):
+                job_id = await self._upload_file(file_content, filename)
             
             # Step 2: Poll for completion
-            return await self._poll_for_completion(job_id, file_path, filename)
+            result = await self._poll_for_completion(job_id, source, filename, deadline, local_result)
+        
+        except TimeoutError as e:
+            # aiohttp's own read and connect timeouts are TimeoutErrors too; only count the deadline
+            if time.monotonic() >= deadline:
+                self.poll_stats['deadline_timeouts'] += 1
+                print(f"Upload of {filename} ran past the parse deadline, extracting locally")
+            else:
+                print(f"Error parsing document with LlamaParser: {str(e) or 'timed out'}")
+            return await self._fallback_text_extraction(source, filename, local_result)
                     
         except Exception as e:
             print(f"Error parsing document with LlamaParser: {str(e)}")
             # Fallback to simple text extraction
-            return await self._fallback_text_extraction(file_path, filename)
+            return await self._fallback_text_extraction(source, filename, local_result)
+        
+        # Only remote results are cached under the remote key; fallbacks cache themselves
+        if result.get('metadata', {}).get('source', '').startswith('llamaparser'):
+            await self.parse_cache.put(cache_key, result)
+        
+        return result
+    
+    async def parse(self, source: DocumentSource, filename: str, kind: str = 'resume', deadline: Optional[float] = None) -> ParsedDocument:
+        """
+        Parse a document into a ParsedDocument
+        
+        Args:
+            source: Path to the file, or an upload held in memory
+            filename: Original filename
+            kind: 'resume' or 'job_description'
+            deadline: See parse_document
+            
+        Returns:
+            ParsedDocument whose cleaned text and sections are computed on first use
+        """
+        
+        result = await self.parse_document(source, filename, deadline, kind)
+        return ParsedDocument.from_parse_result(result, kind)
+    
+    def _parse_options(self, filename: str, parser: str = 'llamaparse', kind: Optional[str] = None) -> Dict[str, Any]:
+        """Options that affect parse output and therefore belong in the cache key"""
+        
+        options = {
+            'parser': parser,
+            'file_type': os.path.splitext(filename.lower())[1]
+        }
+        if parser == 'llamaparse':
+            options['language'] = self.language
+            options['parsing_instruction'] = self.parsing_instruction
+        elif parser == 'local':
+            # The cached result carries the quality gate verdict, which depends on these
+            options['kind'] = kind
+            options['quality_gate'] = [
+                settings.LOCAL_PARSE_MIN_CHARS_PER_PAGE,
+                settings.LOCAL_PARSE_MIN_PRINTABLE_RATIO,
+                settings.LOCAL_PARSE_MIN_SECTION_HEADERS
+            ]
+        return options
+    
+    async def _extract_locally_cached(self, source: DocumentSource, filename: str, kind: str) -> Dict[str, Any]:
+        """
+        Local extraction and quality assessment for local_first mode, through the parse cache
+        
+        Args:
+            source: Path to the file, or an upload held in memory
+            filename: Original filename
+            kind: 'resume' or 'job_description'
+            
+        Returns:
+            Dict containing extracted text and metadata, including the quality verdict
+        """
+        
+        try:
+            _, cache_key = await execution_pool.run_in_thread(
+                "parse_cache_key",
+                self._read_and_key,
+                source,
+                self._parse_options(filename, parser='local', kind=kind)
+            )
+        except OSError as e:
+            print(f"Error reading file for local parse cache: {str(e)}")
+            cache_key = None
+        
+        if cache_key:
+            cached = await self.parse_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = await execution_pool.run_in_thread(
+            "local_text_extraction",
+            self._extract_and_assess,
+            source,
+            filename,
+            kind
+        )
+        
+        if cache_key and 'error' not in result['metadata']:
+            await self.parse_cache.put(cache_key, result)
+        
+        return result
     
     async def _upload_file(self, file_content: bytes, filename: str) -> str:
 
@@ -48,41 +223,61 @@ class DocumentParser:
         form_data.add_field('file', file_content, filename=filename)
         
         # Add optional parameters for better parsing
-        form_data.add_field('language', 'en')
-        form_data.add_field('parsing_instruction', 'Extract all text content while preserving structure and formatting.')
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/upload",
-                headers=headers,
-                data=form_data
-            ) as response:
-                
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"Upload error: {response.status} - {error_text}")
-                    raise Exception(f"Upload failed: {response.status} - {error_text}")
-                
-                result = await response.json()
-                print(f"DEBUG: Upload response: {json.dumps(result, indent=2)}")
-                
-                job_id = result.get('id')
-                if not job_id:
-                    raise Exception(f"No job ID in upload response: {result}")
-                
-                return job_id
+        form_data.add_field('language', self.language)
+        form_data.add_field('parsing_instruction', self.parsing_instruction)
+        
+        session = await http_client.get_session()
+        async with session.post(
+            f"{self.base_url}/upload",
+            headers=headers,
+            data=form_data
+        ) as response:
+            
+            if response.status != 200:
+                error_text = await response.text()
+                print(f"Upload error: {response.status} - {error_text}")
+                raise Exception(f"Upload failed: {response.status} - {error_text}")
+            
+            result = await response.json()
+            print(f"DEBUG: Upload response: {json.dumps(result, indent=2)}")
+            
+            job_id = result.get('id')
+            if not job_id:
+                raise Exception(f"No job ID in upload response: {result}")
+            
+            return job_id
     
-    async def _poll_for_completion(self, job_id: str, file_path: str, filename: str, max_attempts: int = 60) -> Dict[str, Any]:
+    async def _poll_for_completion(
+        self,
+        job_id: str,
+        source: DocumentSource,
+        filename: str,
+        deadline: Optional[float] = None,
+        local_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
   
         headers = {
             'Authorization': f'Bearer {self.api_key}',
             'accept': 'application/json'
         }
         
-        for attempt in range(max_attempts):
+        if deadline is None:
+            deadline = time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+        
+        schedule = PollSchedule(
+            deadline=deadline,
+            initial_delay=settings.PARSE_POLL_INITIAL_DELAY,
+            max_delay=settings.PARSE_POLL_MAX_DELAY,
+            multiplier=settings.PARSE_POLL_MULTIPLIER,
+            jitter=settings.PARSE_POLL_JITTER
+        )
+        
+        while True:
+            schedule.record_attempt()
             try:
-                # Check job status
-                async with aiohttp.ClientSession() as session:
+                # Check job status; no request may outlive the deadline
+                async with asyncio.timeout(schedule.remaining()):
+                    session = await http_client.get_session()
                     async with session.get(
                         f"{self.base_url}/job/{job_id}",
                         headers=headers
@@ -94,39 +289,86 @@ class DocumentParser:
                             raise Exception(f"Status check failed: {response.status} - {error_text}")
                         
                         result = await response.json()
-                        print(f"DEBUG: Status check attempt {attempt + 1}: {json.dumps(result, indent=2)}")
+                        print(f"DEBUG: Status check attempt {schedule.attempts}: {json.dumps(result, indent=2)}")
                         
                         status = result.get('status')
+                
+                if status == 'SUCCESS':
+                    # Get the parsed content in markdown format
+                    async with asyncio.timeout(schedule.remaining()):
+                        parsed = await self._get_markdown_result(job_id, source, filename, local_result)
+                    self._record_poll(schedule, completed=True)
+                    parsed.setdefault('metadata', {})['poll'] = schedule.report()
+                    return parsed
+                
+                elif status == 'ERROR':
+                    error_msg = result.get('error', 'Unknown error')
+                    print(f"Job failed: {error_msg}")
+                    self._record_poll(schedule, completed=False)
+                    return await self._fallback_text_extraction(source, filename, local_result)
+                
+                elif status in ['PENDING', 'RUNNING']:
+                    print(f"Job {job_id} status: {status}, waiting...")
+                
+                else:
+                    print(f"Unknown status: {status}")
+                    raise Exception(f"Unknown status: {status}")
                         
-                        if status == 'SUCCESS':
-                            # Get the parsed content in markdown format
-                            return await self._get_markdown_result(job_id, file_path, filename)
-                        
-                        elif status == 'ERROR':
-                            error_msg = result.get('error', 'Unknown error')
-                            print(f"Job failed: {error_msg}")
-                            raise Exception(f"Parsing job failed: {error_msg}")
-                        
-                        elif status in ['PENDING', 'RUNNING']:
-                            print(f"Job {job_id} status: {status}, waiting...")
-                            await asyncio.sleep(5)
-                            continue
-                        
-                        else:
-                            print(f"Unknown status: {status}")
-                            raise Exception(f"Unknown status: {status}")
-                            
+            except TimeoutError as e:
+                if schedule.remaining() > 0:
+                    # An HTTP timeout well before the deadline; poll again
+                    print(f"Polling attempt {schedule.attempts} failed: {str(e) or 'timed out'}")
+                else:
+                    self.poll_stats['deadline_timeouts'] += 1
+                    print(f"Polling attempt {schedule.attempts} ran past the deadline")
+                    break
+            
             except Exception as e:
-                print(f"Polling attempt {attempt + 1} failed: {str(e)}")
-                if attempt == max_attempts - 1:
-                    print(f"Polling failed after {max_attempts} attempts, using fallback")
-                    return await self._fallback_text_extraction(file_path, filename)
-                await asyncio.sleep(5)
-        
-        print("Job did not complete within timeout, using fallback")
-        return await self._fallback_text_extraction(file_path, filename)
+                print(f"Polling attempt {schedule.attempts} failed: {str(e)}")
+            
+            delay = schedule.next_delay()
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        
+        self._record_poll(schedule, completed=False, deadline_exceeded=True)
+        print(f"Job {job_id} did not complete within the deadline ({schedule.report()}), using fallback")
+        return await self._fallback_text_extraction(source, filename, local_result)
+    
+    def _record_poll(self, schedule: PollSchedule, completed: bool, deadline_exceeded: bool = False):
+        """Accumulate per-job poll statistics"""
+        
+        report = schedule.report()
+        print(f"Poll summary: {report}")
+        self.poll_stats['jobs'] += 1
+        self.poll_stats['completed'] += int(completed)
+        self.poll_stats['deadline_exceeded'] += int(deadline_exceeded)
+        self.poll_stats['attempts_total'] += report['attempts']
+        self.poll_stats['wait_seconds_total'] += report['wait_seconds']
+    
+    def get_stats(self) -> Dict[str, Any]:
+        jobs = self.poll_stats['jobs']
+        routed = self.routing_stats['local'] + self.routing_stats['remote']
+        return {
+            "poll": {
+                **self.poll_stats,
+                "attempts_avg": self.poll_stats['attempts_total'] / jobs if jobs else 0.0,
+                "wait_seconds_avg": self.poll_stats['wait_seconds_total'] / jobs if jobs else 0.0
+            },
+            "routing": {
+                "mode": settings.PARSE_MODE,
+                **self.routing_stats,
+                "local_ratio": self.routing_stats['local'] / routed if routed else 0.0
+            }
+        }
     
-    async def _get_markdown_result(self, job_id: str, file_path: str, filename: str) -> Dict[str, Any]:
+    async def _get_markdown_result(
+        self,
+        job_id: str,
+        source: DocumentSource,
+        filename: str,
+        local_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
 
         
         headers = {
@@ -135,46 +377,52 @@ class DocumentParser:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/job/{job_id}/result/markdown",
-                    headers=headers
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        print(f"Result fetch error: {response.status} - {error_text}")
-                        # Try to get text result instead
-                        return await self._get_text_result(job_id, file_path, filename)
-                    
-                    result = await response.json()
-                    print(f"DEBUG: Markdown result: {json.dumps(result, indent=2)}")
-                    
-                    # Extract markdown content
-                    markdown_content = result.get('markdown', '')
-                    if not markdown_content:
-                        # Try alternative field names
-                        markdown_content = result.get('text', '') or result.get('content', '')
-                    
-                    if not markdown_content or markdown_content.strip() == '':
-                        print("No markdown content found, trying text endpoint")
-                        return await self._get_text_result(job_id, file_path, filename)
-                    
-                    return {
-                        'text': markdown_content,
-                        'metadata': {
-                            'job_id': job_id,
-                            'source': 'llamaparser_markdown',
-                            'filename': filename,
-                            'format': 'markdown'
-                        }
+            session = await http_client.get_session()
+            async with session.get(
+                f"{self.base_url}/job/{job_id}/result/markdown",
+                headers=headers
+            ) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    print(f"Result fetch error: {response.status} - {error_text}")
+                    # Try to get text result instead
+                    return await self._get_text_result(job_id, source, filename, local_result)
+                
+                result = await response.json()
+                print(f"DEBUG: Markdown result: {json.dumps(result, indent=2)}")
+                
+                # Extract markdown content
+                markdown_content = result.get('markdown', '')
+                if not markdown_content:
+                    # Try alternative field names
+                    markdown_content = result.get('text', '') or result.get('content', '')
+                
+                if not markdown_content or markdown_content.strip() == '':
+                    print("No markdown content found, trying text endpoint")
+                    return await self._get_text_result(job_id, source, filename, local_result)
+                
+                return {
+                    'text': markdown_content,
+                    'metadata': {
+                        'job_id': job_id,
+                        'source': 'llamaparser_markdown',
+                        'filename': filename,
+                        'format': 'markdown'
                     }
-                    
+                }
+                
         except Exception as e:
             print(f"Error getting markdown result: {str(e)}")
-            return await self._get_text_result(job_id, file_path, filename)
+            return await self._get_text_result(job_id, source, filename, local_result)
     
-    async def _get_text_result(self, job_id: str, file_path: str, filename: str) -> Dict[str, Any]:
+    async def _get_text_result(
+        self,
+        job_id: str,
+        source: DocumentSource,
+        filename: str,
+        local_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
 
         
         headers = {
@@ -183,87 +431,179 @@ class DocumentParser:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/job/{job_id}/result/text",
-                    headers=headers
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        print(f"Text result fetch error: {response.status} - {error_text}")
-                        raise Exception(f"Failed to get text result: {response.status} - {error_text}")
-                    
-                    result = await response.json()
-                    print(f"DEBUG: Text result: {json.dumps(result, indent=2)}")
-                    
-                    # Extract text content
-                    text_content = result.get('text', '')
-                    if not text_content:
-                        # Try alternative field names
-                        text_content = result.get('content', '') or result.get('markdown', '')
-                    
-                    if not text_content or text_content.strip() == '':
-                        print("No text content found, using fallback")
-                        return await self._fallback_text_extraction(file_path, filename)
-                    
-                    return {
-                        'text': text_content,
-                        'metadata': {
-                            'job_id': job_id,
-                            'source': 'llamaparser_text',
-                            'filename': filename,
-                            'format': 'text'
-                        }
+            session = await http_client.get_session()
+            async with session.get(
+                f"{self.base_url}/job/{job_id}/result/text",
+                headers=headers
+            ) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    print(f"Text result fetch error: {response.status} - {error_text}")
+                    raise Exception(f"Failed to get text result: {response.status} - {error_text}")
+                
+                result = await response.json()
+                print(f"DEBUG: Text result: {json.dumps(result, indent=2)}")
+                
+                # Extract text content
+                text_content = result.get('text', '')
+                if not text_content:
+                    # Try alternative field names
+                    text_content = result.get('content', '') or result.get('markdown', '')
+                
+                if not text_content or text_content.strip() == '':
+                    print("No text content found, using fallback")
+                    return await self._fallback_text_extraction(source, filename, local_result)
+                
+                return {
+                    'text': text_content,
+                    'metadata': {
+                        'job_id': job_id,
+                        'source': 'llamaparser_text',
+                        'filename': filename,
+                        'format': 'text'
                     }
-                    
+                }
+                
         except Exception as e:
             print(f"Error getting text result: {str(e)}")
-            return await self._fallback_text_extraction(file_path, filename)
+            return await self._fallback_text_extraction(source, filename, local_result)
     
-    async def _fallback_text_extraction(self, file_path: str, filename: str) -> Dict[str, Any]:
+    async def _fallback_text_extraction(
+        self,
+        source: DocumentSource,
+        filename: str,
+        local_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Fallback text extraction for when LlamaParser fails
         
         Args:
-            file_path: Path to the file
+            source: Path to the file, or an upload held in memory
             filename: Original filename
+            local_result: Text already extracted locally in local_first mode; returned
+                instead of extracting the same bytes again
             
         Returns:
             Dict containing extracted text
         """
         
+        if local_result is not None:
+            return local_result
+        
+        try:
+            _, cache_key = await execution_pool.run_in_thread(
+                "parse_cache_key",
+                self._read_and_key,
+                source,
+                self._parse_options(filename, parser='fallback')
+            )
+        except OSError as e:
+            print(f"Error reading file for fallback cache: {str(e)}")
+            cache_key = None
+        
+        if cache_key:
+            cached = await self.parse_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = await execution_pool.run_in_thread(
+            "fallback_text_extraction",
+            self._extract_text_locally,
+            source,
+            filename
+        )
+        
+        if cache_key and 'error' not in result['metadata']:
+            await self.parse_cache.put(cache_key, result)
+        
+        return result
+    
+    @staticmethod
+    def preload_extractors():
+        """Import the local PDF/DOCX libraries ahead of the first fallback (blocking)"""
+        
+        for module_name in ('pymupdf', 'PyPDF2', 'docx'):
+            try:
+                __import__(module_name)
+            except ImportError:
+                print(f"Local extractor {module_name} is not installed")
+    
+    @staticmethod
+    def _read_source(source: DocumentSource) -> bytes:
+        """Raw bytes of a file path or upload"""
+        
+        if isinstance(source, UploadedDocument):
+            return source.read()
+        with open(source, 'rb') as f:
+            return f.read()
+    
+    def _read_and_key(self, source: DocumentSource, options: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Raw bytes of the source and their parse cache key (blocking)"""
+        
+        file_content = self._read_source(source)
+        return file_content, self.parse_cache.make_key(file_content, options)
+    
+    @staticmethod
+    @contextmanager
+    def _open_source(source: DocumentSource) -> Iterator[BinaryIO]:
+        """Binary file object for a path or upload; only files opened here are closed"""
+        
+        if isinstance(source, UploadedDocument):
+            yield source.open()
+            return
+        with open(source, 'rb') as f:
+            yield f
+    
+    def _extract_and_assess(self, source: DocumentSource, filename: str, kind: str) -> Dict[str, Any]:
+        """Local extraction plus its quality assessment (blocking)"""
+        
+        result = self._extract_text_locally(source, filename)
+        metadata = result['metadata']
+        metadata['source'] = 'local_extraction'
+        if 'error' in metadata:
+            metadata['quality'] = {'passed': False, 'failed_checks': ['extraction_error']}
+        else:
+            metadata['quality'] = assess_extraction(result['text'], metadata['pages'], SECTION_HEADERS[kind])
+        return result
+    
+    def _extract_text_locally(self, source: DocumentSource, filename: str) -> Dict[str, Any]:
+        """Extract text with local libraries (blocking)"""
+        
         try:
             file_ext = os.path.splitext(filename.lower())[1]
+            pages = 1
             
             if file_ext == '.txt':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
+                with self._open_source(source) as f:
+                    text = f.read().decode('utf-8')
                     
             elif file_ext == '.pdf':
                 try:
-                    import PyPDF2
-                    text = ""
-                    with open(file_path, 'rb') as f:
-                        pdf_reader = PyPDF2.PdfReader(f)
-                        for page in pdf_reader.pages:
-                            text += page.extract_text() + "\n"
+                    import pymupdf  # much faster than PyPDF2
+                    with self._open_source(source) as f:
+                        doc = pymupdf.open(stream=f.read(), filetype='pdf')
+                    pages = doc.page_count
+                    text = "\n".join(page.get_text() for page in doc)
+                    doc.close()
                 except ImportError:
                     try:
                         # Try alternative PDF library
-                        import fitz  # PyMuPDF
-                        doc = fitz.open(file_path)
+                        import PyPDF2
                         text = ""
-                        for page in doc:
-                            text += page.get_text() + "\n"
-                        doc.close()
+                        with self._open_source(source) as f:
+                            pdf_reader = PyPDF2.PdfReader(f)
+                            pages = len(pdf_reader.pages)
+                            for page in pdf_reader.pages:
+                                text += page.extract_text() + "\n"
                     except ImportError:
                         text = "PDF parsing requires PyPDF2 or PyMuPDF library"
                     
             elif file_ext == '.docx':
                 try:
                     import docx
-                    doc = docx.Document(file_path)
+                    with self._open_source(source) as f:
+                        doc = docx.Document(f)
                     text = "\n".join([para.text for para in doc.paragraphs])
                 except ImportError:
                     text = "DOCX parsing requires python-docx library"
@@ -283,7 +623,8 @@ class DocumentParser:
                 'metadata': {
                     'source': 'fallback_extraction',
                     'filename': filename,
-                    'file_type': file_ext
+                    'file_type': file_ext,
+                    'pages': pages
                 }
             }
             
@@ -305,15 +646,15 @@ class DocumentParser:
                 'accept': 'application/json'
             }
             
-            async with aiohttp.ClientSession() as session:
-                # Test with a simple request - you might need to adjust this endpoint
-                async with session.get(
-                    "https://api.cloud.llamaindex.ai/api/parsing/jobs",
-                    headers=headers
-                ) as response:
-                    print(f"API test response: {response.status}")
-                    return response.status in [200, 404]  # 404 is ok, means auth worked
-                    
+            session = await http_client.get_session()
+            # Test with a simple request - you might need to adjust this endpoint
+            async with session.get(
+                "https://api.cloud.llamaindex.ai/api/parsing/jobs",
+                headers=headers
+            ) as response:
+                print(f"API test response: {response.status}")
+                return response.status in [200, 404]  # 404 is ok, means auth worked
+                
         except Exception as e:
             print(f"API connection test failed: {str(e)}")
             return False
@@ -0,0 +1,176 @@
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: disk appends are only safe from a single process
+    fcntl = None
+
+KEY_SIZE = 32  # SHA-256 digest bytes
+
+
+class EmbeddingCache:
+    """Embedding cache keyed by (model name, normalized text hash) with an in-memory LRU and an optional memory-mapped disk store"""
+
+    def __init__(self, model_name: str, dimension: int, max_items: int = 50000, cache_dir: Optional[str] = None):
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_items = max_items
+        self.row_bytes = dimension * np.dtype(np.float32).itemsize
+
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+        self.disk_dir = None
+        self._disk_rows: Dict[bytes, int] = {}
+        self._disk_map: Optional[np.memmap] = None
+        if cache_dir:
+            safe_name = re.sub(r'[^\w.-]', '_', model_name)
+            self.disk_dir = os.path.join(cache_dir, f"{safe_name}-{dimension}")
+            self._open_disk()
+
+    def make_key(self, text: str) -> bytes:
+        """Hash the model name together with whitespace-normalized text"""
+        normalized = ' '.join(text.split())
+        return hashlib.sha256(f"{self.model_name}\x00{normalized}".encode('utf-8')).digest()
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings, memory tier first
+
+        Args:
+            keys: Keys from make_key
+
+        Returns:
+            Embedding per key, None for misses
+        """
+        results: List[Optional[np.ndarray]] = []
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                else:
+                    vector = self._read_disk(key)
+                    if vector is not None:
+                        self._put_memory(key, vector)
+                        self._stats['disk_hits'] += 1
+                    else:
+                        self._stats['misses'] += 1
+                results.append(vector)
+        return results
+
+    def put_many(self, keys: List[bytes], vectors: np.ndarray):
+        """
+        Store embeddings in memory and, if configured, append new ones to disk
+
+        Args:
+            keys: Keys from make_key
+            vectors: (len(keys), dimension) array
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock:
+            for key, vector in zip(keys, vectors):
+                self._put_memory(key, vector.copy())
+            if self.disk_dir:
+                new_rows = [(key, vector) for key, vector in zip(keys, vectors) if key not in self._disk_rows]
+                if new_rows:
+                    self._append_disk(new_rows)
+
+    def _put_memory(self, key: bytes, vector: np.ndarray):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _paths(self):
+        return os.path.join(self.disk_dir, 'vectors.f32'), os.path.join(self.disk_dir, 'keys.bin')
+
+    def _open_disk(self):
+        """Load the key index and memory-map the vector file"""
+        os.makedirs(self.disk_dir, exist_ok=True)
+        vectors_path, keys_path = self._paths()
+
+        keys_blob = b''
+        if os.path.exists(keys_path):
+            with open(keys_path, 'rb') as f:
+                keys_blob = f.read()
+        vector_rows = os.path.getsize(vectors_path) // self.row_bytes if os.path.exists(vectors_path) else 0
+
+        # Keys are appended after vectors, so a torn write can only leave unindexed vectors
+        key_count = min(len(keys_blob) // KEY_SIZE, vector_rows)
+        self._disk_rows = {
+            keys_blob[i * KEY_SIZE:(i + 1) * KEY_SIZE]: i
+            for i in range(key_count)
+        }
+        self._remap(vector_rows)
+        print(f"Opened embedding cache at {self.disk_dir} with {key_count} vectors")
+
+    def _remap(self, rows: int):
+        vectors_path, _ = self._paths()
+        self._disk_map = np.memmap(vectors_path, dtype=np.float32, mode='r', shape=(rows, self.dimension)) if rows else None
+
+    def _read_disk(self, key: bytes) -> Optional[np.ndarray]:
+        row = self._disk_rows.get(key)
+        if row is None:
+            return None
+        if self._disk_map is None or row >= self._disk_map.shape[0]:
+            vectors_path, _ = self._paths()
+            self._remap(os.path.getsize(vectors_path) // self.row_bytes)
+        return np.array(self._disk_map[row])
+
+    def _append_disk(self, rows):
+        """Append vectors then keys, under an exclusive file lock when available"""
+        vectors_path, keys_path = self._paths()
+        try:
+            with open(vectors_path, 'ab') as vectors_file, open(keys_path, 'ab') as keys_file:
+                if fcntl is not None:
+                    fcntl.flock(vectors_file, fcntl.LOCK_EX)
+                try:
+                    vectors_file.seek(0, os.SEEK_END)
+                    start_row = vectors_file.tell() // self.row_bytes
+                    # Pad keys so row i of keys.bin always describes row i of vectors.f32
+                    keys_file.seek(0, os.SEEK_END)
+                    key_rows = keys_file.tell() // KEY_SIZE
+                    if key_rows < start_row:
+                        keys_file.write(b'\x00' * KEY_SIZE * (start_row - key_rows))
+
+                    vectors_file.write(b''.join(vector.tobytes() for _, vector in rows))
+                    vectors_file.flush()
+                    keys_file.write(b''.join(key for key, _ in rows))
+                    keys_file.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(vectors_file, fcntl.LOCK_UN)
+        except OSError as e:
+            print(f"Error appending to embedding cache: {str(e)}")
+            return
+
+        for offset, (key, _) in enumerate(rows):
+            self._disk_rows[key] = start_row + offset
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = sum(self._stats.values())
+            hits = self._stats['memory_hits'] + self._stats['disk_hits']
+            disk_bytes = 0
+            if self.disk_dir:
+                vectors_path, keys_path = self._paths()
+                disk_bytes = sum(os.path.getsize(p) for p in (vectors_path, keys_path) if os.path.exists(p))
+            return {
+                **self._stats,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "memory_capacity": self.max_items,
+                "memory_bytes": len(self._memory) * self.row_bytes,
+                "disk_enabled": bool(self.disk_dir),
+                "disk_items": len(self._disk_rows),
+                "disk_bytes": disk_bytes
+            }
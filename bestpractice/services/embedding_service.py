@@ -1,8 +1,11 @@
 
 import asyncio
-from typing import List
+from typing import Dict, Any, List
 import numpy as np
 from bestpractice.config import settings
+from bestpractice.utils.execution import execution_pool
+from bestpractice.services.embedding_cache import EmbeddingCache
+from bestpractice.utils.chunking import ChunkTokenizer, chunk_stats
 
 class EmbeddingService:
     """Service for generating text embeddings using SentenceTransformer"""
@@ -11,20 +14,78 @@ class EmbeddingService:
         self.model_name = "paraphrase-MiniLM-L3-v2"
         self.model = None
         self._model_lock = asyncio.Lock()
+        self._chunk_tokenizer = None
+        self.cache = None
+        if settings.EMBEDDING_CACHE_ENABLED:
+            self.cache = EmbeddingCache(
+                model_name=self.model_name,
+                dimension=self.get_embedding_dimension(),
+                max_items=settings.EMBEDDING_CACHE_MAX_ITEMS,
+                cache_dir=settings.EMBEDDING_CACHE_DIR or None
+            )
 
     async def _load_model(self):
         """Load the SentenceTransformer model"""
         if self.model is None:
             async with self._model_lock:
                 if self.model is None:
-                    from sentence_transformers import SentenceTransformer
-                    self.model = SentenceTransformer(self.model_name)
+                    self.model = await execution_pool.run_in_thread("load_embedding_model", self._create_model)
                     print(f"Loaded SentenceTransformer model: {self.model_name}")
+    
+    def _create_model(self):
+        """Import sentence_transformers and instantiate the model (blocking)"""
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model_name)
+
+    def preload_model(self):
+        """
+        Load the model synchronously, e.g. in a parent process before workers fork
+
+        Only weights are loaded; no forward pass is run, so no inference thread
+        pools exist yet when the process forks and the weights can be shared
+        copy-on-write by the workers.
+        """
+        if self.model is None:
+            self.model = self._create_model()
+            print(f"Preloaded SentenceTransformer model: {self.model_name}")
+
+    async def warm_up(self):
+        """Load the model and run a dummy encode so the first request doesn't pay for it"""
+        await self._load_model()
+        await self._encode(["warm up"])
+
+    async def get_chunk_tokenizer(self) -> ChunkTokenizer:
+        """
+        Get the model's tokenizer for sizing chunks, loading the model if needed
+        
+        Returns:
+            ChunkTokenizer whose max_tokens is the model's input limit minus special tokens
+        """
+        await self._load_model()
+        if self._chunk_tokenizer is None:
+            self._chunk_tokenizer = ChunkTokenizer(self.model.tokenizer, self.model.max_seq_length)
+        return self._chunk_tokenizer
+
+    async def measure_chunks(self, chunks: List[str]) -> Dict[str, Any]:
+        """
+        Report how chunks fit the model input
+        
+        Args:
+            chunks: Chunks of one document
+        
+        Returns:
+            Dict with chunk count, padding ratio and truncation rate (see chunk_stats)
+        """
+        tokenizer = await self.get_chunk_tokenizer()
+        counts = await execution_pool.run_in_thread("measure_chunks", tokenizer.count, chunks)
+        return chunk_stats(counts, tokenizer.max_seq_length)
 
     async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for a list of texts
         
+        Cached embeddings are reused; only cache misses are encoded, in one batch.
+        
         Args:
             texts: List of text strings to embed
         
@@ -34,10 +95,43 @@ class EmbeddingService:
         if not texts:
             return np.array([])
 
+        if self.cache is None:
+            return await self._encode(texts)
+
+        keys = [self.cache.make_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # Encode each distinct missing text once
+        miss_positions: Dict[bytes, int] = {}
+        miss_texts: List[str] = []
+        for key, text, vector in zip(keys, texts, cached):
+            if vector is None and key not in miss_positions:
+                miss_positions[key] = len(miss_texts)
+                miss_texts.append(text)
+
+        if miss_texts:
+            encoded = await self._encode(miss_texts)
+            if len(encoded) != len(miss_texts):
+                return np.array([])
+            self.cache.put_many(list(miss_positions.keys()), encoded)
+
+        return np.vstack([
+            vector if vector is not None else encoded[miss_positions[key]]
+            for key, vector in zip(keys, cached)
+        ]).astype(np.float32)
+
+    async def _encode(self, texts: List[str]) -> np.ndarray:
+        """Run the model on texts, returning an empty array on failure"""
         await self._load_model()
 
         try:
-            embeddings = self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+            embeddings = await execution_pool.run_in_thread(
+                "embedding_encode",
+                self.model.encode,
+                texts,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
             return embeddings
         except Exception as e:
             print(f"Error generating embeddings: {str(e)}")
@@ -81,6 +175,13 @@ class EmbeddingService:
             print(f"Error calculating similarity: {str(e)}")
             return 0.0
 
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "model_name": self.model_name,
+            "model_loaded": self.model is not None,
+            "cache": self.cache.get_stats() if self.cache is not None else None
+        }
+
     def get_embedding_dimension(self) -> int:
         """
         Get the dimension of embeddings produced by this model
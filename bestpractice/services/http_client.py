@@ -0,0 +1,70 @@
+import asyncio
+import aiohttp
+from typing import Dict, Any, Optional
+from bestpractice.config import settings
+
+class HTTPClient:
+    """Application-lifetime aiohttp session shared by the LlamaParse and Mistral clients"""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a session with a pooled keep-alive connector and DNS cache"""
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=settings.HTTP_CONNECT_TIMEOUT,
+            sock_read=settings.HTTP_READ_TIMEOUT
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def start(self):
+        """Open the shared session (called from the FastAPI lifespan hook)"""
+        await self.get_session()
+        print("Opened shared HTTP client session")
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creating it if needed
+
+        A new session is created if the previous one was closed or belongs to
+        another event loop, so scripts that call asyncio.run() repeatedly still work.
+
+        Returns:
+            Shared aiohttp ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self._create_session()
+            self._loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            print("Closed shared HTTP client session")
+        self._session = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        connector = self._session.connector if self._session is not None and not self._session.closed else None
+        return {
+            "open": connector is not None,
+            "limit": settings.HTTP_POOL_LIMIT,
+            "limit_per_host": settings.HTTP_POOL_LIMIT_PER_HOST,
+            "connect_timeout": settings.HTTP_CONNECT_TIMEOUT,
+            "read_timeout": settings.HTTP_READ_TIMEOUT
+        }
+
+
+# Create global HTTP client instance
+http_client = HTTPClient()
@@ -1,8 +1,57 @@
 import os
+import re
 import json
-import aiohttp
 from typing import Dict, Any, List
 from bestpractice.config import settings
+from bestpractice.services.http_client import http_client
+from bestpractice.utils.regex_registry import regex_registry, RegexBudgetExceeded
+from bestpractice.utils.skill_taxonomy import skill_taxonomy
+
+# Precompiled patterns for the rule-based requirement extractor
+
+_EXPERIENCE_PATTERNS = regex_registry.compile_all('requirements.experience', [
+    r'(\d+)\+?\s*(?:to\s+\d+\s*)?years?\s*(?:of\s*)?(?:experience|exp)',
+    r'minimum\s*(?:of\s*)?(\d+)\s*years?',
+    r'at\s*least\s*(\d+)\s*years?',
+    r'(\d+)\s*years?\s*(?:minimum|min)',
+    r'(\d+)\+\s*years?\s*(?:in|of|with)'
+])
+
+_EDUCATION_PATTERNS = regex_registry.compile_all('requirements.education', [
+    r'bachelor(?:\'s)?\s*(?:degree)?\s*(?:in\s*)?([^\n,.;]+)',
+    r'master(?:\'s)?\s*(?:degree)?\s*(?:in\s*)?([^\n,.;]+)',
+    r'phd\s*(?:in\s*)?([^\n,.;]+)',
+    r'degree\s*(?:in\s*)?([^\n,.;]+)',
+    r'(?:bs|ba|ms|ma|phd)\s*(?:in\s*)?([^\n,.;]+)'
+])
+
+_CERTIFICATION_PATTERNS = regex_registry.compile_all('requirements.certification', [
+    r'(aws|azure|gcp|google)\s*certified',
+    r'(cissp|cisa|cism|pmp|scrum\s*master)',
+    r'certified\s*(?:in\s*)?([^\n,.;]+)',
+    r'certification\s*(?:in\s*)?([^\n,.;]+)'
+])
+
+_SOFT_SKILL_PATTERNS = regex_registry.compile_all('requirements.soft_skill', [
+    r'(?:strong|excellent|good)\s*(?:communication|leadership|problem[\s-]solving|analytical|teamwork|collaboration)',
+    r'(?:ability|capable)\s*(?:to\s*)?([^\n,.;]+)',
+    r'(?:experience|skilled|proficient)\s*(?:in\s*|with\s*)?([^\n,.;]+)',
+    r'(?:knowledge|understanding)\s*(?:of\s*)?([^\n,.;]+)',
+    r'(?:familiar|comfortable)\s*(?:with\s*)?([^\n,.;]+)'
+])
+
+_BULLET_PATTERNS = regex_registry.compile_all('requirements.bullet', [
+    r'[•·▪▫-]\s*([^\n\r]+)',
+    r'^\s*[*]\s*([^\n\r]+)',
+    r'^\s*\d+\.\s*([^\n\r]+)'
+], re.MULTILINE)
+
+_SECTION_PATTERNS = regex_registry.compile_all('requirements.section', [
+    r'(?:requirements?|qualifications?|skills?|experience|responsibilities)[\s:]*([^\n\r]+)',
+    r'(?:required|must\s*have|essential)[\s:]*([^\n\r]+)',
+    r'(?:preferred|nice\s*to\s*have|bonus)[\s:]*([^\n\r]+)'
+], re.IGNORECASE)
+
 
 class LLMEvaluator:
     """Service for LLM-based evaluation using Mistral API"""
@@ -44,56 +93,56 @@ class LLMEvaluator:
         )
         
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {self.api_key}',
-                    'Content-Type': 'application/json',
-                }
+            session = await http_client.get_session()
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+            }
+            
+            payload = {
+                'model': self.model,
+                'messages': [
+                    {
+                        'role': 'system',
+                        'content': 'You are an expert HR professional and technical recruiter. Your task is to evaluate candidate-job fit based on resume and job description. Provide structured, objective analysis.'
+                    },
+                    {
+                        'role': 'user',
+                        'content': prompt
+                    }
+                ],
+                'temperature': 0.3,
+                'max_tokens': 2000,
+                'response_format': {'type': 'json_object'}
+            }
+            
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload
+            ) as response:
                 
-                payload = {
-                    'model': self.model,
-                    'messages': [
-                        {
-                            'role': 'system',
-                            'content': 'You are an expert HR professional and technical recruiter. Your task is to evaluate candidate-job fit based on resume and job description. Provide structured, objective analysis.'
-                        },
-                        {
-                            'role': 'user',
-                            'content': prompt
-                        }
-                    ],
-                    'temperature': 0.3,
-                    'max_tokens': 2000,
-                    'response_format': {'type': 'json_object'}
-                }
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Mistral API error: {response.status} - {error_text}")
                 
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Mistral API error: {response.status} - {error_text}")
-                    
-                    result = await response.json()
+                result = await response.json()
+                
+                # Extract the response content
+                if 'choices' in result and len(result['choices']) > 0:
+                    content = result['choices'][0]['message']['content']
                     
-                    # Extract the response content
-                    if 'choices' in result and len(result['choices']) > 0:
-                        content = result['choices'][0]['message']['content']
-                        
-                        try:
-                            # Parse JSON response
-                            evaluation = json.loads(content)
-                            return evaluation
-                        except json.JSONDecodeError:
-                            # Fallback if JSON parsing fails
-                            return self._parse_text_response(content)
+                    try:
+                        # Parse JSON response
+                        evaluation = json.loads(content)
+                        return evaluation
+                    except json.JSONDecodeError:
+                        # Fallback if JSON parsing fails
+                        return self._parse_text_response(content)
+                
+                else:
+                    raise Exception("No response from Mistral API")
                     
-                    else:
-                        raise Exception("No response from Mistral API")
-                        
         except Exception as e:
             print(f"Error calling Mistral API: {str(e)}")
             # Return a fallback evaluation
@@ -246,50 +295,50 @@ Return a JSON array of requirement strings:
 """
         
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {self.api_key}',
-                    'Content-Type': 'application/json',
-                }
-                
-                payload = {
-                    'model': self.model,
-                    'messages': [
-                        {
-                            'role': 'system',
-                            'content': 'You are an expert at extracting job requirements from job descriptions. Extract clear, specific requirements.'
-                        },
-                        {
-                            'role': 'user',
-                            'content': prompt
-                        }
-                    ],
-                    'temperature': 0.1,
-                    'max_tokens': 1000,
-                    'response_format': {'type': 'json_object'}
-                }
+            session = await http_client.get_session()
+            headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+            }
+            
+            payload = {
+                'model': self.model,
+                'messages': [
+                    {
+                        'role': 'system',
+                        'content': 'You are an expert at extracting job requirements from job descriptions. Extract clear, specific requirements.'
+                    },
+                    {
+                        'role': 'user',
+                        'content': prompt
+                    }
+                ],
+                'temperature': 0.1,
+                'max_tokens': 1000,
+                'response_format': {'type': 'json_object'}
+            }
+            
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload
+            ) as response:
                 
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
+                if response.status == 200:
+                    result = await response.json()
                     
-                    if response.status == 200:
-                        result = await response.json()
+                    if 'choices' in result and len(result['choices']) > 0:
+                        content = result['choices'][0]['message']['content']
                         
-                        if 'choices' in result and len(result['choices']) > 0:
-                            content = result['choices'][0]['message']['content']
-                            
-                            try:
-                                parsed = json.loads(content)
-                                return parsed.get('requirements', [])
-                            except json.JSONDecodeError:
-                                pass
-                    
-                    # Fallback if API call fails
-                    return self._extract_requirements_fallback(job_description)
-                    
+                        try:
+                            parsed = json.loads(content)
+                            return parsed.get('requirements', [])
+                        except json.JSONDecodeError:
+                            pass
+                
+                # Fallback if API call fails
+                return self._extract_requirements_fallback(job_description)
+                
         except Exception as e:
             print(f"Error extracting requirements: {str(e)}")
             return self._extract_requirements_fallback(job_description)
@@ -298,67 +347,43 @@ Return a JSON array of requirement strings:
         """Fallback requirement extraction using comprehensive patterns"""
         
         requirements = []
-        text = job_description.lower()
+        try:
+            with regex_registry.budget():
+                self._match_requirements(job_description, requirements)
+        except RegexBudgetExceeded as e:
+            print(f"Stopping rule-based requirement extraction early: {str(e)}")
         
-        # Comprehensive technical skills
-        tech_skills = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin',
-            'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell scripting', 'bash', 'powershell',
-            # Web Technologies
-            'react', 'angular', 'vue', 'node.js', 'express', 'fastapi', 'django', 'flask',
-            'html', 'css', 'bootstrap', 'tailwind', 'sass', 'less', 'webpack', 'vite',
-            'next.js', 'nuxt.js', 'svelte', 'jquery', 'redux', 'graphql', 'rest api',
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-            'oracle', 'sqlite', 'mariadb', 'dynamodb', 'neo4j', 'influxdb',
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible',
-            'jenkins', 'gitlab ci', 'github actions', 'ci/cd', 'microservices',
-            # AI/ML
-            'machine learning', 'deep learning', 'ai', 'nlp', 'computer vision',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            # Tools & Platforms
-            'git', 'github', 'gitlab', 'jira', 'confluence', 'slack', 'agile', 'scrum',
-            # Mobile & Others
-            'android', 'ios', 'react native', 'flutter', 'xamarin'
-        ]
+        # Remove duplicates and limit
+        unique_requirements = []
+        seen = set()
+        for req in requirements:
+            req_lower = req.lower()
+            if req_lower not in seen:
+                seen.add(req_lower)
+                unique_requirements.append(req)
         
-        # Extract technical skills requirements
-        for skill in tech_skills:
-            if skill in text:
-                requirements.append(f"Experience with {skill.title()}")
+        return unique_requirements[:20]  # Increased limit to 20
+    
+    def _match_requirements(self, job_description: str, requirements: List[str]):
+        """Append pattern-based requirements, in place so partial results survive a budget overrun"""
         
-        # Extract experience requirements using patterns
-        import re
+        text = job_description.lower()
         
-        # Years of experience patterns
-        experience_patterns = [
-            r'(\d+)\+?\s*(?:to\s+\d+\s*)?years?\s*(?:of\s*)?(?:experience|exp)',
-            r'minimum\s*(?:of\s*)?(\d+)\s*years?',
-            r'at\s*least\s*(\d+)\s*years?',
-            r'(\d+)\s*years?\s*(?:minimum|min)',
-            r'(\d+)\+\s*years?\s*(?:in|of|with)'
-        ]
+        # Extract technical skills requirements
+        for skill in skill_taxonomy.find(text):
+            requirements.append(f"Experience with {skill.title()}")
         
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text)
+        # Extract experience requirements using patterns
+        for pattern in _EXPERIENCE_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 years = matches[0]
                 requirements.append(f"Minimum {years} years of experience")
                 break
         
         # Education requirements
-        education_patterns = [
-            r'bachelor(?:\'s)?\s*(?:degree)?\s*(?:in\s*)?([^\n,.;]+)',
-            r'master(?:\'s)?\s*(?:degree)?\s*(?:in\s*)?([^\n,.;]+)',
-            r'phd\s*(?:in\s*)?([^\n,.;]+)',
-            r'degree\s*(?:in\s*)?([^\n,.;]+)',
-            r'(?:bs|ba|ms|ma|phd)\s*(?:in\s*)?([^\n,.;]+)'
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _EDUCATION_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 field = matches[0].strip()
                 if field and len(field) < 50:
@@ -366,15 +391,8 @@ Return a JSON array of requirement strings:
                 break
         
         # Certification requirements
-        cert_patterns = [
-            r'(aws|azure|gcp|google)\s*certified',
-            r'(cissp|cisa|cism|pmp|scrum\s*master)',
-            r'certified\s*(?:in\s*)?([^\n,.;]+)',
-            r'certification\s*(?:in\s*)?([^\n,.;]+)'
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _CERTIFICATION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, str):
                     requirements.append(f"Certification: {match.title()}")
@@ -383,29 +401,15 @@ Return a JSON array of requirement strings:
                     requirements.append(f"Certification: {cert_name.title()}")
         
         # Soft skills and requirements
-        soft_skills_patterns = [
-            r'(?:strong|excellent|good)\s*(?:communication|leadership|problem[\s-]solving|analytical|teamwork|collaboration)',
-            r'(?:ability|capable)\s*(?:to\s*)?([^\n,.;]+)',
-            r'(?:experience|skilled|proficient)\s*(?:in\s*|with\s*)?([^\n,.;]+)',
-            r'(?:knowledge|understanding)\s*(?:of\s*)?([^\n,.;]+)',
-            r'(?:familiar|comfortable)\s*(?:with\s*)?([^\n,.;]+)'
-        ]
-        
-        for pattern in soft_skills_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _SOFT_SKILL_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, str) and len(match.strip()) > 5 and len(match.strip()) < 100:
                     requirements.append(f"Requirement: {match.strip()}")
         
         # Extract bullet point requirements
-        bullet_patterns = [
-            r'[•·▪▫-]\s*([^\n\r]+)',
-            r'^\s*[*]\s*([^\n\r]+)',
-            r'^\s*\d+\.\s*([^\n\r]+)'
-        ]
-        
-        for pattern in bullet_patterns:
-            matches = re.findall(pattern, job_description, re.MULTILINE)
+        for pattern in _BULLET_PATTERNS:
+            matches = pattern.findall(job_description)
             for match in matches:
                 match = match.strip()
                 if len(match) > 15 and len(match) < 150:
@@ -414,26 +418,9 @@ Return a JSON array of requirement strings:
                         requirements.append(f"Requirement: {match}")
         
         # Extract specific requirement sections
-        section_patterns = [
-            r'(?:requirements?|qualifications?|skills?|experience|responsibilities)[\s:]*([^\n\r]+)',
-            r'(?:required|must\s*have|essential)[\s:]*([^\n\r]+)',
-            r'(?:preferred|nice\s*to\s*have|bonus)[\s:]*([^\n\r]+)'
-        ]
-        
-        for pattern in section_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _SECTION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 match = match.strip()
                 if len(match) > 10 and len(match) < 200:
                     requirements.append(f"Requirement: {match}")
-        
-        # Remove duplicates and limit
-        unique_requirements = []
-        seen = set()
-        for req in requirements:
-            req_lower = req.lower()
-            if req_lower not in seen:
-                seen.add(req_lower)
-                unique_requirements.append(req)
-        
-        return unique_requirements[:20]  # Increased limit to 20
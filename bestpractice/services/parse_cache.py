@@ -0,0 +1,231 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from bestpractice.config import settings
+from bestpractice.utils.execution import execution_pool
+
+class ParseCache:
+    """Content-addressed cache of parsed documents with an in-memory LRU tier and an on-disk tier"""
+
+    def __init__(
+        self,
+        memory_items: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.enabled = settings.PARSE_CACHE_ENABLED
+        self.memory_items = memory_items if memory_items is not None else settings.PARSE_CACHE_MEMORY_ITEMS
+        self.cache_dir = cache_dir if cache_dir is not None else settings.PARSE_CACHE_DIR
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else settings.PARSE_CACHE_MAX_BYTES
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.PARSE_CACHE_TTL_SECONDS
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'puts': 0,
+            'expired': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0
+        }
+
+    @staticmethod
+    def make_key(file_content: bytes, options: Dict[str, Any]) -> str:
+        """
+        Build a cache key from the file bytes and the options that affect parsing
+
+        Args:
+            file_content: Raw file bytes
+            options: Parse options (parser, language, instructions, ...)
+
+        Returns:
+            Hex SHA-256 cache key
+        """
+        content_hash = hashlib.sha256(file_content).hexdigest()
+        options_blob = json.dumps(options, sort_keys=True)
+        return hashlib.sha256(f"{content_hash}:{options_blob}".encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a parsed document, memory tier first
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Parse result dict, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if self._is_expired(stored_at):
+                del self._memory[key]
+                self._stats['expired'] += 1
+            else:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return self._copy_result(value, 'memory')
+
+        if self.cache_dir:
+            disk_entry = await execution_pool.run_in_thread("parse_cache_read", self._read_disk, key)
+            if disk_entry is not None:
+                stored_at, value = disk_entry
+                self._put_memory(key, stored_at, value)
+                self._stats['disk_hits'] += 1
+                return self._copy_result(value, 'disk')
+
+        self._stats['misses'] += 1
+        return None
+
+    async def put(self, key: str, value: Dict[str, Any]):
+        """
+        Store a parse result in both tiers
+
+        Args:
+            key: Key from make_key
+            value: Parse result dict with 'text' and 'metadata'
+        """
+        if not self.enabled:
+            return
+
+        stored_at = time.time()
+        self._put_memory(key, stored_at, value)
+        self._stats['puts'] += 1
+
+        if self.cache_dir:
+            await execution_pool.run_in_thread("parse_cache_write", self._write_disk, key, stored_at, value)
+
+    def _put_memory(self, key: str, stored_at: float, value: Dict[str, Any]):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+            self._stats['memory_evictions'] += 1
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds
+
+    @staticmethod
+    def _copy_result(value: Dict[str, Any], tier: str) -> Dict[str, Any]:
+        """Return a copy so callers can't mutate cached metadata"""
+        return {
+            **value,
+            'metadata': {**value.get('metadata', {}), 'cache': tier}
+        }
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Read an entry from disk, dropping it if expired or unreadable"""
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Error reading parse cache entry {key}: {str(e)}")
+            self._remove_disk_file(path)
+            return None
+
+        stored_at = entry.get('stored_at', 0.0)
+        if self._is_expired(stored_at):
+            self._stats['expired'] += 1
+            self._remove_disk_file(path)
+            return None
+
+        return stored_at, entry.get('value', {})
+
+    def _write_disk(self, key: str, stored_at: float, value: Dict[str, Any]):
+        """Atomically write an entry to disk and evict old entries over the size budget"""
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            blob = json.dumps({'stored_at': stored_at, 'value': value}).encode('utf-8')
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(blob)
+
+            with self._disk_lock:
+                self._ensure_disk_bytes()
+                previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(temp_path, path)
+                self._disk_bytes += len(blob) - previous_size
+                if self._disk_bytes > self.max_disk_bytes:
+                    self._evict_disk()
+        except OSError as e:
+            print(f"Error writing parse cache entry {key}: {str(e)}")
+
+    def _scan_disk(self):
+        """List (mtime, size, path) for every cache file"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _ensure_disk_bytes(self):
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+
+    def _evict_disk(self):
+        """Remove expired entries, then the oldest ones, until under 90% of the budget"""
+        target = int(self.max_disk_bytes * 0.9)
+        now = time.time()
+        for mtime, size, path in sorted(self._scan_disk()):
+            if self._disk_bytes <= target and not (self.ttl_seconds > 0 and now - mtime > self.ttl_seconds):
+                break
+            if self._remove_disk_file(path):
+                self._disk_bytes -= size
+                self._stats['disk_evictions'] += 1
+
+    @staticmethod
+    def _remove_disk_file(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def clear(self):
+        """Drop the in-memory tier"""
+        self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats['memory_hits'] + self._stats['disk_hits'] + self._stats['misses']
+        hits = self._stats['memory_hits'] + self._stats['disk_hits']
+        return {
+            **self._stats,
+            "enabled": self.enabled,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "memory_capacity": self.memory_items,
+            "disk_enabled": bool(self.cache_dir),
+            "disk_bytes": self._disk_bytes,
+            "disk_capacity_bytes": self.max_disk_bytes
+        }
+
+
+# Create global parse cache instance
+parse_cache = ParseCache()
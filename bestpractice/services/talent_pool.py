@@ -0,0 +1,400 @@
+import os
+import json
+import time
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from bestpractice.config import settings
+from bestpractice.services.vector_store import VectorStore
+
+try:
+    import fcntl
+except ImportError:  # Windows: manifest updates are only safe from a single process
+    fcntl = None
+
+MANIFEST_FILENAME = 'manifest.json'
+LOCK_FILENAME = '.lock'
+
+
+class TalentPool:
+    """
+    Persistent pool of resume chunk embeddings shared by every worker
+
+    The pool is a list of immutable segments, each a VectorStore saved to its
+    own directory and opened memory-mapped, so workers on one host share the
+    vectors through the page cache instead of each holding a private copy.
+    New chunks go to an in-memory tail that flush() writes out as a new
+    segment; other workers pick it up on their next search. Row ids are
+    global: a segment's rows follow those of the segments before it.
+    Segments are indexed as VECTOR_INDEX_TYPE when written, so with 'auto'
+    small flushes stay exact and compact() builds an approximate index once
+    the pool is large.
+    """
+
+    def __init__(self, path: Optional[str] = None, dimension: Optional[int] = None, mmap: Optional[bool] = None):
+        """
+        Args:
+            path: Pool directory (defaults to TALENT_POOL_DIR)
+            dimension: Embedding dimension (defaults to VECTOR_DIMENSION)
+            mmap: Memory-map segments (defaults to TALENT_POOL_MMAP)
+        """
+        self.path = path if path is not None else settings.TALENT_POOL_DIR
+        self.dimension = dimension or settings.VECTOR_DIMENSION
+        self.mmap = settings.TALENT_POOL_MMAP if mmap is None else mmap
+        self.flush_rows = settings.TALENT_POOL_FLUSH_ROWS
+        self._segments: List[Tuple[str, VectorStore]] = []
+        self._offsets: List[int] = []  # global id of each segment's first row
+        self._tail: Optional[VectorStore] = None
+        self._manifest_mtime: Optional[float] = None
+        # Candidate of every row as an integer code, for vectorized aggregation
+        self._candidate_ids: List[str] = []
+        self._candidate_codes: Dict[str, int] = {}
+        self._segment_candidates = np.empty(0, dtype=np.int32)
+        self._tail_candidates: List[int] = []
+        self._lock = threading.RLock()
+        self.load_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    @property
+    def ntotal(self) -> int:
+        """Rows in flushed segments plus the unflushed tail"""
+        return self._segment_rows() + (self._tail.next_id if self._tail is not None else 0)
+
+    def _segment_rows(self) -> int:
+        if not self._segments:
+            return 0
+        return self._offsets[-1] + self._segments[-1][1].next_id
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.path, MANIFEST_FILENAME)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self._manifest_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'dimension': self.dimension, 'segments': [], 'next_segment': 0}
+
+    @staticmethod
+    def _new_segment_name(manifest: Dict[str, Any]) -> str:
+        """Segment names are never reused, so a worker can't confuse a new segment with a removed one"""
+        name = f"segment-{manifest['next_segment']:05d}"
+        manifest['next_segment'] += 1
+        return name
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Serialize manifest updates across processes"""
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, LOCK_FILENAME), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def open(self):
+        """Open every segment listed in the manifest (blocking); safe to call again to pick up new segments"""
+        if not self.enabled:
+            return
+        started = time.perf_counter()
+        with self._lock:
+            try:
+                mtime = os.stat(self._manifest_path()).st_mtime
+            except FileNotFoundError:
+                return
+            manifest = self._read_manifest()
+            if manifest['dimension'] != self.dimension:
+                raise ValueError(f"Talent pool at {self.path} has dimension {manifest['dimension']}, expected {self.dimension}")
+
+            opened = {name: store for name, store in self._segments}
+            segments, offsets, candidates, offset = [], [], [], 0
+            for entry in manifest['segments']:
+                name = entry['name']
+                store = opened.get(name) or VectorStore.open(os.path.join(self.path, name), mmap=self.mmap)
+                segments.append((name, store))
+                offsets.append(offset)
+                offset += store.next_id
+                # Translate the segment's interned candidate ids to pool codes; -1 stays -1
+                codes, strings = store.string_codes('candidate_id')
+                table = np.array([self._candidate_code(string) for string in strings] + [-1], dtype=np.int32)
+                candidates.append(table[codes])
+
+            self._segments, self._offsets = segments, offsets
+            self._segment_candidates = np.concatenate(candidates) if candidates else np.empty(0, dtype=np.int32)
+            self._manifest_mtime = mtime
+        self.load_seconds = time.perf_counter() - started
+        print(f"Opened talent pool with {len(self._segments)} segments and {self._segment_rows()} rows in {self.load_seconds:.3f}s")
+
+    def refresh(self):
+        """Reopen if another process flushed new segments"""
+        if not self.enabled:
+            return
+        try:
+            mtime = os.stat(self._manifest_path()).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._manifest_mtime:
+            self.open()
+
+    def add_resume(
+        self,
+        candidate_id: str,
+        chunks: List[str],
+        embeddings: np.ndarray,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Append a resume's chunks; they are persisted by the next flush
+
+        Args:
+            candidate_id: Identifier stored with every chunk
+            chunks: Resume chunks
+            embeddings: (len(chunks), dimension) embeddings
+            metadata: Extra metadata stored with every chunk (filename, ...)
+        """
+        if not chunks:
+            return
+        with self._lock:
+            if self._tail is None:
+                self._tail = VectorStore(self.dimension)
+            self._tail.add_documents(chunks, embeddings, [
+                {**(metadata or {}), 'type': 'resume', 'candidate_id': candidate_id, 'chunk_index': i}
+                for i in range(len(chunks))
+            ])
+            self._tail_candidates.extend([self._candidate_code(candidate_id)] * len(chunks))
+            if self.flush_rows and self._tail.next_id >= self.flush_rows:
+                self.flush()
+
+    def flush(self):
+        """Write the tail as a new segment and memory-map it (blocking)"""
+        with self._lock:
+            if not self.enabled or self._tail is None or self._tail.next_id == 0:
+                return
+            with self._file_lock():
+                manifest = self._read_manifest()
+                name = self._new_segment_name(manifest)
+                self._tail.reindex()
+                self._tail.save(os.path.join(self.path, name))
+                manifest['segments'].append({'name': name, 'rows': self._tail.next_id})
+                self._write_manifest(manifest)
+            self._tail = None
+            self._tail_candidates = []
+            self.open()
+
+    def _candidate_code(self, candidate_id: Optional[str]) -> int:
+        """Intern a candidate id, -1 for rows without one"""
+        if candidate_id is None:
+            return -1
+        code = self._candidate_codes.get(candidate_id)
+        if code is None:
+            code = self._candidate_codes[candidate_id] = len(self._candidate_ids)
+            self._candidate_ids.append(candidate_id)
+        return code
+
+    def _candidates_of(self, ids: np.ndarray) -> np.ndarray:
+        """Candidate codes of global row ids"""
+        with self._lock:
+            segment_candidates = self._segment_candidates
+            tail_candidates = np.asarray(self._tail_candidates, dtype=np.int32)
+        in_segments = ids < len(segment_candidates)
+        codes = np.full(ids.shape, -1, dtype=np.int32)
+        codes[in_segments] = segment_candidates[ids[in_segments]]
+        tail_ids = ids[~in_segments] - len(segment_candidates)
+        known = tail_ids < len(tail_candidates)
+        codes[np.flatnonzero(~in_segments)[known]] = tail_candidates[tail_ids[known]]
+        return codes
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        manifest_path = self._manifest_path()
+        with open(f"{manifest_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    def search_batch(self, query_embeddings: np.ndarray, k: int = 5, filters: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search every segment and merge the results
+
+        Args:
+            query_embeddings: (n_queries, dimension) array
+            k: Results per query
+            filters: Metadata filters applied before scoring (see VectorStore.search_batch)
+
+        Returns:
+            (scores, global ids) arrays of shape (n_queries, k); missing results have id -1
+        """
+        self.refresh()
+        queries = np.atleast_2d(query_embeddings)
+        with self._lock:
+            segments = list(zip(self._offsets, (store for _, store in self._segments)))
+
+        results = []
+        # Segments are immutable, so they are searched without holding the lock
+        for offset, store in segments:
+            results.append((offset, *store.search_batch(queries, k, filters=filters)))
+        with self._lock:
+            if self._tail is not None and self._tail.next_id:
+                results.append((self._segment_rows(), *self._tail.search_batch(queries, k, filters=filters)))
+
+        if not results:
+            return np.full((len(queries), k), -np.inf, dtype=np.float32), np.full((len(queries), k), -1, dtype=np.int64)
+
+        scores = np.concatenate([np.where(ids >= 0, scores, -np.inf) for _, scores, ids in results], axis=1)
+        ids = np.concatenate([np.where(ids >= 0, ids + offset, -1) for offset, _, ids in results], axis=1)
+        if len(results) > 1:
+            top = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+            scores = np.take_along_axis(scores, top, axis=1)
+            ids = np.take_along_axis(ids, top, axis=1)
+        return scores, ids
+
+    def search_candidates(
+        self,
+        requirement_embeddings: np.ndarray,
+        top_k: int = 10,
+        chunks_per_requirement: Optional[int] = None,
+        aggregation: str = 'max',
+        chunk_k: int = 3,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidates by how well their chunks cover a set of requirements
+
+        Each requirement retrieves its nearest chunks from the whole pool. Hits
+        are grouped per (requirement, candidate) and reduced to one score,
+        either the best chunk or the mean of the candidate's best chunk_k
+        chunks; a candidate's score is the mean over all requirements, with 0
+        for requirements none of its chunks were retrieved for.
+
+        Args:
+            requirement_embeddings: (n_requirements, dimension) array
+            top_k: Candidates to return
+            chunks_per_requirement: Chunks retrieved per requirement (defaults to TALENT_POOL_CHUNKS_PER_REQUIREMENT)
+            aggregation: 'max' or 'mean_top_k'
+            chunk_k: Chunks averaged per requirement with 'mean_top_k'
+            filters: Only consider chunks whose metadata matches, e.g. {'candidate_id': shortlist}
+
+        Returns:
+            Candidates ranked by score, each with candidate_id, score, coverage
+            (share of requirements scoring at least SIMILARITY_THRESHOLD) and
+            per-requirement scores
+        """
+        if aggregation not in ('max', 'mean_top_k'):
+            raise ValueError(f"Unknown aggregation: {aggregation}")
+        requirement_embeddings = np.atleast_2d(requirement_embeddings)
+        n_requirements = len(requirement_embeddings)
+        if n_requirements == 0 or self.ntotal == 0:
+            return []
+
+        scores, ids = self.search_batch(requirement_embeddings, chunks_per_requirement or settings.TALENT_POOL_CHUNKS_PER_REQUIREMENT, filters=filters)
+
+        # Flatten hits to parallel (requirement, candidate, score) arrays
+        requirement_of_hit = np.broadcast_to(np.arange(n_requirements)[:, None], ids.shape)
+        valid = ids >= 0
+        requirements, codes, hit_scores = requirement_of_hit[valid], self._candidates_of(ids[valid]), scores[valid]
+        known = codes >= 0
+        requirements, codes, hit_scores = requirements[known], codes[known], hit_scores[known]
+        if hit_scores.size == 0:
+            return []
+
+        candidate_codes, columns = np.unique(codes, return_inverse=True)
+        matrix = np.zeros((n_requirements, len(candidate_codes)), dtype=np.float32)
+
+        if aggregation == 'max':
+            matrix.fill(-np.inf)
+            np.maximum.at(matrix, (requirements, columns), hit_scores)
+            matrix[np.isneginf(matrix)] = 0.0
+        else:
+            # Rank hits inside each (requirement, candidate) group, best first
+            order = np.lexsort((-hit_scores, columns, requirements))
+            requirements, columns, hit_scores = requirements[order], columns[order], hit_scores[order]
+            group_start = np.r_[True, (requirements[1:] != requirements[:-1]) | (columns[1:] != columns[:-1])]
+            group_first = np.flatnonzero(group_start)
+            rank = np.arange(len(hit_scores)) - group_first[np.cumsum(group_start) - 1]
+            top = rank < chunk_k
+
+            sums = np.zeros_like(matrix)
+            counts = np.zeros_like(matrix)
+            np.add.at(sums, (requirements[top], columns[top]), hit_scores[top])
+            np.add.at(counts, (requirements[top], columns[top]), 1)
+            np.divide(sums, counts, out=matrix, where=counts > 0)
+
+        candidate_scores = matrix.mean(axis=0)
+        coverage = (matrix >= settings.SIMILARITY_THRESHOLD).mean(axis=0)
+
+        if len(candidate_scores) > top_k:
+            best = np.argpartition(-candidate_scores, top_k - 1)[:top_k]
+        else:
+            best = np.arange(len(candidate_scores))
+        best = best[np.argsort(-candidate_scores[best], kind='stable')]
+
+        with self._lock:
+            candidate_ids = [self._candidate_ids[code] for code in candidate_codes[best]]
+        return [
+            {
+                'candidate_id': candidate_id,
+                'score': round(float(candidate_scores[column]), 4),
+                'coverage': round(float(coverage[column]), 4),
+                'requirement_scores': [round(float(score), 4) for score in matrix[:, column]]
+            }
+            for candidate_id, column in zip(candidate_ids, best)
+        ]
+
+    def get_row(self, row_id: int) -> Tuple[str, Dict[str, Any]]:
+        """Text and metadata of a global row id"""
+        with self._lock:
+            stores = list(zip(self._offsets, (store for _, store in self._segments)))
+            if self._tail is not None:
+                stores.append((self._segment_rows(), self._tail))
+            for offset, store in reversed(stores):
+                if 0 <= row_id - offset < store.next_id:
+                    local_id = row_id - offset
+                    return store.get_text(local_id), store.get_metadata(local_id)
+        raise IndexError(f"Row {row_id} is not in the talent pool")
+
+    def compact(self):
+        """Merge all segments into one and reindex it, reading them into memory (blocking; run offline)"""
+        with self._lock:
+            self.flush()
+            with self._file_lock():
+                # Merge the segments on disk, including any another process flushed since this one last opened
+                manifest = self._read_manifest()
+                old_names = [entry['name'] for entry in manifest['segments']]
+                if len(old_names) <= 1:
+                    return
+                merged = VectorStore(self.dimension)
+                for old_name in old_names:
+                    merged.merge_from(VectorStore.open(os.path.join(self.path, old_name), mmap=False))
+                merged.reindex()
+
+                name = self._new_segment_name(manifest)
+                merged.save(os.path.join(self.path, name))
+                manifest['segments'] = [{'name': name, 'rows': merged.next_id}]
+                self._write_manifest(manifest)
+            self.open()
+            # Workers still mapping old segments keep their pages until they refresh
+            for old_name in old_names:
+                shutil.rmtree(os.path.join(self.path, old_name), ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "mmap": self.mmap,
+            "segments": len(self._segments),
+            "index_types": sorted({store.index_type for _, store in self._segments}),
+            "rows": self._segment_rows(),
+            "candidates": len(self._candidate_ids),
+            "unflushed_rows": self.ntotal - self._segment_rows(),
+            "load_seconds": self.load_seconds
+        }
+
+
+# Create global talent pool instance (opened at startup)
+talent_pool = TalentPool()
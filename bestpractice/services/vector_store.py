@@ -1,61 +1,757 @@
+import os
+import sys
+import json
+import math
 import faiss
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, Sequence
+from bestpractice.config import settings
+
+INDEX_FILENAME = 'index.faiss'
+ROWS_FILENAME = 'rows.json'  # next id, string tables and irregular metadata
+COLUMNS_FILENAME = 'columns.npz'
+TEXTS_FILENAME = 'texts.npy'
+TEXT_OFFSETS_FILENAME = 'text_offsets.npy'
+
+# Integer metadata columns are int32; this value marks rows without one
+_MISSING_INT = np.iinfo(np.int32).min
+
+# Map flat vectors straight from the page cache where this FAISS build supports it;
+# plain IO_FLAG_MMAP still copies flat indexes into private memory
+_MMAP_FLAGS = getattr(faiss, 'IO_FLAG_MMAP_IFC', faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+
+INDEX_TYPES = ('flat', 'ivf_flat', 'hnsw', 'ivf_pq')
+
+# k-means wants ~39 points per centroid; PQ codebooks have 256 centroids each
+_TRAIN_POINTS_PER_CENTROID = 39
+_PQ_CENTROIDS = 256
+
+
+def _ivf_lists(n_vectors: int) -> int:
+    """Inverted lists for an IVF index over n_vectors (~4 * sqrt(n), enough points to train each)"""
+    return max(1, min(int(4 * math.sqrt(n_vectors)), n_vectors // _TRAIN_POINTS_PER_CENTROID))
+
+
+def _pq_subquantizers(dimension: int) -> int:
+    """IVF_PQ_M, or the divisor of the dimension closest to dimension / 8"""
+    if settings.IVF_PQ_M:
+        return settings.IVF_PQ_M
+    divisors = [m for m in range(1, dimension + 1) if dimension % m == 0]
+    return min(divisors, key=lambda m: abs(m - dimension / 8))
+
+
+def estimate_index_bytes(index_type: str, dimension: int, n_vectors: int) -> int:
+    """Approximate memory of an index type holding n_vectors, excluding texts and metadata"""
+    if index_type == 'flat':
+        return n_vectors * (dimension * 4 + 8)
+    if index_type == 'hnsw':
+        # Full vectors plus 2 * M neighbour ids on the base layer
+        return n_vectors * (dimension * 4 + settings.HNSW_M * 2 * 4 + 8)
+    centroids = _ivf_lists(n_vectors) * dimension * 4
+    if index_type == 'ivf_flat':
+        return centroids + n_vectors * (dimension * 4 + 8)
+    if index_type == 'ivf_pq':
+        m = _pq_subquantizers(dimension)
+        return centroids + _PQ_CENTROIDS * dimension * 4 + n_vectors * (m + 8)
+    raise ValueError(f"Unknown index type: {index_type}")
+
+
+def choose_index_type(dimension: int, n_vectors: int, memory_budget_bytes: Optional[int] = None) -> str:
+    """
+    Pick an index for a corpus size and memory budget
+
+    Exact search up to VECTOR_INDEX_FLAT_MAX_ROWS, then the most accurate
+    approximate index that fits the budget: HNSW, IVF-Flat, and IVF-PQ when
+    full vectors don't fit at all.
+
+    Args:
+        dimension: Embedding dimension
+        n_vectors: Rows to index
+        memory_budget_bytes: Defaults to VECTOR_INDEX_MEMORY_BUDGET_MB, 0 means unlimited
+
+    Returns:
+        One of INDEX_TYPES
+    """
+    if memory_budget_bytes is None:
+        memory_budget_bytes = settings.VECTOR_INDEX_MEMORY_BUDGET_MB * 1024 * 1024
+    if n_vectors <= settings.VECTOR_INDEX_FLAT_MAX_ROWS and (
+            not memory_budget_bytes or estimate_index_bytes('flat', dimension, n_vectors) <= memory_budget_bytes):
+        return 'flat'
+    if n_vectors < _PQ_CENTROIDS:
+        return 'flat'
+    for index_type in ('hnsw', 'ivf_flat'):
+        if not memory_budget_bytes or estimate_index_bytes(index_type, dimension, n_vectors) <= memory_budget_bytes:
+            return index_type
+    return 'ivf_pq'
+
+
+def build_index(index_type: str, dimension: int, n_vectors: int) -> faiss.Index:
+    """
+    Create an empty inner-product index sized for n_vectors
+
+    Every type accepts add_with_ids: IVF indexes store ids natively, flat and
+    HNSW indexes are wrapped in an IndexIDMap. IVF indexes still need
+    training (see VectorStore.reindex).
+
+    Args:
+        index_type: One of INDEX_TYPES
+        dimension: Embedding dimension
+        n_vectors: Rows the index will hold, sizes the IVF lists
+
+    Returns:
+        FAISS index
+    """
+    if index_type == 'flat':
+        # Inner product (cosine after normalization)
+        return faiss.index_factory(dimension, "IDMap,Flat", faiss.METRIC_INNER_PRODUCT)
+    if index_type == 'hnsw':
+        return faiss.index_factory(dimension, f"IDMap,HNSW{settings.HNSW_M},Flat", faiss.METRIC_INNER_PRODUCT)
+    if index_type == 'ivf_flat':
+        return faiss.index_factory(dimension, f"IVF{_ivf_lists(n_vectors)},Flat", faiss.METRIC_INNER_PRODUCT)
+    if index_type == 'ivf_pq':
+        return faiss.index_factory(dimension, f"IVF{_ivf_lists(n_vectors)},PQ{_pq_subquantizers(dimension)}", faiss.METRIC_INNER_PRODUCT)
+    raise ValueError(f"Unknown index type: {index_type}")
+
+
+def _bitmap_selector(mask: np.ndarray) -> faiss.IDSelector:
+    """Selector admitting the ids whose mask entry is True"""
+    bits = np.packbits(mask, bitorder='little')
+    selector = faiss.IDSelectorBitmap(len(mask), faiss.swig_ptr(bits))
+    selector.referenced_objects = [bits]  # FAISS only keeps a pointer to the bitmap
+    return selector
+
+
+def index_type_of(index: faiss.Index) -> str:
+    """Index type name of an existing FAISS index"""
+    if isinstance(index, faiss.IndexIDMap):
+        index = faiss.downcast_index(index.index)
+    if isinstance(index, faiss.IndexHNSW):
+        return 'hnsw'
+    if isinstance(index, faiss.IndexIVFPQ):
+        return 'ivf_pq'
+    if isinstance(index, faiss.IndexIVF):
+        return 'ivf_flat'
+    return 'flat'
+
+
+class _GrowableArray:
+    """NumPy array with amortized appends; new slots start as fill"""
+
+    __slots__ = ('_data', 'size', 'fill')
+
+    def __init__(self, dtype: Any, fill: Any = 0, values: Optional[np.ndarray] = None):
+        self._data = np.empty(0, dtype=dtype) if values is None else values
+        self.size = len(self._data)
+        self.fill = fill
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[:self.size]
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def resize(self, size: int):
+        """Grow to size slots, doubling the capacity when it runs out"""
+        if size > len(self._data):
+            data = np.full(max(size, 2 * len(self._data), 16), self.fill, dtype=self._data.dtype)
+            data[:self.size] = self._data[:self.size]
+            self._data = data
+        self.size = max(self.size, size)
+
+    def extend(self, values: np.ndarray):
+        start = self.size
+        self.resize(start + len(values))
+        self._data[start:self.size] = values
+
+
+class _StringColumn:
+    """String metadata values interned per key: one int32 code per row, -1 where missing"""
+
+    __slots__ = ('codes', 'strings', 'lookup')
+
+    def __init__(self, strings: Optional[List[str]] = None, codes: Optional[np.ndarray] = None):
+        self.strings: List[str] = list(strings or [])
+        self.lookup: Dict[str, int] = {string: code for code, string in enumerate(self.strings)}
+        self.codes = _GrowableArray(np.int32, -1, codes)
+
+    def intern(self, value: str) -> int:
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sys.getsizeof(self.lookup) + sum(sys.getsizeof(string) for string in self.strings)
+
 
 class VectorStore:
-    """FAISS-based vector store for similarity search"""
+    """
+    FAISS-based vector store for similarity search
+
+    Rows are kept in columns rather than per-row Python objects: texts are
+    one UTF-8 blob indexed by start/end offsets, string metadata values are
+    interned per key into int32 code arrays, and small integers (chunk
+    indexes) are int32 arrays. Metadata values that fit neither, such as
+    floats or lists, are kept per row. Row ids are assigned sequentially and
+    stored in the index, so deleting or updating rows leaves every other id
+    unchanged.
+    """
 
-    def __init__(self, dimension: int = 384):
+    def __init__(self, dimension: int = 384, index: Optional[faiss.Index] = None, read_only: bool = False):
+        """
+        Args:
+            dimension: Embedding dimension
+            index: Existing FAISS index to wrap (see open); a new flat index by
+                default, which reindex can turn into an approximate one
+            read_only: Refuse additions, e.g. because the index is memory-mapped
+        """
         self.dimension = dimension
-        self.index = faiss.IndexFlatIP(dimension)  # Inner product (cosine after normalization)
-        self.texts: List[str] = []
-        self.metadata: List[Dict[str, Any]] = []
+        self.index = index if index is not None else build_index('flat', dimension, 0)
+        self.index_type = index_type_of(self.index)
+        self.read_only = read_only
+        self.nprobe = settings.IVF_NPROBE
+        self.ef_search = settings.HNSW_EF_SEARCH
+        self._reset_rows()
         print(f"Initialized FAISS vector store with dimension {self.dimension}")
 
-    def add_documents(self, texts: List[str], embeddings: np.ndarray, metadata: List[Dict[str, Any]] = None):
-        if len(texts) != embeddings.shape[0]:
-            raise ValueError("Number of texts and embeddings must match")
-        
-        # Normalize embeddings for cosine similarity
+    def _reset_rows(self):
+        self._text_blob = _GrowableArray(np.uint8)
+        self._text_starts = _GrowableArray(np.int64)
+        self._text_ends = _GrowableArray(np.int64)
+        self._deleted = _GrowableArray(np.bool_, False)
+        self._string_columns: Dict[str, _StringColumn] = {}
+        self._int_columns: Dict[str, _GrowableArray] = {}
+        self._irregular: Dict[int, Dict[str, Any]] = {}  # metadata values that fit no column
+
+    @property
+    def next_id(self) -> int:
+        """Id the next added row gets; deleted rows keep their ids, so this can exceed the row count"""
+        return self._deleted.size
+
+    def _check_writable(self):
+        if self.read_only:
+            # FAISS aborts the process when adding to a memory-mapped flat index
+            raise ValueError("Vector store is read-only (memory-mapped); open it with mmap=False to modify it")
+
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Normalize embeddings for cosine similarity"""
+        embeddings = np.atleast_2d(embeddings).astype(np.float32)
         norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        normalized_embeddings = embeddings / norms
+        return embeddings / np.where(norms == 0, 1, norms)
 
-        self.index.add(normalized_embeddings.astype(np.float32))
-        self.texts.extend(texts)
+    def add_documents(self, texts: List[str], embeddings: np.ndarray, metadata: List[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Add rows
 
-        if metadata:
-            self.metadata.extend(metadata)
-        else:
-            self.metadata.extend([{} for _ in texts])
+        Args:
+            texts: Row texts
+            embeddings: (len(texts), dimension) embeddings
+            metadata: Metadata dict per row
+
+        Returns:
+            Ids assigned to the rows
+        """
+        self._check_writable()
+        if len(texts) != embeddings.shape[0]:
+            raise ValueError("Number of texts and embeddings must match")
+
+        ids = np.arange(self.next_id, self.next_id + len(texts), dtype=np.int64)
+        self.index.add_with_ids(self._normalize(embeddings), ids)
+        self._append_rows(texts, metadata or [{} for _ in texts])
 
         print(f"Added {len(texts)} documents to FAISS vector store")
+        return ids
+
+    def update_document(self, row_id: int, text: str, embedding: np.ndarray, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Replace a row's text, embedding and metadata, keeping its id
+
+        Args:
+            row_id: Id returned by add_documents
+            text: New text
+            embedding: New embedding
+            metadata: New metadata (replaces the old metadata)
+        """
+        self._check_writable()
+        if not 0 <= row_id < self.next_id or self._deleted.values[row_id]:
+            raise KeyError(f"Row {row_id} is not in the vector store")
+
+        ids = np.array([row_id], dtype=np.int64)
+        self._remove_from_index(ids)
+        self.index.add_with_ids(self._normalize(embedding), ids)
+
+        # The old text stays in the blob until the store is saved
+        encoded = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        self._text_starts.values[row_id] = self._text_blob.size
+        self._text_blob.extend(encoded)
+        self._text_ends.values[row_id] = self._text_blob.size
+        self._clear_metadata(ids)
+        self._set_metadata(row_id, [metadata or {}])
+
+    def delete_documents(self, row_ids: Sequence[int]) -> int:
+        """
+        Remove rows; other rows keep their ids
 
-    def search(self, query_embedding: np.ndarray, k: int = 5) -> List[Tuple[str, float, Dict[str, Any]]]:
+        Args:
+            row_ids: Ids returned by add_documents; unknown or deleted ids are ignored
+
+        Returns:
+            Number of rows removed
+        """
+        self._check_writable()
+        ids = np.unique(np.asarray(row_ids, dtype=np.int64))
+        ids = ids[(ids >= 0) & (ids < self.next_id)]
+        ids = ids[~self._deleted.values[ids]]
+        if len(ids) == 0:
+            return 0
+
+        self._remove_from_index(ids)
+        self._deleted.values[ids] = True
+        self._text_ends.values[ids] = self._text_starts.values[ids]
+        self._clear_metadata(ids)
+        return len(ids)
+
+    def _remove_from_index(self, ids: np.ndarray):
+        if self.index_type == 'hnsw':
+            raise ValueError("HNSW indexes can't remove vectors; reindex the store as flat or IVF first")
+        self.index.remove_ids(faiss.IDSelectorBatch(ids))
+
+    def _append_rows(self, texts: List[str], metadata: List[Dict[str, Any]]):
+        """Record texts and metadata for rows just added to the index"""
+        start_id = self.next_id
+        encoded = [text.encode('utf-8') for text in texts]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        ends = self._text_blob.size + np.cumsum(lengths)
+
+        self._text_blob.extend(np.frombuffer(b''.join(encoded), dtype=np.uint8))
+        self._text_starts.extend(ends - lengths)
+        self._text_ends.extend(ends)
+        self._deleted.resize(start_id + len(texts))
+        self._set_metadata(start_id, metadata)
+
+    def _set_metadata(self, start_id: int, metadata: List[Dict[str, Any]]):
+        """Write metadata dicts into the columns, starting at row start_id"""
+        for string_column in self._string_columns.values():
+            string_column.codes.resize(self.next_id)
+        for int_column in self._int_columns.values():
+            int_column.resize(self.next_id)
+
+        for row_id, row in enumerate(metadata, start_id):
+            for key, value in row.items():
+                if isinstance(value, str) and key not in self._int_columns:
+                    string_column = self._string_columns.get(key)
+                    if string_column is None:
+                        string_column = self._string_columns[key] = _StringColumn()
+                        string_column.codes.resize(self.next_id)
+                    string_column.codes.values[row_id] = string_column.intern(value)
+                elif (isinstance(value, int) and not isinstance(value, bool) and key not in self._string_columns
+                        and _MISSING_INT < value <= np.iinfo(np.int32).max):
+                    int_column = self._int_columns.get(key)
+                    if int_column is None:
+                        int_column = self._int_columns[key] = _GrowableArray(np.int32, _MISSING_INT)
+                        int_column.resize(self.next_id)
+                    int_column.values[row_id] = value
+                else:
+                    self._irregular.setdefault(row_id, {})[key] = value
+
+    def _clear_metadata(self, ids: np.ndarray):
+        for string_column in self._string_columns.values():
+            string_column.codes.values[ids] = -1
+        for int_column in self._int_columns.values():
+            int_column.values[ids] = _MISSING_INT
+        for row_id in ids.tolist():
+            self._irregular.pop(row_id, None)
+
+    def get_text(self, row_id: int) -> str:
+        """Text of a row ('' once deleted)"""
+        start, end = self._text_starts.values[row_id], self._text_ends.values[row_id]
+        return self._text_blob.values[start:end].tobytes().decode('utf-8')
+
+    def get_metadata(self, row_id: int) -> Dict[str, Any]:
+        """Metadata dict of a row ({} once deleted)"""
+        metadata = {}
+        for key, string_column in self._string_columns.items():
+            code = string_column.codes.values[row_id]
+            if code >= 0:
+                metadata[key] = string_column.strings[code]
+        for key, int_column in self._int_columns.items():
+            value = int_column.values[row_id]
+            if value != _MISSING_INT:
+                metadata[key] = int(value)
+        metadata.update(self._irregular.get(row_id, {}))
+        return metadata
+
+    def string_codes(self, key: str) -> Tuple[np.ndarray, List[str]]:
+        """
+        Interned values of a string metadata key, for vectorized lookups
+
+        Returns:
+            (codes, strings): one code per row id, -1 where the row has no such
+            value, and the strings the codes index
+        """
+        string_column = self._string_columns.get(key)
+        if string_column is None:
+            return np.full(self.next_id, -1, dtype=np.int32), []
+        return string_column.codes.values, string_column.strings
+
+    def _filter_mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Rows matching every filter, as a boolean mask over row ids
+
+        Args:
+            filters: Metadata key to required value; a list, tuple or set
+                matches any of its values. Rows without the key never match.
+        """
+        mask = ~self._deleted.values
+        for key, value in filters.items():
+            values = list(value) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+            key_mask = np.zeros(self.next_id, dtype=bool)
+
+            string_column = self._string_columns.get(key)
+            if string_column is not None:
+                codes = [string_column.lookup[v] for v in values if isinstance(v, str) and v in string_column.lookup]
+                key_mask |= np.isin(string_column.codes.values, codes)
+            int_column = self._int_columns.get(key)
+            if int_column is not None:
+                ints = [v for v in values if isinstance(v, int) and not isinstance(v, bool)]
+                key_mask |= np.isin(int_column.values, ints)
+            for row_id, metadata in self._irregular.items():
+                if key in metadata and metadata[key] in values:
+                    key_mask[row_id] = True
+
+            mask &= key_mask
+        return mask
+
+    def reconstruct_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stored vectors of every row in the index; approximate for IVF-PQ
+
+        Returns:
+            (ids, vectors) with normalized vectors in no particular order
+        """
         if self.index.ntotal == 0:
-            return []
+            return np.empty(0, dtype=np.int64), np.empty((0, self.dimension), dtype=np.float32)
+        if isinstance(self.index, faiss.IndexIDMap):
+            inner = faiss.downcast_index(self.index.index)
+            return faiss.vector_to_array(self.index.id_map), inner.reconstruct_n(0, inner.ntotal)
+        ids = np.flatnonzero(~self._deleted.values).astype(np.int64)
+        self.index.set_direct_map_type(faiss.DirectMap.Hashtable)
+        return ids, self.index.reconstruct_batch(ids)
+
+    def reindex(self, index_type: Optional[str] = None, memory_budget_bytes: Optional[int] = None, train_size: Optional[int] = None):
+        """
+        Rebuild the index as another type, keeping row ids
+
+        IVF quantizers are trained on a random sample of the rows. Rebuilding
+        from an IVF-PQ index starts from its lossy reconstructions.
+
+        Args:
+            index_type: One of INDEX_TYPES or 'auto' (defaults to VECTOR_INDEX_TYPE)
+            memory_budget_bytes: Budget for 'auto' (see choose_index_type)
+            train_size: Training sample size (defaults to 39 points per IVF list, at least 256 * 39 for PQ)
+        """
+        self._check_writable()
+        index_type = index_type or settings.VECTOR_INDEX_TYPE
+        n_vectors = self.index.ntotal
+        if index_type == 'auto':
+            index_type = choose_index_type(self.dimension, n_vectors, memory_budget_bytes)
+        elif index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type}")
+        if index_type in ('ivf_flat', 'ivf_pq') and n_vectors < _PQ_CENTROIDS:
+            print(f"Too few rows ({n_vectors}) to train {index_type}; keeping a flat index")
+            index_type = 'flat'
+        if index_type == self.index_type:
+            return
+
+        ids, vectors = self.reconstruct_vectors()
+        index = build_index(index_type, self.dimension, n_vectors)
+        if not index.is_trained:
+            if train_size is None:
+                train_size = _ivf_lists(n_vectors) * _TRAIN_POINTS_PER_CENTROID
+                if index_type == 'ivf_pq':
+                    train_size = max(train_size, _PQ_CENTROIDS * _TRAIN_POINTS_PER_CENTROID)
+            sample = np.random.default_rng(0).choice(n_vectors, size=min(n_vectors, train_size), replace=False)
+            index.train(vectors[np.sort(sample)])
+        index.add_with_ids(vectors, ids)
+
+        self.index = index
+        self.index_type = index_type
+        print(f"Rebuilt FAISS vector store as {index_type} over {n_vectors} documents")
+
+    def merge_from(self, other: "VectorStore") -> int:
+        """
+        Append another store's rows after this store's
+
+        Args:
+            other: Store to copy; its ids are shifted by this store's next_id
+
+        Returns:
+            The shift applied to other's ids
+        """
+        self._check_writable()
+        if other.dimension != self.dimension:
+            raise ValueError(f"Cannot merge a store of dimension {other.dimension} into {self.dimension}")
+        offset = self.next_id
+        ids, vectors = other.reconstruct_vectors()
+        self._append_rows(
+            [other.get_text(row_id) for row_id in range(other.next_id)],
+            [other.get_metadata(row_id) for row_id in range(other.next_id)]
+        )
+        self._deleted.values[offset:] = other._deleted.values
+        if len(ids):
+            self.index.add_with_ids(vectors, ids + offset)
+        return offset
+
+    def set_search_params(self, nprobe: Optional[int] = None, ef_search: Optional[int] = None):
+        """
+        Trade recall for latency on approximate indexes
+
+        Args:
+            nprobe: Inverted lists scanned per query (IVF indexes)
+            ef_search: Candidate list size per query (HNSW)
+        """
+        if nprobe is not None:
+            self.nprobe = nprobe
+        if ef_search is not None:
+            self.ef_search = ef_search
 
-        # Normalize query embedding
-        query_embedding = query_embedding / np.linalg.norm(query_embedding)
-        query_embedding = query_embedding.reshape(1, -1).astype(np.float32)
+    def _search_params(self, selector: Optional[faiss.IDSelector] = None) -> Optional[faiss.SearchParameters]:
+        """Per-query parameters for the index type; the caller keeps selector alive during the search"""
+        if self.index_type in ('ivf_flat', 'ivf_pq'):
+            params = faiss.SearchParametersIVF(nprobe=self.nprobe)
+        elif self.index_type == 'hnsw':
+            params = faiss.SearchParametersHNSW(efSearch=self.ef_search)
+        elif selector is not None:
+            params = faiss.SearchParameters()
+        else:
+            return None
+        if selector is not None:
+            params.sel = selector
+        return params
+
+    def save(self, path: str):
+        """
+        Write the index and the row columns to a directory
+
+        Texts of deleted and updated rows are dropped from the blob; ids are
+        kept as they are. Every file is written under a temporary name and
+        renamed into place, so readers never see a partially written store.
+
+        Args:
+            path: Directory to write (created if missing)
+        """
+        os.makedirs(path, exist_ok=True)
+
+        # Gather the current text of every row into one contiguous blob
+        starts, ends = self._text_starts.values, self._text_ends.values
+        lengths = ends - starts
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        blob = self._text_blob.values[positions]
+
+        string_keys = list(self._string_columns)
+        int_keys = list(self._int_columns)
+        columns = {'deleted': self._deleted.values}
+        columns.update({f"string_{i}": self._string_columns[key].codes.values for i, key in enumerate(string_keys)})
+        columns.update({f"int_{i}": self._int_columns[key].values for i, key in enumerate(int_keys)})
+        rows = {
+            'next_id': self.next_id,
+            'string_columns': [[key, self._string_columns[key].strings] for key in string_keys],
+            'int_columns': int_keys,
+            'irregular': [[row_id, metadata] for row_id, metadata in self._irregular.items()]
+        }
+
+        writers = {
+            TEXTS_FILENAME: lambda f: np.save(f, blob),
+            TEXT_OFFSETS_FILENAME: lambda f: np.save(f, offsets),
+            COLUMNS_FILENAME: lambda f: np.savez(f, **columns),
+            ROWS_FILENAME: lambda f: f.write(json.dumps(rows, separators=(',', ':')).encode('utf-8'))
+        }
+        for filename, write in writers.items():
+            with open(os.path.join(path, f"{filename}.tmp"), 'wb') as f:
+                write(f)
+        faiss.write_index(self.index, os.path.join(path, f"{INDEX_FILENAME}.tmp"))
+
+        for filename in [*writers, INDEX_FILENAME]:
+            os.replace(os.path.join(path, f"{filename}.tmp"), os.path.join(path, filename))
+
+    @classmethod
+    def open(cls, path: str, mmap: bool = True) -> "VectorStore":
+        """
+        Open a store written by save
+
+        Args:
+            path: Directory passed to save
+            mmap: Map the index and texts from disk instead of reading them
+                into private memory, so processes opening the same store
+                share their pages. Memory-mapped stores are read-only.
+
+        Returns:
+            VectorStore with the saved rows
+        """
+        index = faiss.read_index(os.path.join(path, INDEX_FILENAME), _MMAP_FLAGS if mmap else 0)
+        store = cls(index.d, index, read_only=mmap)
+
+        with open(os.path.join(path, ROWS_FILENAME), 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+        mmap_mode = 'r' if mmap else None
+        blob = np.load(os.path.join(path, TEXTS_FILENAME), mmap_mode=mmap_mode)
+        offsets = np.load(os.path.join(path, TEXT_OFFSETS_FILENAME), mmap_mode=mmap_mode)
+        with np.load(os.path.join(path, COLUMNS_FILENAME)) as columns:
+            deleted = columns['deleted']
+            store._string_columns = {
+                key: _StringColumn(strings, columns[f"string_{i}"]) for i, (key, strings) in enumerate(rows['string_columns'])
+            }
+            store._int_columns = {
+                key: _GrowableArray(np.int32, _MISSING_INT, columns[f"int_{i}"]) for i, key in enumerate(rows['int_columns'])
+            }
 
-        distances, indices = self.index.search(query_embedding, k)
-        results = []
+        store._text_blob = _GrowableArray(np.uint8, 0, blob)
+        # Writable stores get separate start and end arrays so updates don't overwrite each other
+        store._text_starts = _GrowableArray(np.int64, 0, offsets[:-1] if mmap else offsets[:-1].copy())
+        store._text_ends = _GrowableArray(np.int64, 0, offsets[1:] if mmap else offsets[1:].copy())
+        store._deleted = _GrowableArray(np.bool_, False, deleted)
+        store._irregular = {row_id: metadata for row_id, metadata in rows['irregular']}
 
-        for idx, score in zip(indices[0], distances[0]):
-            if idx < len(self.texts):
-                results.append((self.texts[idx], float(score), self.metadata[idx]))
+        live_rows = len(deleted) - int(deleted.sum())
+        if len(deleted) != rows['next_id'] or live_rows != index.ntotal:
+            raise ValueError(f"Vector store at {path} has {index.ntotal} vectors but {live_rows} rows")
+        return store
 
-        return results
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Search one query
+
+        Args:
+            query_embedding: Query vector
+            k: Results to return
+            filters: Metadata filters (see search_batch)
+
+        Returns:
+            (text, score, metadata) tuples, best first
+        """
+        scores, ids = self.search_batch(query_embedding, k, filters=filters)
+        return [
+            (self.get_text(row_id), float(score), self.get_metadata(row_id))
+            for score, row_id in zip(scores[0], ids[0])
+            if row_id >= 0
+        ]
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search many queries in one matrix operation
+
+        Filters restrict the rows considered before scoring, so each query
+        gets k matching rows whenever at least k rows match. Approximate
+        indexes search filters matching at most VECTOR_FILTER_EXACT_MAX_ROWS
+        rows exhaustively, and repeat exhaustively any query that comes back
+        short, since few of the rows they visit pass a selective filter.
+
+        Args:
+            query_embeddings: (n_queries, dimension) array
+            k: Results per query
+            filters: Metadata key to required value, e.g. {'type': 'resume'}
+                or {'candidate_id': ['a', 'b']}; a list, tuple or set matches
+                any of its values. Every key must match.
+
+        Returns:
+            (scores, ids) arrays of shape (n_queries, k); missing results have id -1
+        """
+        queries = np.atleast_2d(query_embeddings).astype(np.float32)
+        empty = (np.full((len(queries), k), -np.inf, dtype=np.float32), np.full((len(queries), k), -1, dtype=np.int64))
+
+        if self.index.ntotal == 0 or len(queries) == 0:
+            return empty
+
+        # Normalize query embeddings
+        queries = self._normalize(queries)
+
+        mask, selector, matching = None, None, self.index.ntotal
+        if filters:
+            mask = self._filter_mask(filters)
+            matching = int(np.count_nonzero(mask))
+            if matching == 0:
+                return empty
+            selector = _bitmap_selector(mask)
+
+        if self.index_type == 'flat':
+            return self.index.search(queries, k, params=self._search_params(selector))
+        if mask is not None and matching <= settings.VECTOR_FILTER_EXACT_MAX_ROWS:
+            return self._search_exhaustive(queries, k, mask, selector)
+
+        scores, ids = self.index.search(queries, k, params=self._search_params(selector))
+        short = np.flatnonzero(np.count_nonzero(ids >= 0, axis=1) < min(k, matching))
+        if len(short):
+            scores[short], ids[short] = self._search_exhaustive(queries[short], k, mask, selector)
+        return scores, ids
+
+    def _search_exhaustive(
+        self,
+        queries: np.ndarray,
+        k: int,
+        mask: Optional[np.ndarray],
+        selector: Optional[faiss.IDSelector]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score every matching row of an approximate index (exact for HNSW and IVF-Flat)"""
+        if self.index_type == 'hnsw':
+            # A filtered graph walk stalls when most neighbours are filtered out; scan the stored vectors instead
+            id_map = faiss.vector_to_array(self.index.id_map)
+            storage = faiss.downcast_index(faiss.downcast_index(self.index.index).storage)
+            params = faiss.SearchParameters(sel=_bitmap_selector(mask[id_map])) if mask is not None else None
+            scores, positions = storage.search(queries, k, params=params)
+            return scores, np.where(positions >= 0, id_map[positions], -1)
+
+        params = faiss.SearchParametersIVF(nprobe=faiss.extract_index_ivf(self.index).nlist)
+        if selector is not None:
+            params.sel = selector
+        return self.index.search(queries, k, params=params)
 
     def clear(self):
-        self.index.reset()
-        self.texts = []
-        self.metadata = []
+        self._check_writable()
+        self.index = build_index('flat', self.dimension, 0)
+        self.index_type = 'flat'
+        self._reset_rows()
         print("Cleared FAISS vector store")
 
+    def _row_bytes(self) -> int:
+        """Memory held by texts and metadata"""
+        arrays = [self._text_blob, self._text_starts, self._text_ends, self._deleted, *self._int_columns.values()]
+        return (
+            sum(array.nbytes for array in arrays)
+            + sum(string_column.nbytes for string_column in self._string_columns.values())
+            + sum(sys.getsizeof(metadata) for metadata in self._irregular.values())
+        )
+
     def get_stats(self) -> Dict[str, Any]:
+        rows = self.index.ntotal
+        index_bytes = estimate_index_bytes(self.index_type, self.dimension, rows)
+        row_bytes = self._row_bytes()
         return {
-            "total_documents": len(self.texts),
+            "total_documents": rows,
+            "next_id": self.next_id,
             "dimension": self.dimension,
-            "index_type": "FAISS"
+            "index_type": self.index_type,
+            "index_bytes": index_bytes,
+            "row_bytes": row_bytes,
+            "bytes_per_row": round((index_bytes + row_bytes) / rows, 1) if rows else 0.0,
+            "row_bytes_per_row": round(row_bytes / rows, 1) if rows else 0.0,
+            "nprobe": self.nprobe,
+            "ef_search": self.ef_search,
+            "read_only": self.read_only
         }
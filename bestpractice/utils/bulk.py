@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union
+from bestpractice.config import settings
+from bestpractice.models.document import ParsedDocument
+from bestpractice.utils.text_processing import TextProcessor
+
+# Per-worker processor, created on the first batch a worker receives
+_worker_processor: Optional[TextProcessor] = None
+
+
+def _process_batch(start: int, resumes: List[Union[str, ParsedDocument]]) -> List[Dict[str, Any]]:
+    """Extract profiles and chunks for one batch inside a worker process"""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = TextProcessor()
+
+    results = []
+    for index, resume in enumerate(resumes, start):
+        try:
+            document = _worker_processor._as_document(resume, 'resume')
+            results.append({
+                'index': index,
+                'profile': _worker_processor._extract_candidate_profile(document),
+                'chunks': _worker_processor._chunk_resume(document)
+            })
+        except Exception as e:
+            results.append({'index': index, 'error': str(e)})
+    return results
+
+
+class BulkProfileExtractor:
+    """
+    Profile extraction and chunking for large resume backlogs, across CPU cores
+
+    Resumes are sent to a spawn-based process pool in batches, with a bounded
+    number of batches in flight, so the input can be a lazy iterable of any
+    length. Workers only import the text processing modules; they never load
+    the embedding model or the vector store, and chunks are sized in
+    characters because the tokenizer stays with the model.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: Optional[int] = None, max_pending: Optional[int] = None):
+        """
+        Args:
+            workers: Worker processes (defaults to BULK_WORKERS, or one per CPU)
+            batch_size: Resumes per task (defaults to BULK_BATCH_SIZE)
+            max_pending: Batches submitted ahead of the one being consumed (defaults to 2 per worker)
+        """
+        self.workers = workers or settings.BULK_WORKERS or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size or settings.BULK_BATCH_SIZE)
+        self.max_pending = max(1, max_pending or self.workers * 2)
+        self.stats: Dict[str, Any] = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {'documents': 0, 'errors': 0, 'batches': 0, 'elapsed_seconds': 0.0, 'docs_per_sec': 0.0}
+
+    def extract(self, resumes: Iterable[Union[str, ParsedDocument]], progress_every: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Extract candidate profiles and chunks, yielding results in input order
+
+        Args:
+            resumes: Resume texts (or ParsedDocuments); consumed lazily
+            progress_every: Print throughput every N documents, 0 to only print the summary
+
+        Yields:
+            Dict with index, profile and chunks per resume, or index and error if it failed
+        """
+        self.stats = stats = self._empty_stats()
+        started = time.perf_counter()
+        next_report = progress_every
+        resumes = iter(resumes)
+        pending: Deque[Future] = deque()
+        submitted = 0
+
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            while True:
+                # Keep the pool busy without reading the whole input up front
+                while len(pending) < self.max_pending:
+                    batch = list(islice(resumes, self.batch_size))
+                    if not batch:
+                        break
+                    pending.append(executor.submit(_process_batch, submitted, batch))
+                    submitted += len(batch)
+                if not pending:
+                    break
+
+                for result in pending.popleft().result():
+                    stats['documents'] += 1
+                    if 'error' in result:
+                        stats['errors'] += 1
+                    yield result
+                stats['batches'] += 1
+                self._update_throughput(started)
+
+                if progress_every and stats['documents'] >= next_report:
+                    print(f"Bulk extraction: {stats['documents']} documents, {stats['docs_per_sec']:.1f} docs/sec")
+                    next_report = (stats['documents'] // progress_every + 1) * progress_every
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._update_throughput(started)
+            print(f"Bulk extraction finished: {stats['documents']} documents ({stats['errors']} failed) "
+                  f"in {stats['elapsed_seconds']:.2f}s, {stats['docs_per_sec']:.1f} docs/sec with {self.workers} workers")
+
+    def _update_throughput(self, started: float):
+        elapsed = time.perf_counter() - started
+        self.stats['elapsed_seconds'] = elapsed
+        self.stats['docs_per_sec'] = self.stats['documents'] / elapsed if elapsed > 0 else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for the most recent extract() run"""
+        return {**self.stats, 'workers': self.workers, 'batch_size': self.batch_size}
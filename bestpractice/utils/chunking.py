@@ -0,0 +1,205 @@
+import copy
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+def chunk_spans(
+    text: str,
+    chunk_size: int,
+    chunk_overlap: int = 0,
+    start: int = 0,
+    end: Optional[int] = None
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split text[start:end] into overlapping chunks in a single forward pass
+
+    Chunks are cut at the last space that fits in chunk_size characters (or
+    hard-cut inside a word longer than that). The next chunk starts at the
+    first word boundary within the last chunk_overlap characters, so both
+    limits are in characters and no chunk is longer than chunk_size.
+
+    Args:
+        text: Source text; only offsets are produced, nothing is copied
+        chunk_size: Maximum chunk length in characters
+        chunk_overlap: Maximum characters shared by consecutive chunks
+        start: Offset where chunking starts
+        end: Offset where chunking stops (defaults to len(text))
+
+    Yields:
+        (start, end) offsets into text, with surrounding whitespace trimmed
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if not 0 <= chunk_overlap < chunk_size:
+        raise ValueError("chunk_overlap must be between 0 and chunk_size - 1")
+
+    end = len(text) if end is None else min(end, len(text))
+    pos = _skip_spaces(text, start, end)
+    previous_end = pos
+
+    while pos < end:
+        limit = pos + chunk_size
+        if limit >= end:
+            chunk_end = _trim_spaces(text, pos, end)
+            # A tail that ends where the previous chunk did is already covered by it
+            if chunk_end > max(pos, previous_end):
+                yield pos, chunk_end
+            return
+
+        # Cut at the last space inside the window, or inside an overlong word
+        cut = text.rfind(' ', pos + 1, limit + 1)
+        if cut == -1:
+            cut = limit
+        chunk_end = _trim_spaces(text, pos, cut)
+        # Skip chunks lying inside the previous one (the overlap backed up before a long word)
+        if chunk_end > previous_end:
+            yield pos, chunk_end
+            previous_end = chunk_end
+
+        # Start the next chunk at a word boundary within the overlap, always moving forward
+        next_pos = max(chunk_end - chunk_overlap, pos + 1)
+        if next_pos < chunk_end and text[next_pos - 1] != ' ':
+            boundary = text.find(' ', next_pos, chunk_end)
+            next_pos = boundary if boundary != -1 else cut
+        pos = _skip_spaces(text, next_pos, end)
+
+
+def chunk_text(text: str, chunk_size: int, chunk_overlap: int = 0, start: int = 0, end: Optional[int] = None) -> List[str]:
+    """Materialize chunk_spans as strings"""
+    return [text[chunk_start:chunk_end] for chunk_start, chunk_end in chunk_spans(text, chunk_size, chunk_overlap, start, end)]
+
+
+class ChunkTokenizer:
+    """
+    Thread-safe handle on the embedding model's tokenizer for sizing chunks
+
+    Holds a private copy of the tokenizer, because the model's own instance is
+    reconfigured (padding/truncation) on every encode call and Rust-backed
+    tokenizers refuse concurrent use.
+    """
+
+    def __init__(self, tokenizer: Any, max_seq_length: int):
+        self._tokenizer = copy.deepcopy(tokenizer)
+        self._lock = threading.Lock()
+        self.max_seq_length = max_seq_length
+        self.special_tokens = tokenizer.num_special_tokens_to_add(pair=False)
+        self.max_tokens = max_seq_length - self.special_tokens
+
+    def offsets(self, text: str) -> List[Tuple[int, int]]:
+        """Character offsets of every token in text, without special tokens"""
+        with self._lock:
+            encoded = self._tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+        return [(start, end) for start, end in encoded['offset_mapping'] if end > start]
+
+    def count(self, texts: List[str]) -> List[int]:
+        """Untruncated token counts, including special tokens, as the model would see them"""
+        if not texts:
+            return []
+        with self._lock:
+            encoded = self._tokenizer(texts, add_special_tokens=False)
+        return [len(ids) + self.special_tokens for ids in encoded['input_ids']]
+
+
+def token_chunk_spans(
+    offsets: Sequence[Tuple[int, int]],
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    start: int = 0,
+    end: Optional[int] = None
+) -> Iterator[Tuple[int, int]]:
+    """
+    Pack the tokens of text[start:end] into chunks of at most max_tokens tokens
+
+    Chunks prefer to end before a token that follows whitespace, so words split
+    into several sub-word tokens stay together unless a single word is longer
+    than the whole budget.
+
+    Args:
+        offsets: Token character offsets for the whole text, in order (ChunkTokenizer.offsets)
+        max_tokens: Token budget per chunk, excluding special tokens
+        overlap_tokens: Tokens shared by consecutive chunks
+        start: Offset where chunking starts
+        end: Offset where chunking stops (defaults to the end of the last token)
+
+    Yields:
+        (start, end) character offsets into the tokenized text
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be between 0 and max_tokens - 1")
+
+    starts = [token_start for token_start, _ in offsets]
+    first = bisect_left(starts, start)
+    last = len(offsets) if end is None else bisect_left(starts, end)
+
+    def word_start(index: int) -> bool:
+        return index == first or offsets[index][0] > offsets[index - 1][1]
+
+    i = first
+    while i < last:
+        j = min(i + max_tokens, last)
+        if j < last:
+            # Back off to a word boundary, unless the window is a single word
+            k = j
+            while k > i + 1 and not word_start(k):
+                k -= 1
+            if k > i + 1:
+                j = k
+
+        chunk_end = offsets[j - 1][1] if end is None else min(offsets[j - 1][1], end)
+        yield offsets[i][0], chunk_end
+        if j == last:
+            return
+
+        next_i = max(j - overlap_tokens, i + 1)
+        while next_i < j and not word_start(next_i):
+            next_i += 1
+        i = next_i
+
+
+def chunk_stats(token_counts: List[int], max_seq_length: int, batch_size: int = 32) -> Dict[str, Any]:
+    """
+    Summarize how well chunks fill the model's input
+
+    Mirrors SentenceTransformer.encode: inputs are truncated to max_seq_length,
+    sorted by length and padded to the longest input of each batch.
+
+    Args:
+        token_counts: Token count of each chunk, including special tokens
+        max_seq_length: Model input limit
+        batch_size: Encode batch size
+
+    Returns:
+        Dict with chunk count, token totals, padding ratio and truncation rate
+    """
+    if not token_counts:
+        return {'chunks': 0, 'tokens': 0, 'truncated_tokens': 0, 'padding_ratio': 0.0, 'truncation_rate': 0.0}
+
+    lengths = sorted((min(count, max_seq_length) for count in token_counts), reverse=True)
+    padding = sum(
+        batch[0] * len(batch) - sum(batch)
+        for batch in (lengths[i:i + batch_size] for i in range(0, len(lengths), batch_size))
+    )
+    used = sum(lengths)
+    truncated = [count for count in token_counts if count > max_seq_length]
+    return {
+        'chunks': len(token_counts),
+        'tokens': used,
+        'truncated_tokens': sum(truncated) - len(truncated) * max_seq_length,
+        'padding_ratio': round(padding / (padding + used), 4),
+        'truncation_rate': round(len(truncated) / len(token_counts), 4)
+    }
+
+
+def _skip_spaces(text: str, pos: int, end: int) -> int:
+    while pos < end and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _trim_spaces(text: str, start: int, end: int) -> int:
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end
@@ -0,0 +1,146 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from bestpractice.config import settings
+
+
+def _timed_call(func: Callable, args: tuple, kwargs: Dict[str, Any]):
+    """Run func inside a worker and report when it actually started and finished"""
+    started = time.monotonic()
+    result = func(*args, **kwargs)
+    return result, started, time.monotonic()
+
+
+class ExecutionPool:
+    """Thread and process pools that keep blocking pipeline stages off the event loop"""
+
+    def __init__(self, thread_workers: Optional[int] = None, process_workers: Optional[int] = None):
+        self.thread_workers = thread_workers if thread_workers is not None else settings.THREAD_POOL_WORKERS
+        self.process_workers = process_workers if process_workers is not None else settings.PROCESS_POOL_WORKERS
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+
+    def _get_thread_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use"""
+        if self._thread_executor is None:
+            with self._executor_lock:
+                if self._thread_executor is None:
+                    self._thread_executor = ThreadPoolExecutor(
+                        max_workers=max(1, self.thread_workers),
+                        thread_name_prefix="pipeline"
+                    )
+        return self._thread_executor
+
+    def _get_process_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Create the process pool on first use, None when process workers are disabled"""
+        if self.process_workers <= 0:
+            return None
+        if self._process_executor is None:
+            with self._executor_lock:
+                if self._process_executor is None:
+                    # Spawn so workers never inherit model weights or event loop state
+                    self._process_executor = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._process_executor
+
+    @property
+    def uses_processes(self) -> bool:
+        """True when run_cpu_bound hands work to worker processes rather than threads"""
+        return self.process_workers > 0
+
+    async def run_in_thread(self, stage: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable in the thread pool
+
+        Suited to work that releases the GIL (model inference, file I/O, C extensions).
+
+        Args:
+            stage: Stage name used for metrics
+            func: Callable to run
+
+        Returns:
+            Whatever func returns
+        """
+        return await self._run(self._get_thread_executor(), "thread", stage, func, args, kwargs)
+
+    async def run_cpu_bound(self, stage: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run pure-Python CPU work in the process pool, or the thread pool if none is configured
+
+        func and its arguments must be picklable when a process pool is used.
+        Arguments are copies in the worker, so anything func changes on them
+        stays there unless func returns it.
+
+        Args:
+            stage: Stage name used for metrics
+            func: Callable to run
+
+        Returns:
+            Whatever func returns
+        """
+        process_executor = self._get_process_executor()
+        if process_executor is None:
+            return await self.run_in_thread(stage, func, *args, **kwargs)
+        return await self._run(process_executor, "process", stage, func, args, kwargs)
+
+    async def _run(self, executor: Executor, kind: str, stage: str, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        result, started, finished = await loop.run_in_executor(executor, _timed_call, func, args, kwargs)
+        self._record(stage, kind, started - submitted, finished - started)
+        return result
+
+    def _record(self, stage: str, kind: str, queue_wait: float, run_time: float):
+        with self._stats_lock:
+            stats = self._stats.setdefault(stage, {
+                'executor': kind,
+                'calls': 0,
+                'queue_wait_total': 0.0,
+                'queue_wait_max': 0.0,
+                'run_time_total': 0.0,
+                'run_time_max': 0.0
+            })
+            stats['calls'] += 1
+            stats['queue_wait_total'] += queue_wait
+            stats['queue_wait_max'] = max(stats['queue_wait_max'], queue_wait)
+            stats['run_time_total'] += run_time
+            stats['run_time_max'] = max(stats['run_time_max'], run_time)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage queue wait versus run time, in seconds"""
+        with self._stats_lock:
+            stages = {}
+            for stage, stats in self._stats.items():
+                calls = stats['calls']
+                stages[stage] = {
+                    **stats,
+                    'queue_wait_avg': stats['queue_wait_total'] / calls,
+                    'run_time_avg': stats['run_time_total'] / calls
+                }
+        return {
+            "thread_workers": self.thread_workers,
+            "process_workers": self.process_workers,
+            "stages": stages
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down both pools; they are recreated if used again"""
+        with self._executor_lock:
+            if self._thread_executor is not None:
+                self._thread_executor.shutdown(wait=wait)
+                self._thread_executor = None
+            if self._process_executor is not None:
+                self._process_executor.shutdown(wait=wait)
+                self._process_executor = None
+
+
+# Create global execution pool instance
+execution_pool = ExecutionPool()
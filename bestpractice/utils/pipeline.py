@@ -0,0 +1,60 @@
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+class StageGraph:
+    """Small DAG of async stages; every stage starts as soon as its dependencies finish"""
+
+    def __init__(self):
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add_stage(self, name: str, func: Callable[..., Awaitable[Any]], depends_on: Sequence[str] = ()):
+        """
+        Register a stage
+
+        Args:
+            name: Unique stage name
+            func: Coroutine function called with the results of depends_on, in order
+            depends_on: Names of stages that must complete first (must already be registered)
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage {name} is already registered")
+        missing = [dep for dep in depends_on if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name} depends on unknown stages: {missing}")
+        self._stages[name] = {'func': func, 'depends_on': list(depends_on)}
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Execute all stages with maximal concurrency
+
+        If any stage fails, the remaining stages are cancelled and the error is raised.
+
+        Returns:
+            Dict mapping stage name to its result
+        """
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        for name, stage in self._stages.items():
+            dependencies = [tasks[dep] for dep in stage['depends_on']]
+            tasks[name] = asyncio.create_task(self._run_stage(name, stage['func'], dependencies))
+
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self.timings['total'] = time.perf_counter() - started
+
+        return dict(zip(tasks.keys(), results))
+
+    async def _run_stage(self, name: str, func: Callable[..., Awaitable[Any]], dependencies: List[asyncio.Task]) -> Any:
+        inputs = [await dependency for dependency in dependencies]
+        stage_started = time.perf_counter()
+        result = await func(*inputs)
+        self.timings[name] = time.perf_counter() - stage_started
+        return result
@@ -0,0 +1,68 @@
+import time
+import random
+from typing import Dict, Any, Optional
+
+class PollSchedule:
+    """Exponential backoff with jitter for polling a remote job, bounded by a deadline"""
+
+    def __init__(
+        self,
+        deadline: float,
+        initial_delay: float = 0.25,
+        max_delay: float = 5.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5
+    ):
+        """
+        Args:
+            deadline: Absolute time.monotonic() value after which polling stops
+            initial_delay: First delay in seconds
+            max_delay: Upper bound for a single delay
+            multiplier: Backoff factor applied after each attempt
+            jitter: Fraction of each delay that is randomized (0 = none, 1 = full jitter)
+        """
+        self.deadline = deadline
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = min(max(jitter, 0.0), 1.0)
+
+        self.started_at = time.monotonic()
+        self.attempts = 0
+        self.wait_seconds = 0.0
+        self._base_delay = initial_delay
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def record_attempt(self):
+        self.attempts += 1
+
+    def next_delay(self) -> Optional[float]:
+        """
+        Delay before the next attempt
+
+        Returns:
+            Seconds to sleep, or None if the deadline leaves no room for another attempt
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+
+        base = min(self._base_delay, self.max_delay)
+        delay = base * (1.0 - self.jitter * random.random())
+        self._base_delay = base * self.multiplier
+
+        if delay >= remaining:
+            return None
+
+        self.wait_seconds += delay
+        return delay
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'attempts': self.attempts,
+            'wait_seconds': round(self.wait_seconds, 3),
+            'elapsed_seconds': round(time.monotonic() - self.started_at, 3)
+        }
@@ -0,0 +1,251 @@
+import re
+import time
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from bestpractice.config import settings
+
+try:
+    import re2
+except ImportError:  # Optional linear-time backend (pip install google-re2)
+    re2 = None
+
+# Absolute time.monotonic() after which registered patterns refuse to run; set per document
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('regex_deadline', default=None)
+
+_RE2_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+
+
+class RegexBudgetExceeded(Exception):
+    """Raised when a document has used up its regex time budget"""
+
+
+class TimedPattern:
+    """Precompiled regex that records how often it runs and how long it takes"""
+
+    __slots__ = ('name', 'compiled', 'engine', 'calls', 'total_time', 'max_time', 'skipped')
+
+    def __init__(self, name: str, compiled: Any, engine: str = 're'):
+        self.name = name
+        self.compiled = compiled
+        self.engine = engine
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.skipped = 0
+
+    @property
+    def pattern(self) -> str:
+        return self.compiled.pattern
+
+    def _start(self) -> float:
+        """Refuse to run once the current document's budget is spent"""
+        deadline = _deadline.get()
+        if deadline is not None and time.monotonic() >= deadline:
+            self.skipped += 1
+            raise RegexBudgetExceeded(f"Regex time budget exhausted before {self.name}")
+        return time.perf_counter()
+
+    def _record(self, started: float):
+        elapsed = time.perf_counter() - started
+        # Counters are updated without a lock; concurrent threads may drop a sample
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+
+    def search(self, string: str, *args):
+        started = self._start()
+        try:
+            return self.compiled.search(string, *args)
+        finally:
+            self._record(started)
+
+    def match(self, string: str, *args):
+        started = self._start()
+        try:
+            return self.compiled.match(string, *args)
+        finally:
+            self._record(started)
+
+    def findall(self, string: str, *args) -> List[Any]:
+        started = self._start()
+        try:
+            return self.compiled.findall(string, *args)
+        finally:
+            self._record(started)
+
+    def finditer(self, string: str, *args) -> List["re.Match"]:
+        """Like re.finditer, but materialized so the scan is timed"""
+        started = self._start()
+        try:
+            return list(self.compiled.finditer(string, *args))
+        finally:
+            self._record(started)
+
+    def sub(self, repl, string: str, count: int = 0) -> str:
+        started = self._start()
+        try:
+            return self.compiled.sub(repl, string, count)
+        finally:
+            self._record(started)
+
+    def split(self, string: str, maxsplit: int = 0) -> List[str]:
+        started = self._start()
+        try:
+            return self.compiled.split(string, maxsplit)
+        finally:
+            self._record(started)
+
+
+class RegexRegistry:
+    """Module-level registry of compiled patterns with per-pattern timing counters"""
+
+    def __init__(self, engine: Optional[str] = None):
+        self.engine = engine or settings.REGEX_ENGINE
+        if self.engine == 're2' and re2 is None:
+            print("REGEX_ENGINE=re2 but the re2 module is not installed; using re")
+            self.engine = 're'
+        self._patterns: Dict[str, TimedPattern] = {}
+
+    def compile(self, name: str, pattern: str, flags: int = 0, replace: bool = False, linear: bool = True) -> TimedPattern:
+        """
+        Compile and register a pattern
+
+        With REGEX_ENGINE=re2 the pattern is compiled by RE2, which matches in
+        time linear in the input. Patterns RE2 can't express (lookaround,
+        backreferences) fall back to re. RE2's \\w and \\b are ASCII-only.
+
+        Args:
+            name: Unique dotted name, e.g. 'experience.company.0'
+            pattern: Regular expression source
+            flags: re flags (IGNORECASE, MULTILINE and DOTALL are translated for RE2)
+            replace: Allow replacing a pattern already registered under name (e.g. a rebuilt taxonomy)
+            linear: False keeps the pattern on re, for callers relying on re-only match attributes
+
+        Returns:
+            TimedPattern wrapping the compiled regex
+        """
+        if name in self._patterns and not replace:
+            raise ValueError(f"Regex {name} is already registered")
+
+        timed = self._compile_re2(name, pattern, flags) if self.engine == 're2' and linear else None
+        if timed is None:
+            timed = TimedPattern(name, re.compile(pattern, flags))
+        self._patterns[name] = timed
+        return timed
+
+    @staticmethod
+    def _compile_re2(name: str, pattern: str, flags: int) -> Optional[TimedPattern]:
+        """Compile with RE2, None if the flags or syntax aren't supported"""
+        if flags & ~sum(_RE2_FLAGS):
+            return None
+        inline = ''.join(letter for flag, letter in _RE2_FLAGS.items() if flags & flag)
+        try:
+            compiled = re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except Exception:
+            return None
+        return TimedPattern(name, compiled, 're2')
+
+    def compile_all(self, prefix: str, patterns: List[str], flags: int = 0) -> List[TimedPattern]:
+        """Compile a list of patterns named prefix.0, prefix.1, ..."""
+        return [self.compile(f"{prefix}.{i}", pattern, flags) for i, pattern in enumerate(patterns)]
+
+    def get(self, name: str) -> Optional[TimedPattern]:
+        return self._patterns.get(name)
+
+    @contextmanager
+    def budget(self, seconds: Optional[float] = None) -> Iterator[None]:
+        """
+        Bound the total regex time spent on one document
+
+        Inside the block every registered pattern checks the deadline before it
+        runs and raises RegexBudgetExceeded once it has passed. A call that has
+        already started can't be interrupted, so patterns must also be bounded
+        per call. The deadline is a context variable, so concurrent documents
+        in other threads keep their own budgets.
+
+        Args:
+            seconds: Budget; defaults to REGEX_TIME_BUDGET_SECONDS, 0 means unlimited
+        """
+        seconds = settings.REGEX_TIME_BUDGET_SECONDS if seconds is None else seconds
+        token = _deadline.set(time.monotonic() + seconds if seconds > 0 else None)
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def get_stats(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Per-pattern counters, most expensive first
+
+        Args:
+            limit: Only return the top N patterns
+
+        Returns:
+            List of dicts with name, engine, calls, calls skipped over budget and total/avg/max time in seconds
+        """
+        stats = [
+            {
+                'name': timed.name,
+                'engine': timed.engine,
+                'calls': timed.calls,
+                'skipped': timed.skipped,
+                'total_time': timed.total_time,
+                'avg_time': timed.total_time / timed.calls if timed.calls else 0.0,
+                'max_time': timed.max_time
+            }
+            for timed in self._patterns.values()
+        ]
+        stats.sort(key=lambda item: item['total_time'], reverse=True)
+        return stats[:limit] if limit else stats
+
+    def snapshot_stats(self) -> Dict[str, Tuple[int, float, int]]:
+        """Raw (calls, total_time, skipped) per pattern, to diff against with stats_since"""
+        return {name: (timed.calls, timed.total_time, timed.skipped) for name, timed in self._patterns.items()}
+
+    def stats_since(self, snapshot: Dict[str, Tuple[int, float, int]]) -> Dict[str, Tuple[int, float, float, int]]:
+        """
+        Counters added since snapshot_stats, for a worker process to hand back to the parent
+
+        Args:
+            snapshot: Result of snapshot_stats
+
+        Returns:
+            (calls, total_time, max_time, skipped) per pattern that ran or was skipped
+        """
+        delta = {}
+        for name, timed in self._patterns.items():
+            calls, total_time, skipped = snapshot.get(name, (0, 0.0, 0))
+            if timed.calls != calls or timed.skipped != skipped:
+                delta[name] = (timed.calls - calls, timed.total_time - total_time, timed.max_time, timed.skipped - skipped)
+        return delta
+
+    def merge_stats(self, delta: Dict[str, Tuple[int, float, float, int]]):
+        """Add counters from stats_since in a worker process; patterns unknown here are ignored"""
+        for name, (calls, total_time, max_time, skipped) in delta.items():
+            timed = self._patterns.get(name)
+            if timed is None:
+                continue
+            timed.calls += calls
+            timed.total_time += total_time
+            timed.max_time = max(timed.max_time, max_time)
+            timed.skipped += skipped
+
+    def reset_stats(self):
+        for timed in self._patterns.values():
+            timed.calls = 0
+            timed.total_time = 0.0
+            timed.max_time = 0.0
+            timed.skipped = 0
+
+    def dump(self, limit: Optional[int] = 20):
+        """Print the most expensive patterns"""
+        print("=== Regex Timings ===")
+        for item in self.get_stats(limit):
+            print(f"{item['name']:<40} calls={item['calls']:<8} total={item['total_time'] * 1000:.2f}ms max={item['max_time'] * 1000:.2f}ms")
+        print("=" * 21)
+
+
+# Create global regex registry instance
+regex_registry = RegexRegistry()
@@ -0,0 +1,106 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+from bestpractice.utils.regex_registry import regex_registry, TimedPattern
+
+# Cleaning and section segmentation shared by ParsedDocument and TextProcessor
+
+_WHITESPACE = regex_registry.compile('clean.whitespace', r'\s+')
+_DISALLOWED_CHARS = regex_registry.compile('clean.disallowed_chars', r'[^\w\s\.\,\:\;\-\(\)\[\]\/\@\+\#\&\%\$]')
+
+def _compile_section_headers(name: str, sections: Dict[str, str]) -> TimedPattern:
+    """Combine per-section header alternatives into one named-group alternation"""
+    alternation = '|'.join(f'(?P<{section}>{pattern})' for section, pattern in sections.items())
+    # segment_sections reads match.lastgroup, which only re provides
+    return regex_registry.compile(name, f'\\b(?:{alternation})\\b', linear=False)
+
+# Common resume section headers
+RESUME_SECTION_HEADERS = _compile_section_headers('sections.resume', {
+    'education': r'education|academic|qualifications|degrees?',
+    'experience': r'experience|employment|work\s+history|career|professional',
+    'skills': r'skills|competencies|technical|technologies|tools',
+    'projects': r'projects|portfolio|work\s+samples|achievements|accomplishments',
+    'certifications': r'certifications?|certificates?|licenses?|credentials',
+    'summary': r'summary|objective|profile|about',
+    'contact': r'contact',
+    'references': r'references?'
+})
+
+# Common job section headers
+JOB_SECTION_HEADERS = _compile_section_headers('sections.job', {
+    'requirements': r'requirements?|qualifications?|skills?|must\s+have',
+    'responsibilities': r'responsibilities?|duties|role|what\s+you|you\s+will',
+    'benefits': r'benefits?|perks?|compensation|salary|package',
+    'about': r'about|company|organization|team|mission',
+    'preferred': r'preferred|nice\s+to\s+have|bonus|plus'
+})
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace and drop characters outside the allowed punctuation set"""
+    
+    # Remove extra whitespace
+    text = _WHITESPACE.sub(' ', text)
+    
+    # Remove special characters but keep important punctuation
+    text = _DISALLOWED_CHARS.sub('', text)
+    
+    return text.strip()
+
+
+def lower_text_with_offsets(text: str) -> str:
+    """
+    text.lower() with the same length as text, so offsets carry over
+
+    A few characters lowercase to more than one code point ('İ' becomes 'i'
+    plus a combining dot); those are kept as they are. Section headers are
+    ASCII, so this doesn't change which headers match.
+    """
+    lower_text = text.lower()
+    if len(lower_text) == len(text):
+        return lower_text
+    return ''.join(lowered if len(lowered := char.lower()) == 1 else char for char in text)
+
+
+def segment_sections(
+    text: str,
+    headers: TimedPattern,
+    min_section_length: int = 50,
+    lower_text: Optional[str] = None
+) -> List[Tuple[str, int, int]]:
+    """
+    Split text into sections with a single scan for headers
+    
+    Each section starts at the first occurrence of one of its headers and ends
+    at the next header of a different section found at least
+    min_section_length characters later (or at the end of the text).
+    
+    Args:
+        text: Text to segment
+        headers: Combined lowercase header pattern from _compile_section_headers
+        min_section_length: Headers closer than this to a section start don't end it
+        lower_text: lower_text_with_offsets(text), if the caller already has it
+        
+    Returns:
+        Ordered list of (section, start, end) spans
+    """
+    
+    # Headers are lowercase; scanning lowered text is much cheaper than IGNORECASE
+    if lower_text is None:
+        lower_text = lower_text_with_offsets(text)
+    hits = [(match.start(), match.lastgroup) for match in headers.finditer(lower_text)]
+    hit_starts = [start for start, _ in hits]
+    
+    first_hits = {}
+    for start, section in hits:
+        first_hits.setdefault(section, start)
+    
+    spans = []
+    for section, start in first_hits.items():
+        end = len(text)
+        for i in range(bisect_left(hit_starts, start + min_section_length), len(hits)):
+            if hits[i][1] != section:
+                end = hits[i][0]
+                break
+        spans.append((section, start, end))
+    
+    return spans
@@ -0,0 +1,145 @@
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from bestpractice.config import settings
+from bestpractice.utils.regex_registry import regex_registry, TimedPattern
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'skills.txt')
+
+# Characters that make up a word; a skill only matches when it is not
+# directly preceded or followed by one of them
+_WORD_CHARS = 'a-z0-9'
+
+
+def _normalize(name: str) -> str:
+    return ' '.join(name.lower().split())
+
+
+class SkillTaxonomy:
+    """
+    Skill names and aliases compiled into one trie-shaped regex
+
+    Every alias is inserted into a character trie, and the trie is emitted as
+    nested alternations, so the regex engine walks the trie in a single left
+    to right pass over the text regardless of how many skills are loaded.
+    At each position the longest alias wins.
+    """
+
+    def __init__(self, name: str = 'skills.taxonomy'):
+        self.name = name
+        self._aliases: Dict[str, str] = {}  # normalized alias -> canonical name
+        self._pattern: Optional[TimedPattern] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(set(self._aliases.values()))
+
+    def add(self, canonical: str, aliases: Iterable[str] = ()):
+        """
+        Register a skill
+
+        Args:
+            canonical: Name reported for every match
+            aliases: Other spellings that map to the canonical name
+        """
+        canonical = _normalize(canonical)
+        for alias in (canonical, *aliases):
+            alias = _normalize(alias)
+            if alias:
+                self._aliases[alias] = canonical
+        self._pattern = None
+
+    def load(self, path: str) -> "SkillTaxonomy":
+        """
+        Load skills from a text file with one "canonical | alias | ..." entry per line
+
+        Args:
+            path: Taxonomy file; blank lines and lines starting with '#' are ignored
+
+        Returns:
+            self, for chaining
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                names = [name for name in (part.strip() for part in line.split('|')) if name]
+                if names:
+                    self.add(names[0], names[1:])
+        return self
+
+    def compile(self) -> TimedPattern:
+        """Build the trie regex if skills changed since the last build (large taxonomies take a moment)"""
+        with self._lock:
+            if self._pattern is None:
+                trie: Dict[str, dict] = {}
+                for alias in self._aliases:
+                    node = trie
+                    for char in alias:
+                        node = node.setdefault(char, {})
+                    node[''] = {}  # end of alias
+
+                body = self._trie_to_regex(trie) or '(?!)'
+                source = f'(?<![{_WORD_CHARS}])(?:{body})(?![{_WORD_CHARS}])'
+                self._pattern = regex_registry.compile(self.name, source, replace=True)
+            return self._pattern
+
+    @classmethod
+    def _trie_to_regex(cls, node: Dict[str, dict]) -> str:
+        """Emit a trie node as a regex; children are tried before ending here, so longer aliases win"""
+        terminal = '' in node
+        branches = []
+        for char in sorted(key for key in node if key):
+            token = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(token + cls._trie_to_regex(node[char]))
+
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if terminal:
+            return f'(?:{body})?' if len(branches) > 1 or len(body) > 1 else f'{body}?'
+        return body
+
+    def find_matches(self, text: str, is_lower: bool = False) -> List[Tuple[int, int, str]]:
+        """
+        Find every skill mention
+
+        Args:
+            text: Text to scan
+            is_lower: text is already lowercase
+
+        Returns:
+            List of (start, end, canonical name) in text order
+        """
+        pattern = self.compile()
+        return [
+            (match.start(), match.end(), self._aliases[_normalize(match.group())])
+            for match in pattern.finditer(text if is_lower else text.lower())
+        ]
+
+    def find(self, text: str, is_lower: bool = False) -> List[str]:
+        """
+        Find the distinct skills mentioned in text
+
+        Args:
+            text: Text to scan
+            is_lower: text is already lowercase
+
+        Returns:
+            Canonical skill names in order of first mention
+        """
+        return list(dict.fromkeys(name for _, _, name in self.find_matches(text, is_lower)))
+
+
+def load_skill_taxonomy(path: Optional[str] = None) -> SkillTaxonomy:
+    """Load the taxonomy from settings.SKILL_TAXONOMY_PATH, or the bundled skills.txt"""
+    path = path or settings.SKILL_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH
+    taxonomy = SkillTaxonomy().load(path)
+    print(f"Loaded {len(taxonomy)} skills from {path}")
+    return taxonomy
+
+
+# Create global skill taxonomy instance (compiled on first use)
+skill_taxonomy = load_skill_taxonomy()
@@ -1,89 +1,293 @@
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 import asyncio
+from bestpractice.config import settings
+from bestpractice.models.document import ParsedDocument
+from bestpractice.utils.chunking import ChunkTokenizer, chunk_text, token_chunk_spans
+from bestpractice.utils.execution import execution_pool
+from bestpractice.utils.regex_registry import regex_registry, RegexBudgetExceeded
+from bestpractice.utils.segmentation import clean_text, segment_sections, RESUME_SECTION_HEADERS, JOB_SECTION_HEADERS
+from bestpractice.utils.skill_taxonomy import skill_taxonomy
+
+# Precompiled patterns shared by every TextProcessor call. Timings are
+# collected per pattern in regex_registry.
+
+# Enhanced degree patterns with better capture groups
+_DEGREE_PATTERNS = regex_registry.compile_all('education.degree', [
+    r'(bachelor(?:\'s)?|master(?:\'s)?|phd|doctorate|associate|diploma|certificate)[\s\w]*(?:in|of)\s+([\w\s,]+?)(?=\.|,|\n|$)',
+    r'(b\.?[sa]\.?|m\.?[sa]\.?|m\.?s\.?|ph\.?d\.?|b\.?eng\.?|m\.?eng\.?)[\s\w]*(?:in|of)\s+([\w\s,]+?)(?=\.|,|\n|$)',
+    r'(university|college|institute|school)[\s\w]*(?:of|in)\s+([\w\s,]+?)(?=\.|,|\n|graduated|$)',
+    r'graduated\s+from\s+([\w\s,]+?)(?=\.|,|\n|with|$)',
+    r'degree\s+in\s+([\w\s,]+?)(?=\.|,|\n|from|$)',
+    r'major\s+in\s+([\w\s,]+?)(?=\.|,|\n|from|$)',
+    r'studied\s+([\w\s,]+?)(?=\.|,|\n|at|$)',
+    r'gpa[\s:]*(\d+\.?\d*)\s*/?\s*(\d+\.?\d*)?',
+    r'(cum\s+laude|magna\s+cum\s+laude|summa\s+cum\s+laude|honors?|dean\'s\s+list)'
+], re.IGNORECASE)
+
+_EDUCATION_DATE_PATTERNS = regex_registry.compile_all('education.date', [
+    r'(19|20)\d{2}[-\s]*(19|20)\d{2}',
+    r'(19|20)\d{2}',
+    r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(19|20)\d{2}'
+], re.IGNORECASE)
+
+_SKILL_PHRASE_PATTERNS = regex_registry.compile_all('skills.phrase', [
+    r'(?:proficient|skilled|experienced|expert)\s+(?:in|with)\s+([\w\s,]+?)(?=\.|,|\n|$)',
+    r'(?:knowledge|experience)\s+(?:of|in|with)\s+([\w\s,]+?)(?=\.|,|\n|$)',
+    r'(?:familiar|comfortable)\s+with\s+([\w\s,]+?)(?=\.|,|\n|$)',
+    r'(?:using|worked with|utilized)\s+([\w\s,]+?)(?=\.|,|\n|$)',
+    r'(?:languages?|technologies?|tools?|frameworks?|platforms?)[:\s]+([\w\s,/]+?)(?=\.|,|\n|$)',
+    r'(?:including|such as)[:\s]+([\w\s,/]+?)(?=\.|,|\n|$)'
+], re.IGNORECASE)
+
+_SKILL_DELIMITERS = regex_registry.compile('skills.delimiters', r'[,/|&;]')
+
+_SKILL_BULLET_PATTERNS = regex_registry.compile_all('skills.bullet', [
+    r'[•·▪▫-]\s*([^\n\r]+)',
+    r'^\s*[*-]\s*([^\n\r]+)',
+], re.MULTILINE)
+
+# Enhanced job title patterns
+_JOB_TITLE_PATTERNS = regex_registry.compile_all('experience.job_title', [
+    r'(software\s+engineer|senior\s+software\s+engineer|lead\s+software\s+engineer|principal\s+software\s+engineer)',
+    r'(developer|web\s+developer|full\s+stack\s+developer|frontend\s+developer|backend\s+developer)',
+    r'(architect|technical\s+architect|solution\s+architect|system\s+architect)',
+    r'(manager|engineering\s+manager|project\s+manager|product\s+manager|team\s+lead)',
+    r'(analyst|data\s+analyst|business\s+analyst|system\s+analyst)',
+    r'(consultant|technical\s+consultant|solutions\s+consultant)',
+    r'(specialist|technical\s+specialist|it\s+specialist)',
+    r'(devops|sre|site\s+reliability\s+engineer|infrastructure\s+engineer)',
+    r'(qa|quality\s+assurance|test\s+engineer|automation\s+engineer)',
+    r'(data\s+scientist|machine\s+learning\s+engineer|ai\s+engineer)',
+    r'(cto|cio|vp\s+engineering|director\s+of\s+engineering)',
+    r'(intern|internship|graduate\s+trainee|junior|senior|lead|principal)'
+], re.IGNORECASE)
+
+# Company and employment patterns
+_COMPANY_PATTERNS = regex_registry.compile_all('experience.company', [
+    r'(?:at|@)\s+([A-Z][\w\s&.,]{1,80}?)(?:\s+\||,|\n|$)',
+    r'(?:worked\s+at|employed\s+at|company:)\s+([A-Z][\w\s&.,]{1,80}?)(?:\s+\||,|\n|$)',
+    r'([A-Z][\w\s&.,]{1,80}?)(?:\s+\-\s+[\w\s]{1,80})?(?:\s+\||\n|$)',
+    r'(?:^|\n)\s*([A-Z][\w\s&.,]{1,80}?)\s*(?:\-|\|)',
+], re.IGNORECASE)
+
+# Duration patterns
+_DURATION_PATTERNS = regex_registry.compile_all('experience.duration', [
+    r'(\d+)\s+(?:years?|yrs?)',
+    r'(\d+)\s+(?:months?|mos?)',
+    r'(19|20)\d{2}\s*[-–]\s*(19|20)\d{2}',
+    r'(19|20)\d{2}\s*[-–]\s*(?:present|current|now)',
+    r'(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+(19|20)\d{2}'
+], re.IGNORECASE)
+
+_ACHIEVEMENT_PATTERNS = regex_registry.compile_all('experience.achievement', [
+    r'[•·▪▫-]\s*([^\n\r]+)',
+    r'(?:achieved|accomplished|delivered|implemented|developed|created|built|designed|managed|led)\s+([^\n\r.]+)',
+    r'(?:responsible\s+for|duties\s+include|key\s+responsibilities)\s*:?\s*([^\n\r]+)',
+    r'(?:reduced|increased|improved|optimized|enhanced)\s+([^\n\r.]+)',
+    r'(?:\d+%|\d+\+|\$\d+)\s*(?:improvement|increase|decrease|reduction|growth|savings)'
+], re.IGNORECASE)
+
+# Enhanced certification patterns
+_CERTIFICATION_PATTERNS = regex_registry.compile_all('certifications.name', [
+    # Cloud certifications
+    r'(aws|amazon)\s+certified\s+[\w\s-]+',
+    r'(azure|microsoft)\s+certified\s+[\w\s-]+',
+    r'(gcp|google\s+cloud)\s+certified\s+[\w\s-]+',
+    # Professional certifications
+    r'(cissp|cisa|cism|ceh|oscp|gsec)',
+    r'(pmp|prince2|capm|psm|csm|safe)',
+    r'(scrum\s+master|agile\s+certified|product\s+owner)',
+    r'(itil|cobit|togaf|zachman)',
+    # Technology certifications
+    r'(oracle|oca|ocp|ocm)\s+certified',
+    r'(cisco|ccna|ccnp|ccie|ccda|ccdp)',
+    r'(vmware|vcp|vcap|vcdx)',
+    r'(red\s+hat|rhcsa|rhce|rhca)',
+    r'(comptia|a\+|network\+|security\+|linux\+)',
+    r'(salesforce|administrator|developer|architect)',
+    # General patterns
+    r'certified\s+[\w\s-]{1,80}(?:administrator|developer|architect|engineer|specialist|professional)',
+    r'[\w\s-]{1,80}\s+certification',
+    r'[\w\s-]{1,80}\s+certified',
+    # Academic and professional
+    r'(cpa|cfa|frm|phr|sphr|shrm)',
+    r'(six\s+sigma|lean|yellow\s+belt|green\s+belt|black\s+belt)',
+    r'(chartered|professional)\s+[\w\s-]+',
+], re.IGNORECASE)
+
+_CERTIFICATION_DATE_PATTERNS = regex_registry.compile_all('certifications.date', [
+    r'([\w\s-]{1,80}certified?\s+[\w\s-]{1,80})[\s,]*\(?(19|20)\d{2}\)?',
+    r'([\w\s-]{1,80}certified?\s+[\w\s-]{1,80})[\s,]*(?:in|from)?\s*(19|20)\d{2}',
+    r'(certified?\s+[\w\s-]{1,80})[\s,]*\(?(19|20)\d{2}\)?'
+], re.IGNORECASE)
+
+# Enhanced project patterns
+_PROJECT_PATTERNS = regex_registry.compile_all('projects.description', [
+    r'project[\s\w]*:?\s*([^\n\r]+)',
+    r'(?:built|developed|created|designed|implemented)\s+([^\n\r]{1,200}?)(?:using|with|in)\s+([^\n\r]+)',
+    r'(?:^|\n)\s*([A-Z][\w\s]{1,80}?)\s*[-–]\s*([^\n\r]+)',
+    r'(?:portfolio|github|demo|live)\s*:?\s*([^\n\r]+)',
+    r'(?:technologies|stack|built with)\s*:?\s*([^\n\r]+)',
+    r'[•·▪▫-]\s*([^\n\r]+?)(?:\s*[-–]\s*([^\n\r]+))?',
+    r'(?:web\s+app|mobile\s+app|application|system|platform|tool)\s*:?\s*([^\n\r]+)',
+    r'(?:open\s+source|personal|side|freelance)\s+project\s*:?\s*([^\n\r]+)'
+], re.IGNORECASE)
+
+_PROJECT_LINK_PATTERNS = regex_registry.compile_all('projects.link', [
+    r'(?:github|gitlab|bitbucket)\.com/[\w\-./]+',
+    r'(?:portfolio|demo|live|website)\s*:?\s*(https?://[^\s\n\r]+)',
+    r'(?:link|url)\s*:?\s*(https?://[^\s\n\r]+)'
+], re.IGNORECASE)
+
+
+def _run_on_document_in_worker(func, document: ParsedDocument) -> Tuple[Any, Dict[str, Any], Dict[str, Tuple[int, float, float, int]]]:
+    """Run func(document) in a worker process and return what it computed on the worker's copy"""
+    snapshot = regex_registry.snapshot_stats()
+    result = func(document)
+    return result, document.computed_views(), regex_registry.stats_since(snapshot)
+
 
 class TextProcessor:
     """Utility class for text processing operations"""
     
     def __init__(self):
-        self.chunk_size = 500
-        self.chunk_overlap = 50
+        # Both limits are in characters
+        self.chunk_size = settings.CHUNK_SIZE
+        self.chunk_overlap = settings.CHUNK_OVERLAP
+        # Overlap used when chunks are sized by a tokenizer
+        self.chunk_token_overlap = settings.CHUNK_TOKEN_OVERLAP
     
-    async def chunk_resume(self, resume_text: str) -> List[str]:
+    async def chunk_resume(
+        self,
+        resume: Union[str, ParsedDocument],
+        tokenizer: Optional[ChunkTokenizer] = None
+    ) -> List[str]:
         """
         Chunk resume text into semantic sections
         
         Args:
-            resume_text: Full resume text
+            resume: Parsed resume, or its full text
+            tokenizer: Size chunks in model tokens instead of characters
             
         Returns:
             List of text chunks
         """
         
-        # Clean text
-        cleaned_text = self._clean_text(resume_text)
-        
-        # Try to identify sections
-        sections = self._identify_resume_sections(cleaned_text)
+        resume = self._as_document(resume, 'resume')
+        if tokenizer is not None:
+            # Tokenizers stay in this process; they are not shipped to worker processes
+            return await execution_pool.run_in_thread("chunk_resume", self._chunk_resume, resume, tokenizer)
+        return await self._run_cpu_bound("chunk_resume", self._chunk_resume, resume)
+    
+    def _chunk_resume(self, resume: Union[str, ParsedDocument], tokenizer: Optional[ChunkTokenizer] = None) -> List[str]:
+        """Synchronous implementation of chunk_resume"""
         
-        if sections:
-            # If sections identified, chunk each section
-            chunks = []
-            for section_name, section_text in sections.items():
-                section_chunks = self._chunk_text(section_text, section_name)
-                chunks.extend(section_chunks)
-            return chunks
-        else:
-            # Fallback to simple chunking
-            return self._chunk_text(cleaned_text, "resume")
+        return self._chunk_sections(self._as_document(resume, 'resume'), tokenizer)
     
-    async def chunk_job_description(self, job_text: str) -> List[str]:
+    async def chunk_job_description(
+        self,
+        job_description: Union[str, ParsedDocument],
+        tokenizer: Optional[ChunkTokenizer] = None
+    ) -> List[str]:
         """
         Chunk job description text
         
         Args:
-            job_text: Full job description text
+            job_description: Parsed job description, or its full text
+            tokenizer: Size chunks in model tokens instead of characters
             
         Returns:
             List of text chunks
         """
         
-        # Clean text
-        cleaned_text = self._clean_text(job_text)
+        job_description = self._as_document(job_description, 'job_description')
+        if tokenizer is not None:
+            return await execution_pool.run_in_thread("chunk_job_description", self._chunk_job_description, job_description, tokenizer)
+        return await self._run_cpu_bound("chunk_job_description", self._chunk_job_description, job_description)
+    
+    def _chunk_job_description(
+        self,
+        job_description: Union[str, ParsedDocument],
+        tokenizer: Optional[ChunkTokenizer] = None
+    ) -> List[str]:
+        """Synchronous implementation of chunk_job_description"""
+        
+        return self._chunk_sections(self._as_document(job_description, 'job_description'), tokenizer)
+    
+    @staticmethod
+    async def _run_cpu_bound(stage: str, func, document: ParsedDocument) -> Any:
+        """
+        Run func(document) through execution_pool.run_cpu_bound
+        
+        A worker process only sees a copy of the document and of the regex
+        registry, so the views it memoized and the regex timings it recorded
+        are handed back and merged here, as if the work had run in a thread.
+        """
         
-        # Try to identify sections
-        sections = self._identify_job_sections(cleaned_text)
+        if not execution_pool.uses_processes:
+            return await execution_pool.run_cpu_bound(stage, func, document)
+        result, views, regex_stats = await execution_pool.run_cpu_bound(stage, _run_on_document_in_worker, func, document)
+        document.adopt_views(views)
+        regex_registry.merge_stats(regex_stats)
+        return result
+    
+    @staticmethod
+    def _as_document(document: Union[str, ParsedDocument], kind: str) -> ParsedDocument:
+        """Accept plain text for callers that don't have a ParsedDocument"""
         
-        if sections:
-            # If sections identified, chunk each section
+        if isinstance(document, ParsedDocument):
+            return document
+        return ParsedDocument(document, kind)
+    
+    def _chunk_sections(self, document: ParsedDocument, tokenizer: Optional[ChunkTokenizer] = None) -> List[str]:
+        """Chunk each section span in place, or the whole text if no sections were found"""
+        
+        text = document.cleaned_text
+        spans = document.section_spans
+        
+        # Tokenize once; sections are packed from slices of the same offsets
+        token_offsets = tokenizer.offsets(text) if tokenizer is not None else None
+        max_tokens = tokenizer.max_tokens if tokenizer is not None else None
+        
+        if spans:
+            # If sections identified, chunk each section in place
             chunks = []
-            for section_name, section_text in sections.items():
-                section_chunks = self._chunk_text(section_text, section_name)
-                chunks.extend(section_chunks)
+            for section_name, start, end in spans:
+                chunks.extend(self._chunk_text(text, section_name, start, end, token_offsets, max_tokens))
             return chunks
         else:
             # Fallback to simple chunking
-            return self._chunk_text(cleaned_text, "job_description")
+            return self._chunk_text(text, document.kind, token_offsets=token_offsets, max_tokens=max_tokens)
     
-    async def extract_candidate_profile(self, resume_text: str) -> Dict[str, Any]:
+    async def extract_candidate_profile(self, resume: Union[str, ParsedDocument]) -> Dict[str, Any]:
         """
         Extract candidate profile information from resume
         
         Args:
-            resume_text: Full resume text
+            resume: Parsed resume, or its full text
             
         Returns:
             Dict containing extracted profile information
         """
         
-        text = self._clean_text(resume_text)
+        resume = self._as_document(resume, 'resume')
+        return await self._run_cpu_bound("extract_candidate_profile", self._extract_candidate_profile, resume)
+    
+    def _extract_candidate_profile(self, resume: Union[str, ParsedDocument]) -> Dict[str, Any]:
+        """Synchronous implementation of extract_candidate_profile"""
         
-        # Extract different sections
-        education = self._extract_education(text)
-        skills = self._extract_skills(text)
-        experience = self._extract_experience(text)
-        certifications = self._extract_certifications(text)
-        projects = self._extract_projects(text)
+        # Cleaning and segmentation are memoized on the document and shared with chunking
+        document = self._as_document(resume, 'resume')
+        
+        # Extract different sections; a pathological document can only spend its
+        # regex budget once, after which the remaining extractors return nothing
+        with regex_registry.budget():
+            education = self._run_extractor(self._extract_education, document)
+            skills = self._run_extractor(self._extract_skills, document)
+            experience = self._run_extractor(self._extract_experience, document)
+            certifications = self._run_extractor(self._extract_certifications, document)
+            projects = self._run_extractor(self._extract_projects, document)
         
         return {
             'education': education,
@@ -93,158 +297,58 @@ class TextProcessor:
             'projects': projects
         }
     
+    @staticmethod
+    def _run_extractor(extractor, document: ParsedDocument) -> List[str]:
+        """Run one profile extractor, returning nothing once the regex budget is spent"""
+        
+        try:
+            return extractor(document)
+        except RegexBudgetExceeded as e:
+            print(f"Skipping {extractor.__name__}: {str(e)}")
+            return []
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.\,\:\;\-\(\)\[\]\/\@\+\#\&\%\$]', '', text)
-        
-        # Normalize case for better processing
-        return text.strip()
+        return clean_text(text)
     
     def _identify_resume_sections(self, text: str) -> Dict[str, str]:
-        """Identify and extract resume sections"""
-        
-        sections = {}
-        
-        # Common section headers
-        section_patterns = {
-            'education': r'(education|academic|qualifications|degrees?)',
-            'experience': r'(experience|employment|work\s+history|career|professional)',
-            'skills': r'(skills|competencies|technical|technologies|tools)',
-            'projects': r'(projects|portfolio|achievements|accomplishments)',
-            'certifications': r'(certifications?|certificates?|licenses?)',
-            'summary': r'(summary|objective|profile|about)'
-        }
-        
-        text_lower = text.lower()
-        
-        for section_name, pattern in section_patterns.items():
-            # Find section start
-            match = re.search(f'\\b{pattern}\\b', text_lower)
-            if match:
-                start_pos = match.start()
-                
-                # Find next section or end of text
-                remaining_text = text_lower[start_pos:]
-                next_section_match = None
-                
-                for other_pattern in section_patterns.values():
-                    if other_pattern != pattern:
-                        next_match = re.search(f'\\b{other_pattern}\\b', remaining_text[50:])
-                        if next_match:
-                            if next_section_match is None or next_match.start() < next_section_match.start():
-                                next_section_match = next_match
-                
-                if next_section_match:
-                    end_pos = start_pos + 50 + next_section_match.start()
-                    section_text = text[start_pos:end_pos]
-                else:
-                    section_text = text[start_pos:]
-                
-                sections[section_name] = section_text.strip()
+        """Identify and extract resume sections, in document order"""
         
-        return sections
+        spans = segment_sections(text, RESUME_SECTION_HEADERS)
+        return {section: text[start:end].strip() for section, start, end in spans}
     
     def _identify_job_sections(self, text: str) -> Dict[str, str]:
-        """Identify and extract job description sections"""
+        """Identify and extract job description sections, in document order"""
         
-        sections = {}
-        
-        # Common job section headers
-        section_patterns = {
-            'requirements': r'(requirements?|qualifications?|skills?|must\s+have)',
-            'responsibilities': r'(responsibilities?|duties|role|what\s+you|you\s+will)',
-            'benefits': r'(benefits?|perks?|compensation|salary|package)',
-            'about': r'(about|company|organization|team|mission)',
-            'preferred': r'(preferred|nice\s+to\s+have|bonus|plus)'
-        }
-        
-        text_lower = text.lower()
-        
-        for section_name, pattern in section_patterns.items():
-            match = re.search(f'\\b{pattern}\\b', text_lower)
-            if match:
-                start_pos = match.start()
-                
-                # Find next section or end of text
-                remaining_text = text_lower[start_pos:]
-                next_section_match = None
-                
-                for other_pattern in section_patterns.values():
-                    if other_pattern != pattern:
-                        next_match = re.search(f'\\b{other_pattern}\\b', remaining_text[50:])
-                        if next_match:
-                            if next_section_match is None or next_match.start() < next_section_match.start():
-                                next_section_match = next_match
-                
-                if next_section_match:
-                    end_pos = start_pos + 50 + next_section_match.start()
-                    section_text = text[start_pos:end_pos]
-                else:
-                    section_text = text[start_pos:]
-                
-                sections[section_name] = section_text.strip()
-        
-        return sections
+        spans = segment_sections(text, JOB_SECTION_HEADERS)
+        return {section: text[start:end].strip() for section, start, end in spans}
     
-    def _chunk_text(self, text: str, section_name: str = "") -> List[str]:
-        """Chunk text into smaller pieces"""
-        
-        if len(text) <= self.chunk_size:
-            return [text]
-        
-        chunks = []
-        words = text.split()
-        current_chunk = []
-        current_size = 0
-        
-        for word in words:
-            word_size = len(word) + 1  # +1 for space
-            
-            if current_size + word_size > self.chunk_size and current_chunk:
-                # Create chunk
-                chunk_text = ' '.join(current_chunk)
-                chunks.append(chunk_text)
-                
-                # Start new chunk with overlap
-                overlap_words = current_chunk[-self.chunk_overlap:] if len(current_chunk) > self.chunk_overlap else current_chunk
-                current_chunk = overlap_words + [word]
-                current_size = sum(len(w) + 1 for w in current_chunk)
-            else:
-                current_chunk.append(word)
-                current_size += word_size
-        
-        # Add final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
-            chunks.append(chunk_text)
-        
-        return chunks
+    def _chunk_text(
+        self,
+        text: str,
+        section_name: str = "",
+        start: int = 0,
+        end: Optional[int] = None,
+        token_offsets: Optional[List[Tuple[int, int]]] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[str]:
+        """Chunk text[start:end] by characters, or into max_tokens-token pieces when token offsets are given"""
+        
+        if token_offsets is not None:
+            return [
+                text[chunk_start:chunk_end]
+                for chunk_start, chunk_end in token_chunk_spans(token_offsets, max_tokens, self.chunk_token_overlap, start, end)
+            ]
+        return chunk_text(text, self.chunk_size, self.chunk_overlap, start, end)
     
-    def _extract_education(self, text: str) -> List[str]:
+    def _extract_education(self, document: ParsedDocument) -> List[str]:
         """Extract education information"""
         
         education = []
         
-        # Enhanced degree patterns with better capture groups
-        degree_patterns = [
-            r'(bachelor(?:\'s)?|master(?:\'s)?|phd|doctorate|associate|diploma|certificate)[\s\w]*(?:in|of)\s+([\w\s,]+?)(?=\.|,|\n|$)',
-            r'(b\.?[sa]\.?|m\.?[sa]\.?|m\.?s\.?|ph\.?d\.?|b\.?eng\.?|m\.?eng\.?)[\s\w]*(?:in|of)\s+([\w\s,]+?)(?=\.|,|\n|$)',
-            r'(university|college|institute|school)[\s\w]*(?:of|in)\s+([\w\s,]+?)(?=\.|,|\n|graduated|$)',
-            r'graduated\s+from\s+([\w\s,]+?)(?=\.|,|\n|with|$)',
-            r'degree\s+in\s+([\w\s,]+?)(?=\.|,|\n|from|$)',
-            r'major\s+in\s+([\w\s,]+?)(?=\.|,|\n|from|$)',
-            r'studied\s+([\w\s,]+?)(?=\.|,|\n|at|$)',
-            r'gpa[\s:]*(\d+\.?\d*)\s*/?\s*(\d+\.?\d*)?',
-            r'(cum\s+laude|magna\s+cum\s+laude|summa\s+cum\s+laude|honors?|dean\'s\s+list)'
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _DEGREE_PATTERNS:
+            matches = pattern.findall(document.cleaned_text)
             for match in matches:
                 if isinstance(match, tuple):
                     # Join non-empty parts of the tuple
@@ -256,16 +360,10 @@ class TextProcessor:
                     education.append(education_item)
         
         # Also look for years/dates in education section
-        education_section = self._find_section_text(text, 'education')
+        education_section = document.section_text('education')
         if education_section:
-            date_patterns = [
-                r'(19|20)\d{2}[-\s]*(19|20)\d{2}',
-                r'(19|20)\d{2}',
-                r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(19|20)\d{2}'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, education_section, re.IGNORECASE)
+            for pattern in _EDUCATION_DATE_PATTERNS:
+                matches = pattern.findall(education_section)
                 for match in matches:
                     if isinstance(match, tuple):
                         date_str = ''.join(match)
@@ -273,177 +371,62 @@ class TextProcessor:
                         date_str = match
                     education.append(f"Year: {date_str}")
         
-        return list(set(education))[:10]  # Increase limit
-    
-    def _find_section_text(self, text: str, section_name: str) -> str:
-        """Find and extract text from a specific section"""
-        
-        section_patterns = {
-            'education': r'education|academic|qualifications|degrees?',
-            'experience': r'experience|employment|work\s+history|professional',
-            'skills': r'skills|technologies|technical|competencies',
-            'projects': r'projects?|portfolio|work\s+samples',
-            'certifications': r'certifications?|licenses?|credentials'
-        }
-        
-        pattern = section_patterns.get(section_name.lower(), section_name)
-        
-        # Find section start
-        section_match = re.search(f'\\b{pattern}\\b', text, re.IGNORECASE)
-        if not section_match:
-            return ""
-        
-        start_pos = section_match.start()
-        
-        # Find next section or end
-        remaining_text = text[start_pos + 100:]  # Skip current section header
-        next_section_patterns = [
-            r'\b(education|experience|skills|projects?|certifications?|summary|objective|contact|references?)\b'
-        ]
-        
-        end_pos = len(text)
-        for pattern in next_section_patterns:
-            next_match = re.search(pattern, remaining_text, re.IGNORECASE)
-            if next_match:
-                end_pos = start_pos + 100 + next_match.start()
-                break
-        
-        return text[start_pos:end_pos]
+        return list(dict.fromkeys(education))[:10]  # Increase limit
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, document: ParsedDocument) -> List[str]:
         """Extract skills from text"""
         
         skills = []
         
         # Get skills section specifically
-        skills_section = self._find_section_text(text, 'skills')
-        text_to_search = skills_section if skills_section else text
-        
-        # Expanded technical skills database
-        tech_skills = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin',
-            'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
-            # Web Technologies
-            'react', 'angular', 'vue', 'nodejs', 'express', 'fastapi', 'django', 'flask',
-            'html', 'css', 'bootstrap', 'tailwind', 'sass', 'less', 'webpack', 'vite',
-            'next.js', 'nuxt.js', 'svelte', 'jquery', 'redux', 'mobx', 'graphql', 'rest api',
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-            'oracle', 'sqlite', 'mariadb', 'dynamodb', 'neo4j', 'influxdb',
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible',
-            'jenkins', 'gitlab ci', 'github actions', 'ci/cd', 'vagrant', 'chef', 'puppet',
-            # Tools & Platforms
-            'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack',
-            'visual studio', 'vs code', 'intellij', 'eclipse', 'pycharm',
-            # AI/ML
-            'machine learning', 'deep learning', 'ai', 'nlp', 'computer vision',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
-            'jupyter', 'keras', 'opencv', 'hugging face',
-            # Operating Systems
-            'linux', 'windows', 'macos', 'ubuntu', 'centos', 'debian', 'fedora',
-            # Mobile Development
-            'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic',
-            # Testing
-            'unit testing', 'integration testing', 'selenium', 'cypress', 'jest', 'mocha',
-            'pytest', 'junit', 'testng', 'cucumber'
-        ]
-        
-        text_lower = text_to_search.lower()
+        skills_section = document.section_text('skills')
+        text_to_search = skills_section if skills_section else document.cleaned_text
         
         # Direct skill matching
-        for skill in tech_skills:
-            if skill in text_lower:
-                skills.append(skill.title())
+        lower_text = document.section_text('skills', lower=True) if skills_section else document.lower_text
+        for skill in skill_taxonomy.find(lower_text, is_lower=True):
+            skills.append(skill.title())
         
         # Pattern-based skill extraction
-        skill_patterns = [
-            r'(?:proficient|skilled|experienced|expert)\s+(?:in|with)\s+([\w\s,]+?)(?=\.|,|\n|$)',
-            r'(?:knowledge|experience)\s+(?:of|in|with)\s+([\w\s,]+?)(?=\.|,|\n|$)',
-            r'(?:familiar|comfortable)\s+with\s+([\w\s,]+?)(?=\.|,|\n|$)',
-            r'(?:using|worked with|utilized)\s+([\w\s,]+?)(?=\.|,|\n|$)',
-            r'(?:languages?|technologies?|tools?|frameworks?|platforms?)[:\s]+([\w\s,/]+?)(?=\.|,|\n|$)',
-            r'(?:including|such as)[:\s]+([\w\s,/]+?)(?=\.|,|\n|$)'
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _SKILL_PHRASE_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 # Split by common delimiters
-                skill_list = re.split(r'[,/|&;]', match)
+                skill_list = _SKILL_DELIMITERS.split(match)
                 for skill in skill_list:
                     skill = skill.strip()
                     if skill and len(skill) > 2 and len(skill) < 50:
                         skills.append(skill.title())
         
         # Also extract from bullet points
-        bullet_patterns = [
-            r'[•·▪▫-]\s*([^\n\r]+)',
-            r'^\s*[*-]\s*([^\n\r]+)',
-        ]
-        
-        for pattern in bullet_patterns:
-            matches = re.findall(pattern, text_to_search, re.MULTILINE)
+        for pattern in _SKILL_BULLET_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 match = match.strip()
                 if len(match) > 5 and len(match) < 100:
                     skills.append(match)
         
-        return list(set(skills))[:20]  # Increased limit
+        return list(dict.fromkeys(skills))[:20]  # Increased limit
     
-    def _extract_experience(self, text: str) -> List[str]:
+    def _extract_experience(self, document: ParsedDocument) -> List[str]:
         """Extract work experience"""
         
         experience = []
         
         # Get experience section specifically
-        experience_section = self._find_section_text(text, 'experience')
-        text_to_search = experience_section if experience_section else text
-        
-        # Enhanced job title patterns
-        job_title_patterns = [
-            r'(software\s+engineer|senior\s+software\s+engineer|lead\s+software\s+engineer|principal\s+software\s+engineer)',
-            r'(developer|web\s+developer|full\s+stack\s+developer|frontend\s+developer|backend\s+developer)',
-            r'(architect|technical\s+architect|solution\s+architect|system\s+architect)',
-            r'(manager|engineering\s+manager|project\s+manager|product\s+manager|team\s+lead)',
-            r'(analyst|data\s+analyst|business\s+analyst|system\s+analyst)',
-            r'(consultant|technical\s+consultant|solutions\s+consultant)',
-            r'(specialist|technical\s+specialist|it\s+specialist)',
-            r'(devops|sre|site\s+reliability\s+engineer|infrastructure\s+engineer)',
-            r'(qa|quality\s+assurance|test\s+engineer|automation\s+engineer)',
-            r'(data\s+scientist|machine\s+learning\s+engineer|ai\s+engineer)',
-            r'(cto|cio|vp\s+engineering|director\s+of\s+engineering)',
-            r'(intern|internship|graduate\s+trainee|junior|senior|lead|principal)'
-        ]
-        
-        # Company and employment patterns
-        company_patterns = [
-            r'(?:at|@)\s+([A-Z][\w\s&.,]+?)(?:\s+\||,|\n|$)',
-            r'(?:worked\s+at|employed\s+at|company:)\s+([A-Z][\w\s&.,]+?)(?:\s+\||,|\n|$)',
-            r'([A-Z][\w\s&.,]+?)(?:\s+\-\s+[\w\s]+)?(?:\s+\||\n|$)',
-            r'(?:^|\n)\s*([A-Z][\w\s&.,]+?)\s*(?:\-|\|)',
-        ]
-        
-        # Duration patterns
-        duration_patterns = [
-            r'(\d+)\s+(?:years?|yrs?)',
-            r'(\d+)\s+(?:months?|mos?)',
-            r'(19|20)\d{2}\s*[-–]\s*(19|20)\d{2}',
-            r'(19|20)\d{2}\s*[-–]\s*(?:present|current|now)',
-            r'(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+(19|20)\d{2}'
-        ]
+        experience_section = document.section_text('experience')
+        text_to_search = experience_section if experience_section else document.cleaned_text
         
         # Extract job titles
-        for pattern in job_title_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _JOB_TITLE_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, str):
                     experience.append(f"Role: {match.title()}")
         
         # Extract companies
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _COMPANY_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, str) and len(match.strip()) > 2:
                     company = match.strip()
@@ -451,8 +434,8 @@ class TextProcessor:
                         experience.append(f"Company: {company}")
         
         # Extract durations
-        for pattern in duration_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _DURATION_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, tuple):
                     duration = ' '.join([part for part in match if part])
@@ -461,63 +444,27 @@ class TextProcessor:
                 experience.append(f"Duration: {duration}")
         
         # Extract achievements and responsibilities
-        achievement_patterns = [
-            r'[•·▪▫-]\s*([^\n\r]+)',
-            r'(?:achieved|accomplished|delivered|implemented|developed|created|built|designed|managed|led)\s+([^\n\r.]+)',
-            r'(?:responsible\s+for|duties\s+include|key\s+responsibilities)\s*:?\s*([^\n\r]+)',
-            r'(?:reduced|increased|improved|optimized|enhanced)\s+([^\n\r.]+)',
-            r'(?:\d+%|\d+\+|\$\d+)\s*(?:improvement|increase|decrease|reduction|growth|savings)'
-        ]
-        
-        for pattern in achievement_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _ACHIEVEMENT_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, str):
                     achievement = match.strip()
                     if len(achievement) > 10 and len(achievement) < 200:
                         experience.append(f"Achievement: {achievement}")
         
-        return list(set(experience))[:15]  # Increased limit
+        return list(dict.fromkeys(experience))[:15]  # Increased limit
     
-    def _extract_certifications(self, text: str) -> List[str]:
+    def _extract_certifications(self, document: ParsedDocument) -> List[str]:
         """Extract certifications"""
         
         certifications = []
         
         # Get certifications section specifically
-        cert_section = self._find_section_text(text, 'certifications')
-        text_to_search = cert_section if cert_section else text
-        
-        # Enhanced certification patterns
-        cert_patterns = [
-            # Cloud certifications
-            r'(aws|amazon)\s+certified\s+[\w\s-]+',
-            r'(azure|microsoft)\s+certified\s+[\w\s-]+',
-            r'(gcp|google\s+cloud)\s+certified\s+[\w\s-]+',
-            # Professional certifications
-            r'(cissp|cisa|cism|ceh|oscp|gsec)',
-            r'(pmp|prince2|capm|psm|csm|safe)',
-            r'(scrum\s+master|agile\s+certified|product\s+owner)',
-            r'(itil|cobit|togaf|zachman)',
-            # Technology certifications
-            r'(oracle|oca|ocp|ocm)\s+certified',
-            r'(cisco|ccna|ccnp|ccie|ccda|ccdp)',
-            r'(vmware|vcp|vcap|vcdx)',
-            r'(red\s+hat|rhcsa|rhce|rhca)',
-            r'(comptia|a\+|network\+|security\+|linux\+)',
-            r'(salesforce|administrator|developer|architect)',
-            # General patterns
-            r'certified\s+[\w\s-]+(?:administrator|developer|architect|engineer|specialist|professional)',
-            r'[\w\s-]+\s+certification',
-            r'[\w\s-]+\s+certified',
-            # Academic and professional
-            r'(cpa|cfa|frm|phr|sphr|shrm)',
-            r'(six\s+sigma|lean|yellow\s+belt|green\s+belt|black\s+belt)',
-            r'(chartered|professional)\s+[\w\s-]+',
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        cert_section = document.section_text('certifications')
+        text_to_search = cert_section if cert_section else document.cleaned_text
+        
+        for pattern in _CERTIFICATION_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, str):
                     cert = match.strip()
@@ -526,14 +473,8 @@ class TextProcessor:
         
         # Extract certification years/dates
         cert_with_dates = []
-        date_patterns = [
-            r'([\w\s-]+certified?\s+[\w\s-]+)[\s,]*\(?(19|20)\d{2}\)?',
-            r'([\w\s-]+certified?\s+[\w\s-]+)[\s,]*(?:in|from)?\s*(19|20)\d{2}',
-            r'(certified?\s+[\w\s-]+)[\s,]*\(?(19|20)\d{2}\)?'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _CERTIFICATION_DATE_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, tuple):
                     cert_name = match[0].strip()
@@ -543,31 +484,19 @@ class TextProcessor:
         
         certifications.extend(cert_with_dates)
         
-        return list(set(certifications))[:10]
+        return list(dict.fromkeys(certifications))[:10]
     
-    def _extract_projects(self, text: str) -> List[str]:
+    def _extract_projects(self, document: ParsedDocument) -> List[str]:
         """Extract project information"""
         
         projects = []
         
         # Get projects section specifically
-        projects_section = self._find_section_text(text, 'projects')
-        text_to_search = projects_section if projects_section else text
-        
-        # Enhanced project patterns
-        project_patterns = [
-            r'project[\s\w]*:?\s*([^\n\r]+)',
-            r'(?:built|developed|created|designed|implemented)\s+([^\n\r]+?)(?:using|with|in)\s+([^\n\r]+)',
-            r'(?:^|\n)\s*([A-Z][\w\s]+?)\s*[-–]\s*([^\n\r]+)',
-            r'(?:portfolio|github|demo|live)\s*:?\s*([^\n\r]+)',
-            r'(?:technologies|stack|built with)\s*:?\s*([^\n\r]+)',
-            r'[•·▪▫-]\s*([^\n\r]+?)(?:\s*[-–]\s*([^\n\r]+))?',
-            r'(?:web\s+app|mobile\s+app|application|system|platform|tool)\s*:?\s*([^\n\r]+)',
-            r'(?:open\s+source|personal|side|freelance)\s+project\s*:?\s*([^\n\r]+)'
-        ]
-        
-        for pattern in project_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        projects_section = document.section_text('projects')
+        text_to_search = projects_section if projects_section else document.cleaned_text
+        
+        for pattern in _PROJECT_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, tuple):
                     # Join non-empty parts
@@ -579,16 +508,10 @@ class TextProcessor:
                     projects.append(project_info)
         
         # Extract GitHub/portfolio links
-        link_patterns = [
-            r'(?:github|gitlab|bitbucket)\.com/[\w\-./]+',
-            r'(?:portfolio|demo|live|website)\s*:?\s*(https?://[^\s\n\r]+)',
-            r'(?:link|url)\s*:?\s*(https?://[^\s\n\r]+)'
-        ]
-        
-        for pattern in link_patterns:
-            matches = re.findall(pattern, text_to_search, re.IGNORECASE)
+        for pattern in _PROJECT_LINK_PATTERNS:
+            matches = pattern.findall(text_to_search)
             for match in matches:
                 if isinstance(match, str):
                     projects.append(f"Link: {match}")
         
-        return list(set(projects))[:10]
+        return list(dict.fromkeys(projects))[:10]
@@ -0,0 +1,59 @@
+from typing import Any, Dict, Optional
+from bestpractice.config import settings
+from bestpractice.utils.regex_registry import TimedPattern
+
+# Emitted by extractors for glyphs they could not map to text
+_REPLACEMENT_CHAR = '\ufffd'
+
+
+def assess_extraction(
+    text: str,
+    pages: int,
+    headers: TimedPattern,
+    min_chars_per_page: Optional[int] = None,
+    min_printable_ratio: Optional[float] = None,
+    min_section_headers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Decide whether locally extracted text is good enough to skip remote parsing
+
+    Scanned pages extract to little or no text, and PDFs with broken font
+    encodings extract to control, private-use or replacement characters;
+    both rarely contain recognizable section headers.
+
+    Args:
+        text: Extracted text
+        pages: Page count (1 for formats without pages)
+        headers: Section header pattern with one named group per section (segmentation)
+        min_chars_per_page: Defaults to LOCAL_PARSE_MIN_CHARS_PER_PAGE
+        min_printable_ratio: Defaults to LOCAL_PARSE_MIN_PRINTABLE_RATIO
+        min_section_headers: Distinct sections required, defaults to LOCAL_PARSE_MIN_SECTION_HEADERS
+
+    Returns:
+        Dict with chars_per_page, printable_ratio, section_headers, passed and the failed checks
+    """
+    min_chars_per_page = min_chars_per_page if min_chars_per_page is not None else settings.LOCAL_PARSE_MIN_CHARS_PER_PAGE
+    min_printable_ratio = min_printable_ratio if min_printable_ratio is not None else settings.LOCAL_PARSE_MIN_PRINTABLE_RATIO
+    min_section_headers = min_section_headers if min_section_headers is not None else settings.LOCAL_PARSE_MIN_SECTION_HEADERS
+
+    stripped = ''.join(text.split())
+    chars_per_page = len(stripped) / max(1, pages)
+    printable = sum(1 for char in stripped if char.isprintable() and char != _REPLACEMENT_CHAR)
+    printable_ratio = printable / len(stripped) if stripped else 0.0
+    sections = {match.lastgroup for match in headers.finditer(text.lower())}
+
+    failed = []
+    if chars_per_page < min_chars_per_page:
+        failed.append('text_density')
+    if printable_ratio < min_printable_ratio:
+        failed.append('printable_ratio')
+    if len(sections) < min_section_headers:
+        failed.append('section_headers')
+
+    return {
+        'chars_per_page': round(chars_per_page, 1),
+        'printable_ratio': round(printable_ratio, 4),
+        'section_headers': len(sections),
+        'passed': not failed,
+        'failed_checks': failed
+    }
@@ -0,0 +1,173 @@
+import io
+import json
+from typing import BinaryIO, Optional, Union
+from fastapi import UploadFile
+from bestpractice.config import settings
+
+# Bytes read from an upload per await
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds its size limit"""
+
+    def __init__(self, filename: Optional[str], limit: int):
+        self.filename = filename
+        self.limit = limit
+        subject = f"File {filename}" if filename else "Request body"
+        super().__init__(f"{subject} exceeds the {limit} byte limit")
+
+
+class UploadedDocument:
+    """
+    An uploaded file handed to the parser without writing it to disk
+
+    Small uploads are held as bytes. Uploads above UPLOAD_SPOOL_THRESHOLD keep
+    the spooled file the multipart parser already wrote them to, instead of
+    being copied into memory.
+    """
+
+    def __init__(self, filename: str, content: Union[bytes, BinaryIO], size: int):
+        """
+        Args:
+            filename: Original filename; its extension selects the extractor
+            content: File bytes, or a seekable binary file positioned anywhere
+            size: Size in bytes
+        """
+        self.filename = filename
+        self.content = content
+        self.size = size
+
+    @property
+    def spooled(self) -> bool:
+        return not isinstance(self.content, bytes)
+
+    def read(self) -> bytes:
+        """Whole file as bytes"""
+        if isinstance(self.content, bytes):
+            return self.content
+        self.content.seek(0)
+        return self.content.read()
+
+    def open(self) -> BinaryIO:
+        """Binary file object positioned at the start; the caller must not close a spooled file"""
+        if isinstance(self.content, bytes):
+            return io.BytesIO(self.content)
+        self.content.seek(0)
+        return self.content
+
+
+async def read_upload(upload: UploadFile, max_bytes: Optional[int] = None, spool_threshold: Optional[int] = None) -> UploadedDocument:
+    """
+    Read an upload in chunks, enforcing the size limit as it goes
+
+    Args:
+        upload: File from a multipart request
+        max_bytes: Size limit (defaults to MAX_FILE_SIZE)
+        spool_threshold: Larger files stay in their spooled file (defaults to UPLOAD_SPOOL_THRESHOLD)
+
+    Returns:
+        UploadedDocument with the file contents
+
+    Raises:
+        UploadTooLarge: If the file is larger than max_bytes
+    """
+    max_bytes = max_bytes if max_bytes is not None else settings.MAX_FILE_SIZE
+    spool_threshold = spool_threshold if spool_threshold is not None else settings.UPLOAD_SPOOL_THRESHOLD
+
+    # The multipart parser records the size, so oversized files are rejected without reading them
+    if upload.size is not None:
+        if upload.size > max_bytes:
+            raise UploadTooLarge(upload.filename, max_bytes)
+        if upload.size > spool_threshold:
+            await upload.seek(0)
+            return UploadedDocument(upload.filename, upload.file, upload.size)
+
+    chunks = []
+    size = 0
+    while True:
+        chunk = await upload.read(UPLOAD_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadTooLarge(upload.filename, max_bytes)
+        chunks.append(chunk)
+    return UploadedDocument(upload.filename, b''.join(chunks), size)
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject request bodies larger than a limit while they stream in
+
+    Requests declaring a larger Content-Length are refused before any of the
+    body is read; otherwise received bytes are counted and the request is
+    answered with 413 as soon as the limit is crossed, before multipart
+    parsing spools the rest. The application then sees the client as
+    disconnected and anything it sends afterwards is dropped.
+    """
+
+    def __init__(self, app, max_bytes: Optional[int] = None):
+        """
+        Args:
+            app: ASGI application to wrap
+            max_bytes: Body size limit (defaults to MAX_REQUEST_SIZE, read per request), 0 = unlimited
+        """
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        max_bytes = self.max_bytes if self.max_bytes is not None else settings.MAX_REQUEST_SIZE
+        if scope['type'] != 'http' or max_bytes <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope['headers']).get(b'content-length')
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+            await self._reject(send, max_bytes)
+            return
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive():
+            nonlocal received, rejected
+            if rejected:
+                return {'type': 'http.disconnect'}
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > max_bytes:
+                    # Signal through the protocol rather than an exception, which
+                    # body parsers would catch and turn into a 400
+                    if not response_started:
+                        rejected = True
+                        await self._reject(send, max_bytes)
+                    return {'type': 'http.disconnect'}
+            return message
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if rejected:
+                return
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except Exception:
+            # The application failing on the simulated disconnect is expected
+            if not rejected:
+                raise
+
+    @staticmethod
+    async def _reject(send, max_bytes: int):
+        body = json.dumps({"detail": f"Request body exceeds the {max_bytes} byte limit"}).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 413,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('ascii'))]
+        })
+        await send({'type': 'http.response.body', 'body': body})
@@ -0,0 +1,43 @@
+import asyncio
+from bestpractice.utils.bulk import BulkProfileExtractor
+from bestpractice.utils.text_processing import TextProcessor
+
+RESUMES = [
+    f"""Candidate {i}
+Education
+Bachelor of Science in Computer Science, {2010 + i}
+Experience
+Software Engineer at Company {i}, {2012 + i} - present
+Built {skill} services using Python
+Skills
+{skill}, SQL, Docker
+"""
+    for i, skill in enumerate(['Python', 'Kubernetes', 'Java', 'React', 'Go', 'Rust', 'Scala'])
+]
+
+
+def test_bulk_extraction_matches_serial_results_in_input_order():
+    # Item 3 is not text and fails inside its worker
+    backlog = RESUMES[:3] + [None] + RESUMES[3:]
+    extractor = BulkProfileExtractor(workers=2, batch_size=2, max_pending=2)
+
+    results = list(extractor.extract(iter(backlog), progress_every=0))
+
+    assert [result['index'] for result in results] == list(range(len(backlog)))
+    assert 'error' in results[3]
+    assert 'profile' not in results[3]
+
+    processor = TextProcessor()
+
+    async def serial(resume):
+        return await processor.extract_candidate_profile(resume), await processor.chunk_resume(resume)
+
+    for index, resume in enumerate(backlog):
+        if resume is None:
+            continue
+        profile, chunks = asyncio.run(serial(resume))
+        assert results[index]['profile'] == profile
+        assert results[index]['chunks'] == chunks
+
+    stats = extractor.get_stats()
+    assert (stats['documents'], stats['errors'], stats['batches']) == (len(backlog), 1, 4)
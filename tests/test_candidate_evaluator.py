@@ -0,0 +1,142 @@
+import asyncio
+import time
+import zlib
+import numpy as np
+import pytest
+from bestpractice.config import settings
+from bestpractice.models.document import ParsedDocument
+from bestpractice.services import candidate_evaluator as candidate_evaluator_module
+from bestpractice.services.candidate_evaluator import CandidateEvaluator
+from bestpractice.services.talent_pool import TalentPool
+
+DIMENSION = 8
+EMBEDDING_DIMENSION = 64
+
+JOB_DESCRIPTION = """Backend Engineer
+Requirements
+Python services
+Kubernetes clusters
+PostgreSQL databases
+"""
+
+RESUMES = {
+    f"resume-{i}.pdf": f"""Candidate {i}
+Experience
+Built {skill} for {years} years at company {i}
+Skills
+{skill}, {other}
+"""
+    for i, (skill, other, years) in enumerate([
+        ('Python services', 'Django', 3),
+        ('Kubernetes clusters', 'Helm', 5),
+        ('PostgreSQL databases', 'Redis', 2),
+        ('Java applications', 'Spring', 7),
+        ('Python services', 'PostgreSQL databases', 4),
+        ('Kubernetes clusters', 'Python services', 6)
+    ])
+}
+
+
+@pytest.fixture
+def evaluator(tmp_path, monkeypatch):
+    pool = TalentPool(str(tmp_path / 'pool'), DIMENSION, mmap=False)
+    pool.add_resume('alice', ['Python developer'], np.ones((1, DIMENSION), dtype=np.float32))
+    monkeypatch.setattr(candidate_evaluator_module, 'talent_pool', pool)
+
+    return CandidateEvaluator()
+
+
+@pytest.mark.parametrize('empty_embeddings', [np.array([]), np.empty((0, DIMENSION), dtype=np.float32)])
+def test_search_talent_pool_without_requirements(evaluator, monkeypatch, empty_embeddings):
+    # A job description from which no requirements were extracted
+    async def prepare_job_description(job_description_path, deadline=None):
+        return {'requirements': [], 'requirement_embeddings': empty_embeddings, 'stage_timings': {}}
+
+    monkeypatch.setattr(evaluator, 'prepare_job_description', prepare_job_description)
+    result = asyncio.run(evaluator.search_talent_pool('job.txt'))
+
+    assert result['candidates'] == []
+    assert result['job_requirements'] == []
+    assert result['search_seconds'] == 0.0
+
+
+def test_batch_parses_share_one_deadline(evaluator, monkeypatch):
+    deadlines = []
+
+    async def parse(source, filename, kind='resume', deadline=None):
+        deadlines.append(deadline)
+        raise ValueError("unreadable")
+
+    monkeypatch.setattr(evaluator.document_parser, 'parse', parse)
+    started = time.monotonic()
+    results = asyncio.run(evaluator.index_resumes(['a.pdf', 'b.pdf', 'c.pdf'], ['a', 'b', 'c'], max_concurrency=1))
+
+    assert [result['error'] for result in results] == ['unreadable'] * 3
+    assert len(deadlines) == 3 and len(set(deadlines)) == 1
+    assert started < deadlines[0] <= time.monotonic() + settings.PARSE_DEADLINE_SECONDS
+
+
+class StubEmbeddingService:
+    """Deterministic bag-of-words embeddings that yield to the event loop on every call"""
+
+    async def generate_embeddings(self, texts):
+        await asyncio.sleep(0)
+        embeddings = np.zeros((len(texts), EMBEDDING_DIMENSION), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                embeddings[row, zlib.crc32(word.encode('utf-8')) % EMBEDDING_DIMENSION] += 1.0
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+    async def measure_chunks(self, chunks):
+        return {'chunks': len(chunks)}
+
+    def get_embedding_dimension(self):
+        return EMBEDDING_DIMENSION
+
+
+class StubLLMEvaluator:
+    """Echoes the retrieved chunks back so any leak between evaluations changes the response"""
+
+    async def extract_job_requirements(self, job_description):
+        await asyncio.sleep(0)
+        return ['Python services', 'Kubernetes clusters', 'PostgreSQL databases']
+
+    async def evaluate_candidate_fit(self, candidate_profile, job_requirements, relevant_resume_chunks, job_description):
+        await asyncio.sleep(0)
+        return {
+            'fit_percentage': float(len(relevant_resume_chunks)),
+            'explanation': ' | '.join(relevant_resume_chunks),
+            'strengths': list(relevant_resume_chunks)
+        }
+
+
+def test_concurrent_evaluations_match_serial_runs(evaluator, monkeypatch):
+    monkeypatch.setattr(settings, 'CHUNKING_MODE', 'characters')
+    documents = {'job.txt': JOB_DESCRIPTION, **RESUMES}
+
+    async def parse(source, filename, kind='resume', deadline=None):
+        await asyncio.sleep(0)
+        return ParsedDocument(documents[source], kind)
+
+    monkeypatch.setattr(evaluator.document_parser, 'parse', parse)
+    evaluator.embedding_service = StubEmbeddingService()
+    evaluator.llm_evaluator = StubLLMEvaluator()
+
+    async def evaluate(resume):
+        response = await evaluator.evaluate_candidate(resume, 'job.txt', candidate_name=resume)
+        return response.model_dump(exclude={'stage_timings'})
+
+    async def serial():
+        return [await evaluate(resume) for resume in RESUMES]
+
+    async def concurrent():
+        return await asyncio.gather(*(evaluate(resume) for resume in RESUMES))
+
+    expected = asyncio.run(serial())
+    # Each resume retrieves only its own chunks
+    assert all(result['explanation'] for result in expected)
+    assert len({result['explanation'] for result in expected}) == len(RESUMES)
+
+    for _ in range(3):
+        assert asyncio.run(concurrent()) == expected
@@ -0,0 +1,32 @@
+import random
+import pytest
+from bestpractice.utils.chunking import chunk_spans
+
+
+@pytest.mark.parametrize('text, chunk_size, chunk_overlap', [
+    # Trailing word longer than chunk_size - chunk_overlap
+    ('xxxxxxx x xxxxxxxx xxxxxx', 11, 8),
+    # Long word in the middle of the text
+    ('xx xx xxxxxxxx xxxxxxxx', 6, 4),
+    ('x xx xx xxxxxxxxxx', 10, 5),
+])
+def test_no_span_lies_inside_the_previous_one(text, chunk_size, chunk_overlap):
+    spans = list(chunk_spans(text, chunk_size, chunk_overlap))
+
+    assert all(end > previous_end for (_, previous_end), (_, end) in zip(spans, spans[1:]))
+    assert all(start > previous_start for (previous_start, _), (start, _) in zip(spans, spans[1:]))
+
+
+def test_spans_cover_the_text_within_the_chunk_size():
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = ' '.join('x' * rng.randint(1, 12) for _ in range(rng.randint(1, 8)))
+        chunk_size = rng.randint(2, 12)
+        chunk_overlap = rng.randint(0, chunk_size - 1)
+
+        spans = list(chunk_spans(text, chunk_size, chunk_overlap))
+
+        covered = {i for start, end in spans for i in range(start, end)}
+        assert all(i in covered for i, char in enumerate(text) if char != ' ')
+        assert all(0 < end - start <= chunk_size for start, end in spans)
+        assert all(end > previous_end for (_, previous_end), (_, end) in zip(spans, spans[1:]))
@@ -0,0 +1,163 @@
+import asyncio
+import time
+import pytest
+from aiohttp import web
+from bestpractice.config import settings
+from bestpractice.services.document_parser import DocumentParser
+from bestpractice.services.http_client import http_client
+from bestpractice.services.parse_cache import ParseCache
+
+
+def test_documents_past_the_deadline_skip_remote_parsing(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PARSE_MODE', 'remote_first')
+    resume_path = tmp_path / 'resume.txt'
+    resume_path.write_text('Jane Doe\nExperience\nPython developer\n', encoding='utf-8')
+
+    parser = DocumentParser()
+    parser.api_key = 'test-key'
+    parser.parse_cache = ParseCache(memory_items=8, cache_dir='')
+
+    async def upload_file(file_content, filename):
+        raise AssertionError("a document past the deadline was uploaded")
+
+    monkeypatch.setattr(parser, '_upload_file', upload_file)
+    # A batch whose shared deadline ran out while earlier documents were parsed
+    result = asyncio.run(parser.parse_document(str(resume_path), 'resume.txt', deadline=time.monotonic() - 1))
+
+    assert 'Python developer' in result['text']
+    assert result['metadata']['source'] != 'llamaparser_markdown'
+    assert parser.get_stats()['poll']['deadline_skipped'] == 1
+
+
+def count_calls(monkeypatch, parser, name):
+    calls = []
+    original = getattr(parser, name)
+
+    def counted(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(parser, name, counted)
+    return calls
+
+
+def test_local_first_results_come_from_the_parse_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PARSE_MODE', 'local_first')
+    resume_path = tmp_path / 'resume.txt'
+    resume_path.write_text('Jane Doe\nExperience\nPython developer\n', encoding='utf-8')
+
+    parser = DocumentParser()
+    parser.api_key = None
+    parser.parse_cache = ParseCache(memory_items=8, cache_dir='')
+    extractions = count_calls(monkeypatch, parser, '_extract_and_assess')
+
+    first = asyncio.run(parser.parse_document(str(resume_path), 'resume.txt'))
+    second = asyncio.run(parser.parse_document(str(resume_path), 'resume.txt'))
+
+    assert len(extractions) == 1
+    assert second['text'] == first['text']
+    assert second['metadata']['cache'] == 'memory'
+    assert second['metadata']['quality'] == first['metadata']['quality']
+    assert parser.get_stats()['routing']['local'] == 2
+
+
+def test_gate_failure_falls_back_to_the_local_text_without_extracting_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PARSE_MODE', 'local_first')
+    resume_path = tmp_path / 'resume.txt'
+    # Too short for the quality gate
+    resume_path.write_text('Jane Doe', encoding='utf-8')
+
+    parser = DocumentParser()
+    parser.api_key = 'test-key'
+    parser.parse_cache = ParseCache(memory_items=8, cache_dir='')
+    extractions = count_calls(monkeypatch, parser, '_extract_text_locally')
+
+    async def upload_file(file_content, filename):
+        raise RuntimeError("LlamaParse is down")
+
+    monkeypatch.setattr(parser, '_upload_file', upload_file)
+    result = asyncio.run(parser.parse_document(str(resume_path), 'resume.txt'))
+
+    assert result['text'] == 'Jane Doe'
+    assert result['metadata']['quality']['passed'] is False
+    assert len(extractions) == 1
+    routing = parser.get_stats()['routing']
+    assert (routing['local'], routing['gate_failed'], routing['remote']) == (0, 1, 1)
+
+
+def test_remote_routing_counts_only_started_uploads(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PARSE_MODE', 'remote_first')
+    resume_path = tmp_path / 'resume.txt'
+    resume_path.write_text('Jane Doe\nExperience\nPython developer\n', encoding='utf-8')
+
+    parser = DocumentParser()
+    parser.parse_cache = ParseCache(memory_items=8, cache_dir='')
+
+    # Missing API key
+    parser.api_key = None
+    with pytest.raises(ValueError):
+        asyncio.run(parser.parse_document(str(resume_path), 'resume.txt'))
+
+    # Cache hit
+    parser.api_key = 'test-key'
+    cache_key = parser.parse_cache.make_key(resume_path.read_bytes(), parser._parse_options('resume.txt'))
+    asyncio.run(parser.parse_cache.put(cache_key, {'text': 'cached', 'metadata': {'source': 'llamaparser_markdown'}}))
+    assert asyncio.run(parser.parse_document(str(resume_path), 'resume.txt'))['text'] == 'cached'
+
+    assert parser.get_stats()['routing']['remote'] == 0
+
+
+@pytest.mark.parametrize('slow_call', ['upload', 'status', 'markdown'])
+def test_remote_calls_are_cut_off_at_the_deadline(tmp_path, monkeypatch, slow_call):
+    monkeypatch.setattr(settings, 'PARSE_MODE', 'remote_first')
+    resume_path = tmp_path / 'resume.txt'
+    resume_path.write_text('Jane Doe\nExperience\nPython developer\n', encoding='utf-8')
+
+    released = None
+
+    async def respond(name, payload):
+        if name == slow_call:
+            # Hangs well past the deadline but within the HTTP read timeout
+            await released.wait()
+        return web.json_response(payload)
+
+    async def upload(request):
+        return await respond('upload', {'id': 'job-1'})
+
+    async def status(request):
+        return await respond('status', {'status': 'SUCCESS'})
+
+    async def markdown(request):
+        return await respond('markdown', {'markdown': '# remote'})
+
+    app = web.Application()
+    app.router.add_post('/upload', upload)
+    app.router.add_get('/job/{job_id}', status)
+    app.router.add_get('/job/{job_id}/result/markdown', markdown)
+
+    parser = DocumentParser()
+    parser.api_key = 'test-key'
+    parser.parse_cache = ParseCache(memory_items=8, cache_dir='')
+
+    async def scenario():
+        nonlocal released
+        released = asyncio.Event()
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        parser.base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            started = time.monotonic()
+            result = await parser.parse_document(str(resume_path), 'resume.txt', deadline=started + 0.5)
+            return result, time.monotonic() - started
+        finally:
+            released.set()
+            await http_client.close()
+            await runner.cleanup()
+
+    result, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 2
+    assert 'Python developer' in result['text']
+    assert parser.get_stats()['poll']['deadline_timeouts'] == 1
@@ -0,0 +1,94 @@
+import asyncio
+import os
+from aiohttp import web
+from bestpractice.config import settings
+from bestpractice.services.document_parser import DocumentParser
+from bestpractice.services.http_client import http_client
+from bestpractice.services.parse_cache import ParseCache
+
+POOL_LIMIT = 4
+PARSES = 5 * POOL_LIMIT
+
+
+class StubLlamaParse:
+    """Local stand-in for the LlamaParse API that records connections and concurrency"""
+
+    def __init__(self):
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.client_ports = set()
+        self.app = web.Application()
+        self.app.router.add_post('/upload', self.upload)
+        self.app.router.add_get('/job/{job_id}', self.status)
+        self.app.router.add_get('/job/{job_id}/result/markdown', self.markdown)
+
+    async def _track(self, request: web.Request, payload):
+        self.requests += 1
+        self.client_ports.add(request.transport.get_extra_info('peername')[1])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Hold the connection long enough for the parses to pile up on the pool
+            await asyncio.sleep(0.02)
+            return web.json_response(payload)
+        finally:
+            self.in_flight -= 1
+
+    async def upload(self, request: web.Request):
+        form = await request.post()
+        return await self._track(request, {'id': form['file'].filename})
+
+    async def status(self, request: web.Request):
+        return await self._track(request, {'status': 'SUCCESS'})
+
+    async def markdown(self, request: web.Request):
+        return await self._track(request, {'markdown': f"# {request.match_info['job_id']}"})
+
+
+def test_concurrent_parses_share_a_bounded_connection_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'HTTP_POOL_LIMIT', POOL_LIMIT)
+    monkeypatch.setattr(settings, 'HTTP_POOL_LIMIT_PER_HOST', POOL_LIMIT)
+    monkeypatch.setattr(settings, 'PARSE_MODE', 'remote_first')
+    monkeypatch.setattr(settings, 'PARSE_POLL_JITTER', 0.0)
+
+    paths = []
+    for i in range(PARSES):
+        path = tmp_path / f"resume-{i}.pdf"
+        path.write_bytes(f"resume {i}".encode('utf-8'))
+        paths.append(str(path))
+
+    stub = StubLlamaParse()
+
+    async def scenario():
+        runner = web.AppRunner(stub.app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        parser = DocumentParser()
+        parser.api_key = 'test-key'
+        parser.base_url = f"http://127.0.0.1:{port}"
+        parser.parse_cache = ParseCache(memory_items=0, cache_dir='')
+        parser.parse_cache.enabled = False
+
+        try:
+            return await asyncio.gather(*(
+                parser.parse_document(path, os.path.basename(path))
+                for path in paths
+            ))
+        finally:
+            await http_client.close()
+            await runner.cleanup()
+
+    results = asyncio.run(scenario())
+
+    assert [result['text'] for result in results] == [f"# resume-{i}.pdf" for i in range(PARSES)]
+    assert all(result['metadata']['source'] == 'llamaparser_markdown' for result in results)
+    # Upload, status and markdown for every parse
+    assert stub.requests == 3 * PARSES
+    # The pool limit holds under a burst five times its size...
+    assert stub.max_in_flight == POOL_LIMIT
+    # ...and requests reuse the pooled keep-alive connections instead of opening one each
+    assert len(stub.client_ports) <= POOL_LIMIT
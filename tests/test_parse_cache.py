@@ -0,0 +1,72 @@
+import asyncio
+import time
+from bestpractice.services.document_parser import DocumentParser
+from bestpractice.services.parse_cache import ParseCache
+
+STALL_SECONDS = 0.3
+
+
+async def run_with_ticker(coro):
+    """Await coro while counting how often the event loop gets to run another task"""
+    ticks = 0
+    done = False
+
+    async def ticker():
+        nonlocal ticks
+        while not done:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        result = await coro
+    finally:
+        done = True
+        await ticker_task
+    return result, ticks
+
+
+def test_slow_disk_tier_does_not_block_the_event_loop(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'parse_cache')
+    key = ParseCache.make_key(b'resume bytes', {'parser': 'llamaparse'})
+    value = {'text': 'Jane Doe', 'metadata': {'source': 'llamaparser'}}
+
+    async def scenario():
+        writer = ParseCache(memory_items=8, cache_dir=cache_dir, max_disk_bytes=1 << 20, ttl_seconds=0)
+        await writer.put(key, value)
+
+        # A fresh instance has an empty memory tier, so the lookup goes to a (stalled) disk
+        reader = ParseCache(memory_items=8, cache_dir=cache_dir, max_disk_bytes=1 << 20, ttl_seconds=0)
+        read_disk = reader._read_disk
+
+        def slow_read_disk(cache_key):
+            time.sleep(STALL_SECONDS)
+            return read_disk(cache_key)
+
+        monkeypatch.setattr(reader, '_read_disk', slow_read_disk)
+        return await run_with_ticker(reader.get(key))
+
+    result, ticks = asyncio.run(scenario())
+
+    assert result['text'] == 'Jane Doe'
+    assert result['metadata']['cache'] == 'disk'
+    assert ticks >= 10
+
+
+def test_cache_key_is_computed_off_the_event_loop(tmp_path, monkeypatch):
+    resume_path = tmp_path / 'resume.txt'
+    resume_path.write_text('Jane Doe\nExperience\nPython developer\n', encoding='utf-8')
+
+    parser = DocumentParser()
+    parser.parse_cache = ParseCache(memory_items=8, cache_dir=str(tmp_path / 'parse_cache'), max_disk_bytes=1 << 20, ttl_seconds=0)
+    read_source = DocumentParser._read_source
+
+    def slow_read_source(source):
+        time.sleep(STALL_SECONDS)
+        return read_source(source)
+
+    monkeypatch.setattr(DocumentParser, '_read_source', staticmethod(slow_read_source))
+    result, ticks = asyncio.run(run_with_ticker(parser._fallback_text_extraction(str(resume_path), 'resume.txt')))
+
+    assert 'Python developer' in result['text']
+    assert ticks >= 10
@@ -0,0 +1,30 @@
+from bestpractice.models.document import ParsedDocument
+from bestpractice.utils.segmentation import RESUME_SECTION_HEADERS, lower_text_with_offsets, segment_sections
+
+RESUME = (
+    "Ayşe Yılmaz, İstanbul. İİİ Software engineer with eight years of backend work. "
+    "Skills: Python, Docker, Kubernetes, PostgreSQL and AWS infrastructure automation. "
+    "Education: BSc Computer Engineering, Boğaziçi University, 2015."
+)
+
+
+def test_lower_text_keeps_offsets():
+    lower_text = lower_text_with_offsets(RESUME)
+    assert len(lower_text) == len(RESUME)
+    assert lower_text.index('skills') == RESUME.index('Skills')
+
+
+def test_section_spans_after_non_ascii_title_case():
+    spans = segment_sections(RESUME, RESUME_SECTION_HEADERS)
+    starts = {section: start for section, start, _ in spans}
+    assert starts['skills'] == RESUME.index('Skills')
+    assert starts['education'] == RESUME.index('Education')
+
+
+def test_section_text_after_non_ascii_title_case():
+    document = ParsedDocument(RESUME, 'resume')
+    skills = document.section_text('skills')
+    assert skills.startswith('Skills: Python')
+    assert skills.rstrip().endswith('automation.')
+    assert document.section_text('skills', lower=True) == skills.lower()
+    assert document.section_text('education').startswith('Education: BSc')
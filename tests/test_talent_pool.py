@@ -0,0 +1,56 @@
+import numpy as np
+from bestpractice.services import talent_pool as talent_pool_module
+from bestpractice.services.talent_pool import TalentPool
+
+DIMENSION = 8
+
+
+def add_candidate(pool: TalentPool, candidate_id: str, rows: int, seed: int):
+    embeddings = np.random.default_rng(seed).random((rows, DIMENSION), dtype=np.float32)
+    pool.add_resume(candidate_id, [f"{candidate_id} chunk {i}" for i in range(rows)], embeddings)
+
+
+def open_pool(path) -> TalentPool:
+    pool = TalentPool(str(path), DIMENSION, mmap=True)
+    pool.flush_rows = 0
+    pool.open()
+    return pool
+
+
+def test_compact_keeps_segments_flushed_by_another_process(tmp_path):
+    pool = open_pool(tmp_path)
+    add_candidate(pool, 'alice', 5, seed=0)
+    pool.flush()
+    add_candidate(pool, 'bob', 5, seed=1)
+    pool.flush()
+
+    # Another worker flushes after this pool last opened the manifest
+    other = open_pool(tmp_path)
+    add_candidate(other, 'carol', 7, seed=2)
+    other.flush()
+    assert pool.get_stats()['segments'] == 2
+
+    pool.compact()
+
+    reopened = open_pool(tmp_path)
+    assert reopened.get_stats()['segments'] == 1
+    assert reopened.ntotal == 17
+    candidates = {reopened.get_row(row_id)[1]['candidate_id'] for row_id in range(reopened.ntotal)}
+    assert candidates == {'alice', 'bob', 'carol'}
+    assert pool.ntotal == 17
+
+
+def test_pool_works_without_fcntl(tmp_path, monkeypatch):
+    # Windows has no fcntl; a single process must still be able to flush and compact
+    monkeypatch.setattr(talent_pool_module, 'fcntl', None)
+    pool = open_pool(tmp_path)
+    add_candidate(pool, 'alice', 3, seed=0)
+    pool.flush()
+    add_candidate(pool, 'bob', 4, seed=1)
+    pool.flush()
+
+    pool.compact()
+
+    reopened = open_pool(tmp_path)
+    assert reopened.get_stats()['segments'] == 1
+    assert reopened.ntotal == 7
@@ -0,0 +1,104 @@
+import asyncio
+import re
+import time
+import pytest
+from bestpractice.config import settings
+from bestpractice.models.document import ParsedDocument
+from bestpractice.services.llm_evaluator import LLMEvaluator
+from bestpractice.utils import text_processing as text_processing_module
+from bestpractice.utils.execution import ExecutionPool
+from bestpractice.utils.regex_registry import regex_registry
+from bestpractice.utils.text_processing import TextProcessor
+
+RESUME = """Jane Doe
+Education
+Bachelor of Science in Computer Science, 2015
+Experience
+Software Engineer at Acme Corp, 2016 - present
+Skills
+Python, SQL, Docker
+"""
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    pool = ExecutionPool(thread_workers=2, process_workers=1)
+    monkeypatch.setattr(text_processing_module, 'execution_pool', pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_process_pool_results_carry_views_and_regex_stats_back(process_pool):
+    document = ParsedDocument(RESUME, 'resume')
+    degree_calls = regex_registry.get('education.degree.0').calls
+
+    profile = asyncio.run(TextProcessor().extract_candidate_profile(document))
+
+    assert profile['education']
+    assert process_pool.get_stats()['stages']['extract_candidate_profile']['executor'] == 'process'
+    # Views memoized in the worker are adopted by the parent's document
+    assert set(document.computed_views()) >= {'_cleaned_text', '_lower_text', '_section_spans'}
+    assert document.section_spans == ParsedDocument(RESUME, 'resume').section_spans
+    # Pattern timings recorded in the worker show up in this process's registry
+    assert regex_registry.get('education.degree.0').calls == degree_calls + 1
+
+
+def test_adopt_views_keeps_views_already_computed():
+    document = ParsedDocument(RESUME, 'resume')
+    cleaned_text = document.cleaned_text
+
+    document.adopt_views({'_cleaned_text': 'other', '_word_offsets': [(0, 4)], 'text': 'ignored'})
+
+    assert document.cleaned_text is cleaned_text
+    assert document.word_offsets == [(0, 4)]
+    assert document.text == RESUME
+
+
+# Long unbroken text that made the uncapped company and project patterns backtrack quadratically
+ADVERSARIAL_RESUME = "Widget Builder - " * 2000
+
+
+def test_adversarial_resume_finishes_within_the_default_regex_budget(monkeypatch):
+    # Budget checks off, so only the bounded quantifiers keep this fast (about 30 s uncapped)
+    monkeypatch.setattr(settings, 'REGEX_TIME_BUDGET_SECONDS', 0)
+
+    started = time.perf_counter()
+    profile = asyncio.run(TextProcessor().extract_candidate_profile(ADVERSARIAL_RESUME))
+    elapsed = time.perf_counter() - started
+
+    assert set(profile) == {'education', 'skills', 'experience', 'certifications', 'projects'}
+    assert elapsed < 2.0
+
+
+def test_spent_regex_budget_skips_the_remaining_extractors(monkeypatch):
+    monkeypatch.setattr(settings, 'REGEX_TIME_BUDGET_SECONDS', 1e-9)
+    skipped = sum(item['skipped'] for item in regex_registry.get_stats())
+
+    started = time.perf_counter()
+    profile = asyncio.run(TextProcessor().extract_candidate_profile(ADVERSARIAL_RESUME))
+
+    assert time.perf_counter() - started < 2.0
+    assert profile == {'education': [], 'skills': [], 'experience': [], 'certifications': [], 'projects': []}
+    assert sum(item['skipped'] for item in regex_registry.get_stats()) > skipped
+
+
+def test_extraction_only_runs_precompiled_registry_patterns(monkeypatch):
+    processor = TextProcessor()
+    job_description = "Requirements\n5+ years of experience with Python\nKnowledge of Kubernetes and SQL\n"
+    expected_profile = processor._extract_candidate_profile(RESUME)
+    expected_requirements = LLMEvaluator()._extract_requirements_fallback(job_description)
+    before = {item['name']: item['calls'] for item in regex_registry.get_stats()}
+
+    def no_module_level_regex(*args, **kwargs):
+        raise AssertionError("pattern compiled or run outside regex_registry")
+
+    for name in ('compile', 'search', 'match', 'fullmatch', 'findall', 'finditer', 'sub', 'subn', 'split'):
+        monkeypatch.setattr(re, name, no_module_level_regex)
+
+    assert processor._extract_candidate_profile(RESUME) == expected_profile
+    assert LLMEvaluator()._extract_requirements_fallback(job_description) == expected_requirements
+
+    # Every extractor's patterns are timed
+    after = {item['name']: item['calls'] for item in regex_registry.get_stats()}
+    ran = {name.rsplit('.', 1)[0] for name, calls in after.items() if calls > before.get(name, 0)}
+    assert {'education.degree', 'skills.phrase', 'experience.job_title', 'experience.company', 'projects.description'} <= ran
@@ -0,0 +1,46 @@
+import pytest
+from fastapi.testclient import TestClient
+from bestpractice.config import settings
+from bestpractice.main import app
+
+BOUNDARY = 'testboundary'
+
+
+def multipart_chunks(resume_size: int, chunk_size: int = 64 * 1024):
+    """Multipart body for /evaluate-candidate, streamed without a Content-Length"""
+    head = (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="job_description_file"; filename="jd.txt"\r\n'
+        f'Content-Type: text/plain\r\n\r\nRequirements: Python\r\n'
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="resume_file"; filename="resume.txt"\r\n'
+        f'Content-Type: text/plain\r\n\r\n'
+    ).encode('utf-8')
+    yield head
+    for start in range(0, resume_size, chunk_size):
+        yield b'x' * min(chunk_size, resume_size - start)
+    yield f'\r\n--{BOUNDARY}--\r\n'.encode('utf-8')
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, 'MAX_REQUEST_SIZE', 256 * 1024)
+    return TestClient(app)
+
+
+def test_chunked_upload_over_request_limit_gets_413(client):
+    response = client.post(
+        '/evaluate-candidate',
+        content=multipart_chunks(1024 * 1024),
+        headers={'Content-Type': f'multipart/form-data; boundary={BOUNDARY}'}
+    )
+    assert 'content-length' not in response.request.headers
+    assert response.status_code == 413
+    assert response.json() == {'detail': 'Request body exceeds the 262144 byte limit'}
+
+
+def test_declared_content_length_over_request_limit_gets_413(client):
+    response = client.post(
+        '/evaluate-candidate',
+        content=b''.join(multipart_chunks(1024 * 1024)),
+        headers={'Content-Type': f'multipart/form-data; boundary={BOUNDARY}'}
+    )
+    assert response.status_code == 413
@@ -0,0 +1,77 @@
+import time
+import numpy as np
+import pytest
+from bestpractice.services.vector_store import VectorStore
+
+DIMENSION = 32
+ROWS = 20000
+QUERIES = 200
+K = 10
+
+
+def clustered_vectors(rng, centers: np.ndarray, rows: int) -> np.ndarray:
+    labels = rng.integers(0, len(centers), size=rows)
+    return centers[labels] + 0.3 * rng.standard_normal((rows, DIMENSION)).astype(np.float32)
+
+
+def build_store(vectors: np.ndarray) -> VectorStore:
+    store = VectorStore(dimension=DIMENSION)
+    store.add_documents(
+        [f"row {i}" for i in range(len(vectors))],
+        vectors,
+        [{'type': 'resume' if i % 2 else 'job_description'} for i in range(len(vectors))]
+    )
+    return store
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((64, DIMENSION)).astype(np.float32)
+    vectors = clustered_vectors(rng, centers, ROWS)
+    queries = clustered_vectors(rng, centers, QUERIES)
+    flat = build_store(vectors)
+    return vectors, queries, flat
+
+
+def recall(found: np.ndarray, exact: np.ndarray) -> float:
+    return float(np.mean([len(set(f[f >= 0]) & set(e)) / len(e) for f, e in zip(found, exact)]))
+
+
+# IVF-PQ codes are lossy, so its check is how much of the true top 10 lands in its top 100
+@pytest.mark.parametrize('index_type, search_k, min_recall', [
+    ('ivf_flat', K, 0.95),
+    ('hnsw', K, 0.95),
+    ('ivf_pq', 10 * K, 0.6)
+])
+def test_approximate_index_recall_and_latency_against_flat(corpus, index_type, search_k, min_recall):
+    vectors, queries, flat = corpus
+    _, exact_ids = flat.search_batch(queries, k=K)
+    started = time.perf_counter()
+    flat.search_batch(queries, k=K)
+    flat_seconds = time.perf_counter() - started
+
+    store = build_store(vectors)
+    store.reindex(index_type)
+    assert store.index_type == index_type
+
+    started = time.perf_counter()
+    _, ids = store.search_batch(queries, k=search_k)
+    seconds = time.perf_counter() - started
+
+    print(f"{index_type}: {K}-recall@{search_k}={recall(ids, exact_ids):.3f} "
+          f"{seconds / QUERIES * 1000:.3f} ms/query (flat {flat_seconds / QUERIES * 1000:.3f} ms/query)")
+    assert recall(ids, exact_ids) >= min_recall
+
+
+@pytest.mark.parametrize('index_type', ['ivf_flat', 'hnsw'])
+def test_filtered_search_on_approximate_index_matches_flat(corpus, index_type):
+    vectors, queries, flat = corpus
+    _, exact_ids = flat.search_batch(queries, k=K, filters={'type': 'resume'})
+
+    store = build_store(vectors)
+    store.reindex(index_type)
+    _, ids = store.search_batch(queries, k=K, filters={'type': 'resume'})
+
+    assert np.all(ids % 2 == 1)
+    assert recall(ids, exact_ids) >= 0.9